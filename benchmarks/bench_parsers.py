@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmark for scrape_zeiler.py
+Measures pages per second for every HTML parser backend on saved page fixtures
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from scrape_zeiler import ZeilerScraper, available_parsers
+
+BASE_URL = 'https://www.zeiler.me'
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixtures(directory):
+    """Load saved pages as (url, html) pairs
+
+    Fixture names are URL paths with '/' replaced by '__', which is how
+    'scrape_zeiler.py --save-html DIR' records them.
+    """
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(directory, '*.html'))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        url = f"{BASE_URL}/{name.replace('__', '/')}" if name != 'index' else BASE_URL
+        with open(path, 'rb') as f:
+            fixtures.append((url, f.read()))
+    return fixtures
+
+
+def run_pages(scraper, fixtures):
+    """Parse and extract every fixture once; image downloads are left out"""
+    for url, html in fixtures:
+        soup = scraper.parse_document(html)
+        scraper.extract_metadata(soup, url)
+        scraper.find_article_links(soup, url)
+        scraper.extract_content(soup)
+        soup.find_all('img')
+
+
+def bench(parser, selective, fixtures, rounds):
+    scraper = ZeilerScraper(base_url=BASE_URL, parser=parser, selective=selective)
+
+    # Warm-up round so imports and regex compilation are not measured
+    run_pages(scraper, fixtures)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        run_pages(scraper, fixtures)
+    elapsed = time.perf_counter() - start
+
+    pages = len(fixtures) * rounds
+    return pages / elapsed, elapsed / pages * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HTML parser backends on saved pages')
+    parser.add_argument('--fixtures', default=FIXTURES_DIR,
+                        help='Directory with saved .html pages')
+    parser.add_argument('--rounds', type=int, default=20,
+                        help='How often every fixture is processed')
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        print(f"No fixtures found in {args.fixtures}")
+        sys.exit(1)
+
+    total_kb = sum(len(html) for _, html in fixtures) / 1024
+    print(f"{len(fixtures)} fixtures ({total_kb:.0f} KiB), {args.rounds} rounds\n")
+    print(f"{'parser':<12} {'mode':<10} {'pages/s':>10} {'ms/page':>10}")
+
+    for backend in available_parsers():
+        for selective in (False, True):
+            pages_per_second, ms_per_page = bench(backend, selective, fixtures, args.rounds)
+            mode = 'selective' if selective else 'full'
+            print(f"{backend:<12} {mode:<10} {pages_per_second:>10.1f} {ms_per_page:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark for scrape_zeiler.py and integrate_content.py
+Measures crawl, parse, cleaning and integration throughput offline and records the results as JSON
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..'))
+
+from bench_parsers import FIXTURES_DIR, load_fixtures, run_pages
+from integrate_content import clean_content, generate_excerpt, get_content_cleaner, process_scraped_articles
+from scrape_zeiler import CrawlMetrics, HttpClient, ZeilerScraper, available_parsers, percentile
+from synthetic_site import generate_records, generate_site, serve
+
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, 'results')
+SECTIONS = ['crawl', 'parse', 'cleaning', 'integration']
+MIB = 1024 * 1024
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the progress output of the measured code"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def bench_crawl(args):
+    """End-to-end crawl of a synthetic site served from localhost"""
+    with tempfile.TemporaryDirectory() as workdir:
+        site = os.path.join(workdir, 'site')
+        generate_site(site, pages=args.pages)
+
+        with serve(site) as base_url, working_directory(workdir), quiet():
+            http = HttpClient(pool_size=args.crawl_workers)
+            scraper = ZeilerScraper(base_url=base_url, http=http, metrics=CrawlMetrics())
+            start = time.perf_counter()
+            articles = asyncio.run(scraper.scrape_website_async(
+                max_pages=args.pages, workers=args.crawl_workers,
+                max_in_flight=args.crawl_workers, rate=10000.0))
+            elapsed = time.perf_counter() - start
+
+    metrics = scraper.metrics
+    result = {
+        'pages': metrics.totals['pages'],
+        'articles': len(articles),
+        'images': metrics.totals['images'],
+        'seconds': elapsed,
+        'pages_per_second': metrics.totals['pages'] / elapsed,
+        'mib_per_second': (metrics.totals['bytes'] + metrics.totals['image_bytes']) / MIB / elapsed,
+    }
+    for stage, samples in sorted(metrics.samples.items()):
+        result[f'{stage}_p50_ms'] = percentile(sorted(samples), 50) * 1000
+    return result
+
+
+def bench_parse(args):
+    """Parse and extraction cost per page on the recorded fixtures"""
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        return {}
+    scraper = ZeilerScraper(base_url='https://www.zeiler.me', parser=available_parsers()[0])
+    run_pages(scraper, fixtures)
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        run_pages(scraper, fixtures)
+    elapsed = time.perf_counter() - start
+
+    pages = len(fixtures) * args.rounds
+    size = sum(len(html) for _, html in fixtures) * args.rounds
+    return {
+        'parser': scraper.parser,
+        'pages': pages,
+        'ms_per_page': elapsed / pages * 1000,
+        'mib_per_second': size / MIB / elapsed,
+    }
+
+
+def bench_cleaning(args):
+    """clean_content and generate_excerpt throughput in MiB of raw content"""
+    contents = [record['content'] for record in generate_records(1000, words=600)]
+    size = sum(len(content.encode('utf-8')) for content in contents)
+    clean_content(contents[0])
+
+    start = time.perf_counter()
+    cleaned = [clean_content(content) for content in contents]
+    clean_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for content in cleaned:
+        generate_excerpt(content)
+    excerpt_seconds = time.perf_counter() - start
+
+    return {
+        'mib': size / MIB,
+        'clean_mib_per_second': size / MIB / clean_seconds,
+        'excerpt_mib_per_second': size / MIB / excerpt_seconds,
+    }
+
+
+def bench_integration(args):
+    """process_scraped_articles at several corpus sizes, serial and in a process pool"""
+    get_content_cleaner()
+    result = {}
+    for size in args.sizes:
+        records = generate_records(size)
+        for workers in sorted({1, args.workers}):
+            with quiet():
+                start = time.perf_counter()
+                processed = process_scraped_articles(records, workers=workers)
+                elapsed = time.perf_counter() - start
+            result[f'{size}_w{workers}_seconds'] = elapsed
+            result[f'{size}_w{workers}_articles_per_second'] = len(processed) / elapsed
+    return result
+
+
+BENCHES = {
+    'crawl': bench_crawl,
+    'parse': bench_parse,
+    'cleaning': bench_cleaning,
+    'integration': bench_integration,
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARKS_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results, baseline=None):
+    """Print every metric, with the change against a baseline run if given"""
+    for section, metrics in results.items():
+        print(f"\n[{section}]")
+        for name, value in metrics.items():
+            line = f"  {name:<36} {value:>12.3f}" if isinstance(value, float) else f"  {name:<36} {value!s:>12}"
+            previous = (baseline or {}).get(section, {}).get(name)
+            if isinstance(value, (int, float)) and isinstance(previous, (int, float)) and previous:
+                line += f"  {(value - previous) / previous * 100:+7.1f}%"
+            print(line)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the scrape and integration pipeline offline')
+    parser.add_argument('--sections', nargs='+', choices=SECTIONS, default=SECTIONS,
+                        help='Benchmarks to run (default: all)')
+    parser.add_argument('--pages', type=int, default=200,
+                        help='Articles on the synthetic site for the crawl benchmark')
+    parser.add_argument('--crawl-workers', type=int, default=8,
+                        help='Concurrent crawl workers against the local server')
+    parser.add_argument('--fixtures', default=FIXTURES_DIR,
+                        help='Directory with saved .html pages for the parse benchmark')
+    parser.add_argument('--rounds', type=int, default=20,
+                        help='How often every fixture is parsed')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                        help='Article counts for the integration benchmark')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for the parallel integration run')
+    parser.add_argument('--output', default=None,
+                        help='Results file (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--baseline', default=None,
+                        help='Earlier results file to compare against')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    for section in args.sections:
+        print(f"Running {section} benchmark...")
+        results[section] = BENCHES[section](args)
+
+    print_results(results, baseline)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+        'results': results,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved results to {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Synthetic Site for the zeiler.me benchmarks
+Generates Google-Sites-like pages and scraped records, and serves page fixtures over local HTTP
+"""
+
+import contextlib
+import os
+import random
+import struct
+import threading
+import zlib
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+BASE_URL = 'https://www.zeiler.me'
+SECTIONS = ['detlef/geschichte', 'detlef/deutsch', 'detlef/medien', 'detlef/selfmade', 'julian/techzap']
+WORDS = ('Geschichte Heidelberg Mittelalter Reformation Kurpfalz Goethe Ballade Interpretation Schule '
+         'Unterricht Medien Erziehung Digitalisierung Gesellschaft Politik Demokratie Freiheit Sprache '
+         'Literatur Gedicht Roman Epoche Aufklärung Romantik Bürger Stadt Universität Kirche König Kaiser '
+         'Revolution Jahrhundert Server Linux Netzwerk Programmierung Anwendung Daten Sicherheit Größe '
+         'Straße Übung Prüfung Lösung Beispiel Aufgabe Ergebnis Entwicklung Bedeutung Wirkung').split()
+FILLER = 'der die das und ist ein eine mit von zu im auf für nicht sich auch als'.split()
+# Boilerplate that integrate_content.clean_content strips from scraped pages
+HEADER = ('Search this site Embedded Files Skip to main content Skip to navigation '
+          'Startseite Detlef Zeiler Deutsch Geschichte Medien Julian Zeiler TechZap Selfmade ')
+FOOTER = ' Copyright © 2019 - 2024 Detlef und Julian Zeiler Google Sites Report abuse Page details'
+
+
+def sentence(rng, words=WORDS):
+    """A German-looking sentence of 8 to 20 words"""
+    text = ' '.join(rng.choice(words) if rng.random() < 0.6 else rng.choice(FILLER)
+                    for _ in range(rng.randint(8, 20)))
+    return text[0].upper() + text[1:] + '.'
+
+
+def paragraphs(rng, count, words=WORDS):
+    return [' '.join(sentence(rng, words) for _ in range(rng.randint(3, 6))) for _ in range(count)]
+
+
+def png_image(rng, width=64, height=48):
+    """A small valid PNG with random pixels"""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    rows = b''.join(b'\x00' + rng.randbytes(width * 3) for _ in range(height))
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(rows))
+            + chunk(b'IEND', b''))
+
+
+def render_page(title, body, nav_links, ballast):
+    """Page markup in the shape of the Google Sites export"""
+    nav = ''.join(f'<li class="VsJjtf"><a class="aJHbb" href="{BASE_URL}/{path}">{label}</a></li>'
+                  for path, label in nav_links)
+    return (f'<!DOCTYPE html><html lang="de"><head><meta charset="utf-8">'
+            f'<title>ZEILER.me - {title}</title><style>{ballast}</style></head>\n'
+            f'<body><header><a href="#h.main">Skip to main content</a><a href="#h.nav">Skip to navigation</a>'
+            f'<div class="search">Search this site</div><nav><ul class="jYxBte">{nav}</ul></nav></header>\n'
+            f'<div role="main" class="UtePc"><section class="yaqOZd"><h1>{title}</h1>{body}</section></div>\n'
+            f'<footer>Copyright © 2019 - 2024 Detlef und Julian Zeiler Google Sites Report abuse</footer>'
+            f'</body></html>')
+
+
+def write_fixture(directory, path, data):
+    with open(os.path.join(directory, path.replace('/', '__')), 'wb') as f:
+        f.write(data)
+
+
+def generate_site(directory, pages=200, seed=0, ballast_kb=40):
+    """Write a site of `pages` articles below section hubs as flat fixtures
+
+    The layout matches benchmarks/fixtures: '/' in the URL path becomes
+    '__' in the file name, and the start page is index.html. Every article
+    links to its section hub and embeds one PNG; ballast_kb of inline CSS
+    stands in for the scripts and styles Google Sites ships with every page.
+    Returns the number of files written.
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    ballast = ''.join(f'.c{i}{{margin:{i % 17}px;color:#{i % 4096:03x}}}' for i in range(ballast_kb * 40))
+    hubs = [(section, section.split('/')[-1].title()) for section in SECTIONS]
+    articles = {section: [] for section in SECTIONS}
+
+    for number in range(pages):
+        section = SECTIONS[number % len(SECTIONS)]
+        title = f"{' '.join(rng.sample(WORDS, 3))} {number + 1}"
+        path = f"{section}/artikel-{number + 1:05d}"
+        image = f"bilder/bild-{number + 1:05d}.png"
+        body = ''.join(f'<div class="tyJCtd"><p>{text}</p></div>' for text in paragraphs(rng, rng.randint(4, 10)))
+        body += f'<div class="t3iYD"><img src="{BASE_URL}/{image}" alt="Bild zu {title}"></div>'
+        write_fixture(directory, f"{path}.html", render_page(title, body, hubs, ballast).encode('utf-8'))
+        write_fixture(directory, image, png_image(rng))
+        articles[section].append((path, title))
+
+    for section, label in hubs:
+        body = f'<p>{sentence(rng)}</p>'
+        write_fixture(directory, f"{section}.html",
+                      render_page(label, body, hubs + articles[section], ballast).encode('utf-8'))
+
+    write_fixture(directory, 'index.html', render_page('Startseite', f'<p>{sentence(rng)}</p>', hubs,
+                                                        ballast).encode('utf-8'))
+    return 2 * pages + len(hubs) + 1
+
+
+def generate_records(count, seed=0, words=400):
+    """Scraped-record dicts as scrape_zeiler.py writes them, boilerplate included"""
+    rng = random.Random(seed)
+    records = []
+    for number in range(count):
+        section = SECTIONS[number % len(SECTIONS)]
+        text = ' '.join(sentence(rng) for _ in range(max(1, words // 14)))
+        records.append({
+            'id': number + 1,
+            'url': f"{BASE_URL}/{section}/artikel-{number + 1:05d}",
+            'title': f"ZEILER.me - {' '.join(rng.sample(WORDS, 3))} {number + 1}",
+            'content': HEADER + text + FOOTER,
+            'author': 'Detlef Zeiler' if section.startswith('detlef') else 'Julian Zeiler',
+            'category': section.split('/')[-1],
+            'images': [],
+            'word_count': len(text.split()),
+            'reading_time': max(1, round(len(text.split()) / 200)),
+        })
+    return records
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Serves flat fixtures by URL path; links to BASE_URL point back to this server"""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are separate writes; with Nagle every keep-alive response waits for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0].strip('/')
+        candidates = [f"{path.replace('/', '__')}.html", path.replace('/', '__')] if path else ['index.html']
+        for name in candidates:
+            filename = os.path.join(self.server.directory, name)
+            if os.path.isfile(filename):
+                break
+        else:
+            self.send_error(404)
+            return
+
+        with open(filename, 'rb') as f:
+            data = f.read()
+        if name.endswith('.html'):
+            data = data.replace(BASE_URL.encode(), self.server.base_url.encode())
+            content_type = 'text/html; charset=utf-8'
+        else:
+            content_type = self.guess_type(filename)
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serve(directory):
+    """Serve a fixture directory on a free local port; yields the base URL"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    server.daemon_threads = True
+    server.directory = directory
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.base_url
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -4,15 +4,95 @@ Content Integration Script for Zeiler Redesign
 Processes scraped content and generates React-compatible data files
 """
 
+import argparse
+import base64
+import glob
+import gzip
+import hashlib
+import heapq
+import html
+import itertools
 import json
+import math
 import os
 import re
+import shutil
+import struct
+import subprocess
+import tempfile
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-def load_scraped_data():
-    """Load scraped data from JSON file"""
+from near_duplicates import NearDuplicateIndex, simhash
+
+# Optional: vectorized similarity for large corpora
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = sparse = None
+
+# Optional: .br variants next to the .gz ones for --precompress
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Optional: responsive image variants for --optimize-images
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = ImageOps = None
+
+def iter_scraped_records(filename='scraped_data.ndjson', follow=False, poll_interval=1.0):
+    """Yield scraped articles one at a time from a newline-delimited JSON file
+    
+    Memory use does not grow with the corpus. With follow=True the reader
+    waits for new lines until the scraper writes its end marker, so articles
+    can be integrated while the crawl is still running.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        partial = ''
+        while True:
+            line = f.readline()
+            if not line:
+                if not follow:
+                    break
+                time.sleep(poll_interval)
+                continue
+            
+            # The scraper may be halfway through writing this line
+            if follow and not line.endswith('\n'):
+                partial += line
+                continue
+            
+            line, partial = partial + line, ''
+            if not line.strip():
+                continue
+            
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"⚠️  Stopping at truncated record in {filename}: {e}")
+                break
+            
+            if record.get('_end'):
+                break
+            yield record
+
+def load_scraped_data(filename='scraped_data.json', follow=False):
+    """Load scraped data from JSON file, or stream it from an NDJSON file"""
+    if filename.endswith('.ndjson'):
+        if not os.path.exists(filename):
+            print("⚠️  No scraped data found. Run 'python3 scrape_zeiler.py' first.")
+            return []
+        return iter_scraped_records(filename, follow=follow)
+    
     try:
-        with open('scraped_data.json', 'r', encoding='utf-8') as f:
+        with open(filename, 'r', encoding='utf-8') as f:
             return json.load(f)
     except FileNotFoundError:
         print("⚠️  No scraped data found. Run 'python3 scrape_zeiler.py' first.")
@@ -38,31 +118,189 @@ def clean_title(title):
     
     return cleaned.strip() or 'Unbekannter Titel'
 
+BOILERPLATE_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'boilerplate_rules.json')
+RULE_FLAGS = re.DOTALL | re.IGNORECASE
+
+# Whitespace cleanup; only needed when the content still has line breaks
+MULTIPLE_LINE_BREAKS = re.compile(r'\n\s*\n\s*\n')
+LINE_EDGE_WHITESPACE = re.compile(r'^\s+|\s+$', re.MULTILINE)
+
+class ContentCleaner:
+    """Precompiled boilerplate removal for scraped Google Sites pages
+    
+    Rules are declared as data (see boilerplate_rules.json) and compiled
+    once. Prefix and suffix rules are only tried at the start and end of the
+    text. All remove and truncate rules are merged into one alternation and
+    applied in a single scan. A rule's optional trigger (the literal text
+    every match starts with) lets the cleaner skip rules that cannot match
+    and start the scan at the first possible position. Hit counts and time
+    spent are kept per rule.
+    """
+    
+    def __init__(self, rules):
+        self.prefix_rules = []
+        self.suffix_rules = []
+        self.body_rules = []
+        self.body_patterns = {}
+        
+        for rule in rules:
+            mode = rule.get('mode', 'remove')
+            trigger = rule.get('trigger', '').lower()
+            if mode == 'prefix':
+                self.prefix_rules.append((rule['name'], re.compile(rule['pattern'], RULE_FLAGS)))
+            elif mode == 'suffix':
+                pattern = re.compile(f"(?:{rule['pattern']})\\s*\\Z", RULE_FLAGS)
+                self.suffix_rules.append((rule['name'], pattern, trigger))
+            elif mode in ('remove', 'truncate'):
+                self.body_rules.append({
+                    'group': f"rule{len(self.body_rules)}",
+                    'name': rule['name'],
+                    'pattern': rule['pattern'],
+                    'truncate': mode == 'truncate',
+                    'trigger': trigger
+                })
+            else:
+                raise ValueError(f"Unknown mode '{mode}' for boilerplate rule {rule['name']}")
+        
+        # Compile everything up front; the cache then only grows by rule subsets
+        self._body_pattern(self.body_rules)
+        self.rules_by_group = {rule['group']: rule for rule in self.body_rules}
+        self.stats = {rule['name']: {'hits': 0, 'seconds': 0.0} for rule in rules}
+        self.body_seconds = 0.0
+        self.calls = 0
+    
+    @classmethod
+    def from_file(cls, filename=BOILERPLATE_RULES_FILE):
+        with open(filename, 'r', encoding='utf-8') as f:
+            return cls(json.load(f)['rules'])
+    
+    def _body_pattern(self, rules):
+        """Combined alternation for a set of remove/truncate rules"""
+        key = tuple(rule['group'] for rule in rules)
+        if key not in self.body_patterns:
+            alternation = '|'.join(f"(?P<{rule['group']}>{rule['pattern']})" for rule in rules)
+            triggers = [rule['trigger'] for rule in rules]
+            if triggers and all(triggers):
+                # Only try the alternation where one of the rules can start
+                first_chars = ''.join(sorted({trigger[0] for trigger in triggers}))
+                alternation = f"(?=[{re.escape(first_chars)}])(?:{alternation})"
+            self.body_patterns[key] = re.compile(alternation, RULE_FLAGS)
+        return self.body_patterns[key]
+    
+    def _apply_body_rules(self, text):
+        """Remove and truncate in one scan over the text"""
+        lowered = text.lower()
+        rules = [rule for rule in self.body_rules if not rule['trigger'] or rule['trigger'] in lowered]
+        if not rules:
+            return text
+        
+        # Nothing before the first trigger can match; positions only carry over
+        # if lowercasing did not change the length of the text
+        position = 0
+        if all(rule['trigger'] for rule in rules) and len(lowered) == len(text):
+            position = min(lowered.find(rule['trigger']) for rule in rules)
+        
+        pieces = [text[:position]]
+        for match in self._body_pattern(rules).finditer(text, position):
+            rule = self.rules_by_group[match.lastgroup]
+            self.stats[rule['name']]['hits'] += 1
+            pieces.append(text[position:match.start()])
+            position = match.end()
+            if rule['truncate']:
+                position = len(text)
+                break
+        
+        pieces.append(text[position:])
+        return ''.join(pieces)
+    
+    def _apply_suffix_rule(self, text, pattern, trigger):
+        if not trigger:
+            return pattern.search(text)
+        
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            return pattern.search(text)
+        
+        position = lowered.find(trigger)
+        while position != -1:
+            match = pattern.match(text, position)
+            if match:
+                return match
+            position = lowered.find(trigger, position + 1)
+        return None
+    
+    def clean(self, content):
+        self.calls += 1
+        
+        for name, pattern in self.prefix_rules:
+            start = time.perf_counter()
+            match = pattern.match(content)
+            if match:
+                content = content[match.end():]
+                self.stats[name]['hits'] += 1
+            self.stats[name]['seconds'] += time.perf_counter() - start
+        
+        if self.body_rules:
+            start = time.perf_counter()
+            content = self._apply_body_rules(content)
+            self.body_seconds += time.perf_counter() - start
+        
+        for name, pattern, trigger in self.suffix_rules:
+            start = time.perf_counter()
+            match = self._apply_suffix_rule(content, pattern, trigger)
+            if match:
+                content = content[:match.start()]
+                self.stats[name]['hits'] += 1
+            self.stats[name]['seconds'] += time.perf_counter() - start
+        
+        # Clean whitespace but preserve paragraph structure
+        if '\n' in content:
+            content = MULTIPLE_LINE_BREAKS.sub('\n\n', content)  # Multiple line breaks to double
+            content = LINE_EDGE_WHITESPACE.sub('', content)  # Whitespace at line start/end
+        
+        return content.strip()
+    
+    def take_stats(self):
+        """Return the counters collected so far and start over from zero"""
+        stats = {'rules': self.stats, 'body_seconds': self.body_seconds, 'calls': self.calls}
+        self.stats = {name: {'hits': 0, 'seconds': 0.0} for name in self.stats}
+        self.body_seconds = 0.0
+        self.calls = 0
+        return stats
+    
+    def merge_stats(self, stats):
+        """Add counters taken from another cleaner, e.g. in a worker process"""
+        for name, rule_stats in stats['rules'].items():
+            self.stats[name]['hits'] += rule_stats['hits']
+            self.stats[name]['seconds'] += rule_stats['seconds']
+        self.body_seconds += stats['body_seconds']
+        self.calls += stats['calls']
+    
+    def report(self):
+        """Print hit counts and time spent per rule"""
+        print(f"🧹 Boilerplate rules ({self.calls} articles):")
+        body_rule_names = {rule['name'] for rule in self.body_rules}
+        for name, stats in self.stats.items():
+            timing = '(combined)' if name in body_rule_names else f"{stats['seconds'] * 1000:.2f}ms"
+            print(f"   {name:<28} {stats['hits']:>6} hits  {timing:>12}")
+        print(f"   {'remove/truncate pass':<28} {'':>6}       {self.body_seconds * 1000:>10.2f}ms")
+
+_content_cleaner = None
+
+def get_content_cleaner():
+    """Return the shared cleaner, compiling the rules on first use"""
+    global _content_cleaner
+    if _content_cleaner is None:
+        _content_cleaner = ContentCleaner.from_file()
+    return _content_cleaner
+
 def clean_content(content):
     """Clean and normalize article content"""
     if not content:
         return ''
     
     # Remove Google Sites navigation and footer
-    unwanted_patterns = [
-        r'^Search this site.*?Skip to navigation\s*',
-        r'^Skip to main content.*?Skip to navigation\s*',
-        r'Startseite\s+Detlef Zeiler\s+Deutsch.*?Selfmade\s*',
-        r'Copyright © \d{4} - \d{4} Detlef und Julian Zeiler.*?$',
-        r'Google Sites\s+Report abuse.*?$',
-        r'Made with Google Sites\s*$'
-    ]
-
-    cleaned_content = content
-    for pattern in unwanted_patterns:
-        cleaned_content = re.sub(pattern, '', cleaned_content, flags=re.DOTALL | re.IGNORECASE)
-
-    # Clean whitespace but preserve paragraph structure
-    cleaned_content = re.sub(r'\n\s*\n\s*\n', '\n\n', cleaned_content)  # Multiple line breaks to double
-    cleaned_content = re.sub(r'^\s+|\s+$', '', cleaned_content, flags=re.MULTILINE)  # Whitespace at line start/end
-    cleaned_content = cleaned_content.strip()
-
-    return cleaned_content
+    return get_content_cleaner().clean(content)
 
 def generate_excerpt(content, max_length=200):
     """Generate an excerpt from content"""
@@ -94,82 +332,416 @@ def generate_excerpt(content, max_length=200):
     
     return truncated + '...'
 
-def process_scraped_articles(scraped_data):
-    """Process scraped articles into the format needed for the React app"""
+# Bump when clean_content or generate_excerpt change their output
+MANIFEST_VERSION = 1
+
+class IntegrationManifest:
+    """Cleaned content of earlier runs, keyed by a SHA-256 of the raw content
+    
+    Entries are only reused with the boilerplate rules and MANIFEST_VERSION
+    they were built with. Entries the current run did not use are dropped
+    when the manifest is saved.
+    """
+    
+    def __init__(self, filename='integration_manifest.json', rules_file=BOILERPLATE_RULES_FILE):
+        self.filename = filename
+        self.fingerprint = self.build_fingerprint(rules_file)
+        self.entries = {}
+        self.used = {}
+        self.stats = {'unchanged': 0, 'changed': 0}
+        
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+                if manifest.get('fingerprint') == self.fingerprint:
+                    self.entries = manifest['entries']
+                    print(f"📋 Loaded integration manifest with {len(self.entries)} articles from {filename}")
+                else:
+                    print(f"📋 Cleaning rules changed, ignoring integration manifest {filename}")
+            except Exception as e:
+                print(f"⚠️  Ignoring unreadable integration manifest {filename}: {e}")
+    
+    @staticmethod
+    def build_fingerprint(rules_file):
+        with open(rules_file, 'rb') as f:
+            rules_hash = hashlib.sha256(f.read()).hexdigest()
+        return f"{MANIFEST_VERSION}:{rules_hash}"
+    
+    @staticmethod
+    def key(raw_content):
+        return hashlib.sha256(raw_content.encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.used[key] = entry
+            self.stats['unchanged'] += 1
+        return entry
+    
+    def store(self, key, entry):
+        if key not in self.used:
+            self.stats['changed'] += 1
+        self.used[key] = entry
+    
+    def save(self):
+        """Write the manifest atomically so an interrupted run cannot corrupt it"""
+        tmp_filename = f"{self.filename}.tmp"
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self.fingerprint, 'entries': self.used}, f, ensure_ascii=False)
+        os.replace(tmp_filename, self.filename)
+        
+        print(f"📋 Saved integration manifest with {len(self.used)} articles to {self.filename} "
+              f"({self.stats['unchanged']} unchanged, {self.stats['changed']} new or changed)")
+
+def clean_article_content(raw_content):
+    """The expensive part of processing an article: cleaning and excerpt"""
+    content = clean_content(raw_content)
+    
+    # Articles with insufficient content are skipped, no excerpt needed
+    if len(content.strip()) < 100:
+        return {'content': content, 'excerpt': None}
+    
+    return {'content': content, 'excerpt': generate_excerpt(content)}
+
+def process_article(i, raw_article, cleaned=None, fingerprint=False):
+    """Process one scraped article
+    
+    cleaned is the result of clean_article_content from an earlier run, if
+    the raw content is unchanged. Returns the processed article (None if it
+    is skipped) together with the cleaned content for the manifest. With
+    fingerprint, the SimHash of the content is added to the cleaned content
+    for near-duplicate detection.
+    """
+    try:
+        # Clean and process the article data
+        title = clean_title(raw_article.get('title', ''))
+        if cleaned is None:
+            cleaned = clean_article_content(raw_article.get('content', ''))
+        content = cleaned['content']
+        excerpt = cleaned['excerpt']
+        
+        # Skip articles with insufficient content
+        if excerpt is None:
+            return None, cleaned
+        
+        if fingerprint and 'simhash' not in cleaned:
+            cleaned = {**cleaned, 'simhash': simhash(content)}
+        
+        # Process images
+        images = []
+        for img in raw_article.get('images', []):
+            if isinstance(img, dict):
+                images.append({
+                    'src': f"/src/assets/{img.get('src', '')}",
+                    'alt': img.get('alt', f"Bild zu {title}")
+                })
+        
+        # Determine category from URL
+        url = raw_article.get('relative_url', raw_article.get('url', ''))
+        category = 'andere'  # default
+        
+        if '/detlef/' in url:
+            if '/geschichte/' in url:
+                category = 'geschichte'
+            elif '/medien/' in url:
+                category = 'medien'
+            elif '/deutsch/' in url:
+                category = 'deutsch'
+            elif '/projekte/' in url:
+                category = 'projekte'
+            else:
+                category = 'detlef'
+        elif '/julian/' in url:
+            if '/techzap/' in url:
+                category = 'techzap'
+            else:
+                category = 'julian'
+        
+        # Create display URL for hash routing
+        display_url = f"/#/{url.strip('/')}" if url else f"/#/artikel-{i+1}"
+        
+        # Calculate reading time
+        word_count = len(content.split())
+        reading_time = max(1, round(word_count / 200))
+        
+        processed_article = {
+            'id': i + 1,
+            'title': title,
+            'excerpt': excerpt,
+            'content': content,
+            'url': url,
+            'display_url': display_url,
+            'images': images,
+            'author': raw_article.get('author', 'ZEILER.me'),
+            'category': category,
+            'scraped_url': raw_article.get('scraped_url', raw_article.get('url', '')),
+            'word_count': word_count,
+            'reading_time': reading_time
+        }
+        
+        return processed_article, cleaned
+        
+    except Exception as e:
+        print(f"❌ Error processing article {i}: {e}")
+        return None, None
+
+def process_article_chunk(chunk, fingerprint=False):
+    """Process (index, article, cleaned) triples in a worker process
+    
+    Returns the results of process_article together with the cleaning
+    counters of this chunk so the parent can report them.
+    """
+    results = [process_article(i, raw_article, cleaned, fingerprint) for i, raw_article, cleaned in chunk]
+    return results, get_content_cleaner().take_stats()
+
+def iter_chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def process_scraped_articles(scraped_data, workers=1, chunk_size=50, manifest=None, near_duplicates=None):
+    """Process scraped articles into the format needed for the React app
+    
+    With a manifest, articles whose raw content is unchanged since the last
+    run reuse the cleaned content and excerpt stored there. With a
+    NearDuplicateIndex, an article whose cleaned content repeats an earlier
+    one is dropped in favour of the earlier (canonical) article. The
+    fingerprints are computed with the cleaning (in the workers) and kept
+    in the manifest; the index itself is only consulted here, in input
+    order, so the same articles survive in serial and parallel runs.
+    
+    With workers > 1 the articles are cleaned in a process pool, chunk_size
+    articles per task. Chunks are collected in submission order, so ids and
+    the order of the output are the same as in a serial run. Only a few
+    chunks per worker are in flight, which keeps memory flat for streamed
+    input.
+    """
     processed_articles = []
+    fingerprint = near_duplicates is not None
     
-    for i, raw_article in enumerate(scraped_data):
-        try:
-            # Clean and process the article data
-            title = clean_title(raw_article.get('title', ''))
-            content = clean_content(raw_article.get('content', ''))
-            
-            # Skip articles with insufficient content
-            if len(content.strip()) < 100:
+    def lookup(scraped_data):
+        for i, raw_article in enumerate(scraped_data):
+            key = cleaned = None
+            if manifest is not None:
+                key = manifest.key(raw_article.get('content') or '')
+                cleaned = manifest.get(key)
+            yield key, (i, raw_article, cleaned)
+    
+    def collect(keys, results):
+        for key, (article, cleaned) in zip(keys, results):
+            if manifest is not None and cleaned is not None:
+                manifest.store(key, cleaned)
+            if article is None:
                 continue
-            
-            # Generate excerpt
-            excerpt = generate_excerpt(content)
-            
-            # Process images
-            images = []
-            for img in raw_article.get('images', []):
-                if isinstance(img, dict):
-                    images.append({
-                        'src': f"/src/assets/{img.get('src', '')}",
-                        'alt': img.get('alt', f"Bild zu {title}")
-                    })
-            
-            # Determine category from URL
-            url = raw_article.get('relative_url', raw_article.get('url', ''))
-            category = 'andere'  # default
-            
-            if '/detlef/' in url:
-                if '/geschichte/' in url:
-                    category = 'geschichte'
-                elif '/medien/' in url:
-                    category = 'medien'
-                elif '/deutsch/' in url:
-                    category = 'deutsch'
-                elif '/projekte/' in url:
-                    category = 'projekte'
-                else:
-                    category = 'detlef'
-            elif '/julian/' in url:
-                if '/techzap/' in url:
-                    category = 'techzap'
+            if near_duplicates is not None:
+                key = article['scraped_url'] or article['url']
+                if near_duplicates.check_fingerprint(key, cleaned['simhash']) is not None:
+                    continue
+            processed_articles.append(article)
+    
+    if workers <= 1:
+        for key, task in lookup(scraped_data):
+            collect([key], [process_article(*task, fingerprint)])
+        return processed_articles
+    
+    cleaner = get_content_cleaner()
+    pending = deque()
+    
+    def collect_chunk(keys, future):
+        results, stats = future.result()
+        collect(keys, results)
+        cleaner.merge_stats(stats)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in iter_chunks(lookup(scraped_data), chunk_size):
+            if len(pending) >= workers * 2:
+                collect_chunk(*pending.popleft())
+            keys = [key for key, _ in chunk]
+            tasks = [task for _, task in chunk]
+            pending.append((keys, executor.submit(process_article_chunk, tasks, fingerprint)))
+        
+        while pending:
+            collect_chunk(*pending.popleft())
+    
+    return processed_articles
+
+def print_duplicate_report(near_duplicates):
+    """List the near-duplicate articles that were collapsed"""
+    print(f"🧬 Dropped {near_duplicates.duplicate_count()} near-duplicate articles "
+          f"({len(near_duplicates.duplicates)} clusters):")
+    for canonical, duplicates in near_duplicates.clusters().items():
+        print(f"   {canonical}")
+        for key in duplicates:
+            print(f"     = {key}")
+
+IMAGE_CACHE_VERSION = 1
+IMAGE_WIDTHS = (320, 640, 960, 1280)
+# Encoder settings and MIME type per variant format, in the order browsers should try them
+IMAGE_FORMATS = {
+    'avif': {'type': 'image/avif', 'quality': 60},
+    'webp': {'type': 'image/webp', 'quality': 80},
+}
+
+def available_image_formats(formats):
+    """The requested variant formats the installed Pillow can encode"""
+    Image.init()
+    return [name for name in formats if name.upper() in Image.SAVE]
+
+def variant_widths(width, widths):
+    """Target widths for an image `width` pixels wide, never upscaling"""
+    return [w for w in widths if w < width] + [min(width, max(widths))]
+
+def optimize_image(path, digest, output_dir, widths, formats):
+    """Encode the responsive variants of one image in a worker process
+    
+    Variants are named <digest prefix>-<width>.<format>, so the files of an
+    unchanged image keep their names. EXIF orientation is applied and EXIF
+    and XMP (camera data, GPS) are dropped; an embedded ICC profile is kept
+    so colours stay right. Animated images only get their dimensions.
+    Returns width, height and the srcset list, or None if Pillow cannot
+    read the file (e.g. SVG).
+    """
+    try:
+        with Image.open(path) as original:
+            if getattr(original, 'is_animated', False):
+                return {'width': original.width, 'height': original.height, 'srcset': []}
+            image = ImageOps.exif_transpose(original)
+            icc_profile = original.info.get('icc_profile')
+    except (OSError, ValueError) as e:
+        return {'error': str(e)}
+    
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+    
+    srcset = []
+    for width in variant_widths(image.width, widths):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for name in formats:
+            settings = IMAGE_FORMATS[name]
+            filename = f"{digest[:16]}-{width}.{name}"
+            options = {key: value for key, value in settings.items() if key != 'type'}
+            if icc_profile:
+                options['icc_profile'] = icc_profile
+            resized.save(os.path.join(output_dir, filename), name.upper(), **options)
+            srcset.append({'src': filename, 'width': width, 'type': settings['type']})
+    
+    return {'width': image.width, 'height': image.height, 'srcset': srcset}
+
+def optimize_image_task(task):
+    return optimize_image(*task)
+
+class ImageCache:
+    """Dimensions and variants of earlier runs, keyed by a SHA-256 of the image file
+    
+    Entries are only reused with the widths, formats and IMAGE_CACHE_VERSION
+    they were encoded with, and only while all their variant files exist.
+    Entries the current run did not use are dropped when the cache is saved.
+    """
+    
+    def __init__(self, filename, output_dir, widths, formats):
+        self.filename = filename
+        self.output_dir = output_dir
+        self.fingerprint = f"{IMAGE_CACHE_VERSION}:{','.join(map(str, widths))}:{','.join(formats)}"
+        self.entries = {}
+        self.used = {}
+        
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                if cache.get('fingerprint') == self.fingerprint:
+                    self.entries = cache['entries']
                 else:
-                    category = 'julian'
-            
-            # Create display URL for hash routing
-            display_url = f"/#/{url.strip('/')}" if url else f"/#/artikel-{i+1}"
-            
-            # Calculate reading time
-            word_count = len(content.split())
-            reading_time = max(1, round(word_count / 200))
-            
-            processed_article = {
-                'id': i + 1,
-                'title': title,
-                'excerpt': excerpt,
-                'content': content,
-                'url': url,
-                'display_url': display_url,
-                'images': images,
-                'author': raw_article.get('author', 'ZEILER.me'),
-                'category': category,
-                'scraped_url': raw_article.get('scraped_url', raw_article.get('url', '')),
-                'word_count': word_count,
-                'reading_time': reading_time
-            }
-            
-            processed_articles.append(processed_article)
-            
-        except Exception as e:
-            print(f"❌ Error processing article {i}: {e}")
+                    print(f"🖼️  Image settings changed, ignoring image cache {filename}")
+            except Exception as e:
+                print(f"⚠️  Ignoring unreadable image cache {filename}: {e}")
+    
+    def get(self, digest):
+        entry = self.entries.get(digest)
+        if entry is None or not all(os.path.exists(os.path.join(self.output_dir, variant['src']))
+                                    for variant in entry['srcset']):
+            return None
+        self.used[digest] = entry
+        return entry
+    
+    def store(self, digest, entry):
+        self.used[digest] = entry
+    
+    def save(self):
+        tmp_filename = f"{self.filename}.tmp"
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self.fingerprint, 'entries': self.used}, f)
+        os.replace(tmp_filename, self.filename)
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def optimize_article_images(articles, output_dir=os.path.join('public', 'images'), widths=IMAGE_WIDTHS,
+                            formats=tuple(IMAGE_FORMATS), workers=1, cache_file='image_cache.json'):
+    """Add width, height and a srcset of resized variants to every article image
+    
+    Images are read from their /src/assets/ path relative to the working
+    directory. Each distinct file is encoded once, in a process pool with
+    workers > 1; files whose SHA-256 is in the image cache are not encoded
+    again. Variant URLs point below /images/ (public/images is served from
+    the site root). Returns the number of images encoded and the number
+    taken from the cache.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache = ImageCache(cache_file, output_dir, widths, formats)
+    url_prefix = '/' + os.path.relpath(output_dir, 'public').replace(os.sep, '/')
+    
+    digests = {}
+    for article in articles:
+        for image in article['images']:
+            path = image['src'].lstrip('/')
+            if path not in digests and os.path.isfile(path):
+                digests[path] = file_sha256(path)
+    
+    entries = {}
+    tasks = {}
+    for path, digest in digests.items():
+        entry = cache.get(digest)
+        if entry is not None:
+            entries[digest] = entry
+        elif digest not in tasks:
+            tasks[digest] = (path, digest, output_dir, widths, formats)
+    
+    if workers <= 1 or len(tasks) <= 1:
+        results = [optimize_image(*task) for task in tasks.values()]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(optimize_image_task, tasks.values(),
+                                        chunksize=max(1, len(tasks) // (workers * 4))))
+    
+    encoded = 0
+    for (path, digest, *_), entry in zip(tasks.values(), results):
+        if 'error' in entry:
+            print(f"⚠️  Could not optimize {path}: {entry['error']}")
             continue
+        cache.store(digest, entry)
+        entries[digest] = entry
+        encoded += 1
     
-    return processed_articles
+    for article in articles:
+        for image in article['images']:
+            entry = entries.get(digests.get(image['src'].lstrip('/')))
+            if entry is not None:
+                image['width'] = entry['width']
+                image['height'] = entry['height']
+                image['srcset'] = [dict(variant, src=f"{url_prefix}/{variant['src']}") for variant in entry['srcset']]
+    
+    cache.save()
+    return encoded, len(set(digests.values())) - len(tasks)
 
 def generate_test_articles():
     """Generate test articles as fallback when no scraped data is available"""
@@ -473,21 +1045,84 @@ Für moderne Webentwicklung ist CSS Grid unverzichtbar geworden. Es ergänzt Fle
         
     return test_articles
 
-if __name__ == '__main__':
-    print("🚀 Processing scraped content...")
+# Integer columns become little-endian typed arrays, the smallest that fits
+TYPED_ARRAYS = (('Uint8Array', 'B', 0xFF), ('Uint16Array', 'H', 0xFFFF), ('Uint32Array', 'I', 0xFFFFFFFF))
+# String columns with at most this share of distinct values are dictionary-coded
+DICTIONARY_RATIO = 0.5
+
+COLUMNAR_DECODER = """// Spalten (--data-format columnar) zurück in Artikelobjekte wandeln
+function decodeColumns(columns, count) {
+  const decoded = columns.map(column => {
+    if (column.dictionary) {
+      return column.codes.map(code => column.dictionary[code]);
+    }
+    if (column.type) {
+      // Ganzzahlen als Little-Endian-Bytes in Base64
+      const bytes = Uint8Array.from(atob(column.data), char => char.charCodeAt(0));
+      return new globalThis[column.type](bytes.buffer);
+    }
+    return column.values;
+  });
+  // Zeilenweise in fester Schlüsselreihenfolge, damit alle Objekte dieselbe Form haben
+  const rows = new Array(count);
+  for (let i = 0; i < count; i++) {
+    const row = {};
+    for (let c = 0; c < columns.length; c++) {
+      row[columns[c].key] = decoded[c][i];
+    }
+    rows[i] = row;
+  }
+  return rows;
+}
+"""
+
+def encode_column(key, values):
+    """One column of the columnar format
     
-    # Try to load scraped data first
-    scraped_data = load_scraped_data()
+    Non-negative integers (ids, word_count, reading_time) are packed into
+    the smallest typed array and stored base64-encoded, strings with few
+    distinct values (author, category) as a dictionary plus small-integer
+    codes, and everything else as a plain array.
+    """
+    if values and all(type(value) is int and value >= 0 for value in values):
+        for array_type, code, limit in TYPED_ARRAYS:
+            if max(values) <= limit:
+                data = struct.pack(f'<{len(values)}{code}', *values)
+                return {'key': key, 'type': array_type, 'data': base64.b64encode(data).decode('ascii')}
     
-    if scraped_data:
-        print(f"📄 Found {len(scraped_data)} scraped articles")
-        processed_articles = process_scraped_articles(scraped_data)
-        print(f"✅ Processed {len(processed_articles)} articles from scraped data")
-    else:
-        print("📝 No scraped data found, using test articles...")
-        processed_articles = generate_test_articles()
-        print(f"✅ Generated {len(processed_articles)} test articles")
+    if values and all(isinstance(value, str) for value in values):
+        dictionary = sorted(set(values))
+        if len(dictionary) <= DICTIONARY_RATIO * len(values):
+            codes = {value: code for code, value in enumerate(dictionary)}
+            return {'key': key, 'dictionary': dictionary, 'codes': [codes[value] for value in values]}
+    
+    return {'key': key, 'values': values}
+
+def columnar_articles_source(rows, body_key=None):
+    """JavaScript that rebuilds `articles` from columns (--data-format columnar)
+    
+    Every key is stored once per column instead of once per article. The
+    columns are embedded as a JSON.parse('...') string, which JavaScript
+    engines parse much faster than the equivalent object literals. The
+    bodies (body_key) stay a plain array literal, a string table that is
+    slotted into its column, since long strings would only be scanned twice
+    inside JSON.parse. Rows are rebuilt in key order, so they share one shape.
+    """
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    columns = [encode_column(key, [row.get(key) for row in rows]) if key != body_key else {'key': key}
+               for key in keys]
+    
+    source = f"const columns = JSON.parse({json.dumps(json.dumps(columns, ensure_ascii=False, separators=(',', ':')), ensure_ascii=False)});\n"
+    if body_key is not None:
+        bodies = [row[body_key] for row in rows]
+        source += f"columns[{keys.index(body_key)}].values = {json.dumps(bodies, ensure_ascii=False, separators=(',', ':'))};\n"
+    source += f"\n{COLUMNAR_DECODER}\nexport const articles = decodeColumns(columns, {len(rows)});"
+    return source
+
+DATA_FORMATS = ('js', 'columnar')
 
+def articles_literal(processed_articles):
+    """The articles as a pretty-printed JavaScript array literal"""
     # Convert articles to JavaScript format with proper escaping
     articles_js = "[\n"
     for i, article in enumerate(processed_articles):
@@ -507,39 +1142,34 @@ if __name__ == '__main__':
     "url": "{article['url']}",
     "display_url": "{article['display_url']}",
     "images": {json.dumps(article['images'])},
+    "tags": {json.dumps(article.get('tags', []), ensure_ascii=False)},
     "author": "{article['author']}",
     "category": "{article['category']}",
     "scraped_url": "{article['scraped_url']}",
     "word_count": {article['word_count']},
-    "reading_time": {article['reading_time']}
+    "reading_time": {article['reading_time']},
+    "related": {json.dumps(article.get('related', []))}
   }}"""
     
     articles_js += "\n];"
-
+    return articles_js
+
+# Fields of the articles in src/data/articles_comprehensive.js, in this order
+ARTICLE_MODULE_KEYS = ('id', 'title', 'excerpt', 'content', 'url', 'display_url', 'images', 'tags',
+                       'author', 'category', 'scraped_url', 'word_count', 'reading_time', 'related')
+
+def generate_articles_module(processed_articles, data_format='js'):
+    """Render the articles as the JavaScript data module used by the React app"""
+    if data_format == 'columnar':
+        rows = [{key: article.get(key, [] if key in ('tags', 'related') else None) for key in ARTICLE_MODULE_KEYS}
+                for article in processed_articles]
+        articles_source = columnar_articles_source(rows, body_key='content')
+    else:
+        articles_source = f"export const articles = {articles_literal(processed_articles)}"
+    
     js_content = f"""// Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-export const articles = {articles_js}
-
-// Suchfunktion
-export function searchArticles(query) {{
-  if (!query || query.trim().length < 2) {{
-    return articles;
-  }}
-  
-  const searchTerm = query.toLowerCase().trim();
-  
-  return articles.filter(article => {{
-    const searchableText = [
-      article.title,
-      article.excerpt,
-      article.content,
-      article.author,
-      article.category
-    ].join(' ').toLowerCase();
-    
-    return searchableText.includes(searchTerm);
-  }});
-}}
+{articles_source}
 
 // Artikel nach URL finden
 export function getArticleByUrl(url) {{
@@ -574,6 +1204,753 @@ export const articleStats = {{
 }};
 """
     
+    return js_content
+
+SHARDS_DIR = os.path.join('public', 'articles')
+SHARDS_URL = '/articles'
+
+# Same rules as parseMarkdownWithFrontMatter and cleanArticleContent in src/utils/MarkdownParser.js
+ARTICLE_FRONT_MATTER = re.compile(r'^---\s*\n[\s\S]*?\n---\s*\n([\s\S]*)\Z')
+ARTICLE_BOILERPLATE = [re.compile(pattern, re.S) for pattern in (
+    r'^Search this site.*?Skip to navigation\s*',
+    r'^Skip to main content.*?Skip to navigation\s*',
+    r'Startseite\s+Detlef Zeiler\s+Deutsch.*?Selfmade\s*',
+    r'Copyright © \d{4} - \d{4} Detlef und Julian Zeiler.*?\Z',
+    r'Google Sites\s+Report abuse.*?\Z',
+    r'Made with Google Sites\s*\Z',
+)]
+# Embedded quotations become blockquotes, as ArticlePage.jsx did in the browser before pre-rendering
+ARTICLE_QUOTE = re.compile(r'[„"][^"]+"')
+# Tailwind finds these class names by scanning this file
+ARTICLE_PARAGRAPH_HTML = '<p class="mb-6 text-gray-700 leading-relaxed text-lg" style="line-height: 1.8">{}</p>'
+ARTICLE_QUOTE_HTML = ('<blockquote class="border-l-4 border-blue-500 pl-6 py-4 my-6 bg-blue-50 italic text-gray-800">'
+                      '<p class="text-lg leading-relaxed">{}</p></blockquote>')
+
+def clean_markdown_body(content):
+    """Front matter and Google Sites boilerplate removed, whitespace normalized"""
+    match = ARTICLE_FRONT_MATTER.match(content or '')
+    content = (match.group(1) if match else content or '').strip()
+    for pattern in ARTICLE_BOILERPLATE:
+        content = pattern.sub('', content, count=1)
+    
+    # Collapse blank lines, strip every line but keep the line breaks between paragraphs
+    content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
+    return re.sub(r'^[^\S\n]+|[^\S\n]+$', '', content, flags=re.M).strip()
+
+def article_blocks(content):
+    """Paragraphs and embedded quotations as [(type, text)]"""
+    blocks = []
+    for paragraph in re.split(r'\n{2,}', content):
+        text = paragraph.strip()
+        while (match := ARTICLE_QUOTE.search(text)) is not None:
+            before = re.sub(r':\s*\Z', '', text[:match.start()]).strip()
+            if before:
+                blocks.append(('paragraph', before))
+            quote = match.group()[1:-1].strip()
+            if quote:
+                blocks.append(('quote', quote))
+            text = text[match.end():].strip()
+        if text:
+            blocks.append(('paragraph', text))
+    return blocks
+
+def prerender_article_html(content):
+    """The article body as the HTML ArticlePage inserts
+    
+    All text is escaped and only the fixed paragraph and blockquote markup
+    above is emitted, so the result is safe to insert as-is.
+    """
+    templates = {'paragraph': ARTICLE_PARAGRAPH_HTML, 'quote': ARTICLE_QUOTE_HTML}
+    return ''.join(templates[kind].format(html.escape(text, quote=False))
+                   for kind, text in article_blocks(clean_markdown_body(content)))
+
+def build_content_shards(processed_articles, render=None, kind=None):
+    """Split article bodies into one JSON shard per category
+    
+    Returns {category: (filename, json)}. The filename carries a hash of the
+    shard, so it only changes when an article of that category does and the
+    shard can be cached forever. With render, the shard holds render(article)
+    instead of the body and is named <category>.<kind>.<hash>.json.
+    """
+    bodies = {}
+    for article in processed_articles:
+        body = article['content'] if render is None else render(article)
+        bodies.setdefault(article['category'], {})[str(article['id'])] = body
+    
+    shards = {}
+    for category, category_bodies in sorted(bodies.items()):
+        shard_json = json.dumps(category_bodies, ensure_ascii=False, separators=(',', ':'))
+        shard_hash = hashlib.sha256(shard_json.encode('utf-8')).hexdigest()[:12]
+        name = category if kind is None else f"{category}.{kind}"
+        shards[category] = (f"{name}.{shard_hash}.json", shard_json)
+    return shards
+
+# Fields of the manifest articles, what the article lists and routing need
+MANIFEST_KEYS = ('id', 'title', 'excerpt', 'url', 'display_url', 'category', 'author', 'reading_time')
+# Fields only the article page needs, stored next to its pre-rendered HTML
+ARTICLE_PAGE_KEYS = ('images', 'tags', 'related', 'word_count', 'scraped_url')
+
+def manifest_entry(article):
+    """Manifest fields of an article plus the card image (src of the first image)"""
+    entry = {key: article.get(key) for key in MANIFEST_KEYS}
+    images = article.get('images') or []
+    image = images[0] if images else None
+    entry['image'] = image.get('src') if isinstance(image, dict) else image
+    return entry
+
+def article_page_entry(article):
+    """Page shard entry of an article: pre-rendered body and the fields left out of the manifest"""
+    entry = {key: article[key] for key in ARTICLE_PAGE_KEYS if key in article}
+    entry['html'] = prerender_article_html(article['content'])
+    return entry
+
+def generate_manifest_module(processed_articles, shards, page_shards, data_format='js'):
+    """Render the metadata-only module the app loads up front
+    
+    Holds only what the article lists and routing need (manifest_entry).
+    loadArticlePage fetches the pre-rendered body with the remaining fields
+    from the category page shards, loadArticleContent the plain text that
+    search snippets are cut from.
+    """
+    metadata = [manifest_entry(article) for article in processed_articles]
+    shard_urls = {category: f"{SHARDS_URL}/{filename}" for category, (filename, _) in shards.items()}
+    page_shard_urls = {category: f"{SHARDS_URL}/{filename}" for category, (filename, _) in page_shards.items()}
+    if data_format == 'columnar':
+        articles_source = columnar_articles_source(metadata)
+    else:
+        articles_source = f"export const articles = {json.dumps(metadata, ensure_ascii=False, separators=(',', ':'))};"
+    
+    return f"""// Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+{articles_source}
+
+// Klartext der Artikel je Kategorie, für die Textausschnitte der Suche
+const contentShards = {json.dumps(shard_urls, ensure_ascii=False, separators=(',', ':'))};
+
+// Artikelseiten (vorgerendertes HTML, Bilder, Tags, ähnliche Artikel) je Kategorie
+const pageShards = {json.dumps(page_shard_urls, ensure_ascii=False, separators=(',', ':'))};
+
+const shardRequests = new Map();
+
+// Eintrag eines Artikels aus einem Shard laden
+function loadShardEntry(shardUrl, id, fallback) {{
+  if (!shardUrl) {{
+    return Promise.resolve(fallback);
+  }}
+  
+  if (!shardRequests.has(shardUrl)) {{
+    const request = fetch(shardUrl)
+      .then(response => {{
+        if (!response.ok) {{
+          throw new Error(`Failed to load ${{shardUrl}}: ${{response.status}}`);
+        }}
+        return response.json();
+      }})
+      .catch(error => {{
+        shardRequests.delete(shardUrl);
+        throw error;
+      }});
+    shardRequests.set(shardUrl, request);
+  }}
+  
+  return shardRequests.get(shardUrl).then(shard => shard[id] || fallback);
+}}
+
+// Inhalt eines Artikels aus dem Shard seiner Kategorie laden
+export function loadArticleContent(article) {{
+  return loadShardEntry(contentShards[article.category], article.id, '');
+}}
+
+// Restliche Felder eines Artikels und sein beim Build gerendertes HTML
+// (bereits bereinigt und escaped) laden
+export function loadArticlePage(article) {{
+  return loadShardEntry(pageShards[article.category], article.id, {{ html: '' }});
+}}
+
+// Artikel nach ID finden
+export function getArticleById(id) {{
+  return articles.find(article => article.id === id) || null;
+}}
+
+// Artikel nach URL finden
+export function getArticleByUrl(url) {{
+  if (!url) return null;
+  
+  // Normalisiere URL
+  const normalizedUrl = url.replace(/^\/+|\/+$/g, '').toLowerCase();
+  
+  return articles.find(article => {{
+    const articleUrl = article.url.replace(/^\/+|\/+$/g, '').toLowerCase();
+    const displayUrl = article.display_url.replace(/^\/+|#+\/+|\/+$/g, '').toLowerCase();
+    
+    return articleUrl === normalizedUrl || 
+           displayUrl === normalizedUrl ||
+           articleUrl.endsWith(normalizedUrl) ||
+           displayUrl.endsWith(normalizedUrl);
+  }}) || null;
+}}
+
+// Artikel nach Kategorie
+export function getArticlesByCategory(category) {{
+  return articles.filter(article => article.category === category);
+}}
+"""
+
+def write_content_shards(shards, shards_dir=SHARDS_DIR):
+    """Write shards that do not exist yet; returns how many were written"""
+    written = 0
+    for filename, shard_json in shards.values():
+        if write_if_changed(os.path.join(shards_dir, filename), shard_json):
+            written += 1
+    return written
+
+PRECOMPRESSED_SUFFIXES = ('.gz', '.br')
+
+def remove_stale_shards(*shard_sets, shards_dir=SHARDS_DIR):
+    """Delete shards no longer referenced by the manifest, with their .gz/.br variants"""
+    current = {filename for shards in shard_sets for filename, _ in shards.values()}
+    for path in glob.glob(os.path.join(shards_dir, '*.json*')):
+        name = os.path.basename(path)
+        for suffix in PRECOMPRESSED_SUFFIXES:
+            name = name.removesuffix(suffix)
+        if name not in current:
+            os.remove(path)
+
+def compress_variants(data):
+    """{suffix: compressed bytes} for .gz and, with brotli installed, .br"""
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, quality=11)
+    return variants
+
+def precompress_asset(path):
+    """Write .gz/.br variants next to a static asset unless they are current
+    
+    Web servers can then send the precompressed file (e.g. nginx
+    gzip_static/brotli_static) instead of compressing on every request.
+    Returns the number of variants written.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    written = 0
+    for suffix, compressed in compress_variants(data).items():
+        variant = path + suffix
+        if os.path.exists(variant) and os.path.getmtime(variant) >= os.path.getmtime(path):
+            continue
+        with open(variant, 'wb') as f:
+            f.write(compressed)
+        written += 1
+    return written
+
+def time_module_load(source, runs=5):
+    """Median milliseconds node needs to parse and evaluate an ES module, or None without node"""
+    node = shutil.which('node')
+    if node is None:
+        return None
+    
+    with tempfile.TemporaryDirectory() as directory:
+        module = os.path.join(directory, 'module.mjs')
+        with open(module, 'w', encoding='utf-8') as f:
+            f.write(source)
+        # A query string per run bypasses the module cache
+        script = (f"const url = {json.dumps('file://' + module)}; const times = [];"
+                  f"for (let i = 0; i < {runs}; i++) {{ const start = performance.now();"
+                  "await import(`${url}?run=${i}`); times.push(performance.now() - start); }"
+                  "times.sort((a, b) => a - b); console.log(times[times.length >> 1]);")
+        result = subprocess.run([node, '--input-type=module', '-e', script],
+                                capture_output=True, text=True, timeout=300)
+    if result.returncode != 0:
+        print(f"⚠️  Could not time module in node: {result.stderr.strip()}")
+        return None
+    return float(result.stdout)
+
+def report_data_formats(processed_articles, shards, page_shards):
+    """Compare size and client decode time of the js and columnar module formats"""
+    brotli_note = '' if brotli is not None else ' (install brotli for .br sizes)'
+    print(f"📊 Data format report{brotli_note}:")
+    print(f"   {'module':<22} {'format':<9} {'raw KiB':>9} {'gz KiB':>8} {'br KiB':>8} {'load ms':>8}")
+    
+    modules = (('articles_comprehensive', lambda data_format: generate_articles_module(processed_articles, data_format)),
+               ('articles_manifest', lambda data_format: generate_manifest_module(
+                   processed_articles, shards, page_shards, data_format)))
+    for name, generate in modules:
+        for data_format in DATA_FORMATS:
+            source = generate(data_format)
+            data = source.encode('utf-8')
+            variants = compress_variants(data)
+            load_ms = time_module_load(source)
+            sizes = [f"{len(data) / 1024:>9.0f}", f"{len(variants['.gz']) / 1024:>8.0f}",
+                     f"{len(variants['.br']) / 1024:>8.0f}" if '.br' in variants else f"{'-':>8}",
+                     f"{load_ms:>8.1f}" if load_ms is not None else f"{'-':>8}"]
+            print(f"   {name:<22} {data_format:<9} {' '.join(sizes)}")
+
+# Keep in sync with ArticleSearchIndex in src/utils/SearchIndex.ts
+SEARCH_INDEX_VERSION = 3
+SEARCH_FIELD_WEIGHTS = {
+    'title': 5,
+    'excerpt': 3,
+    'tags': 4,
+    'author': 2,
+    'category': 2,
+    'content': 1
+}
+SEARCH_STOP_WORDS = {
+    'der', 'die', 'das', 'und', 'oder', 'aber', 'in', 'auf', 'für', 'mit',
+    'von', 'zu', 'an', 'bei', 'nach', 'vor', 'über', 'unter', 'durch',
+    'ist', 'sind', 'war', 'waren', 'hat', 'haben', 'wird', 'werden',
+    'ein', 'eine', 'einer', 'eines', 'dem', 'den', 'des', 'sich', 'nicht',
+    'auch', 'nur', 'noch', 'wie', 'was', 'wenn', 'dann', 'so', 'als'
+}
+# \w in JavaScript only covers ASCII letters, digits and underscore
+SEARCH_NON_WORD = re.compile(r'[^A-Za-z0-9_\säöüß-]')
+SEARCH_TOKEN = re.compile(r'\S+')
+# A sentence ends at . ! ? or … followed by whitespace, or at a line break
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?…])\s+(?=\S)|\s*\n\s*(?=\S)')
+
+def tokenize_for_search(text):
+    """Split text into index terms exactly like ArticleSearchIndex.tokenizeText"""
+    terms = SEARCH_NON_WORD.sub(' ', text.lower()).split()
+    return [term for term in terms if len(term) > 2 and term not in SEARCH_STOP_WORDS]
+
+def utf16_offsets(text):
+    """Table from code point offsets in text to JavaScript string offsets
+    
+    JavaScript indexes strings in UTF-16 code units, so every character
+    outside the Basic Multilingual Plane (e.g. emoji) shifts the offsets
+    after it by one. Returns None if text has no such characters.
+    """
+    if text.isascii() or max(text) <= '\uffff':
+        return None
+    table = [0]
+    for char in text:
+        table.append(table[-1] + (2 if ord(char) > 0xFFFF else 1))
+    return table
+
+def search_terms_with_offsets(text):
+    """The terms of tokenize_for_search with their JavaScript string offsets in text"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Keep offsets aligned where lowercasing changes the length (e.g. İ)
+        lowered = ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+    table = utf16_offsets(text)
+    
+    terms = []
+    for match in SEARCH_TOKEN.finditer(SEARCH_NON_WORD.sub(' ', lowered)):
+        term = match.group()
+        if len(term) > 2 and term not in SEARCH_STOP_WORDS:
+            terms.append((term, match.start() if table is None else table[match.start()]))
+    return terms
+
+def content_sentences(text):
+    """[offset gaps, position gaps] of the sentence starts in text
+    
+    Offsets are JavaScript string offsets; positions count the terms of
+    tokenize_for_search before the sentence, so they line up with the
+    term positions in the postings.
+    """
+    table = utf16_offsets(text)
+    term_offsets = [offset for _, offset in search_terms_with_offsets(text)]
+    starts = [0] + [match.end() for match in SENTENCE_BOUNDARY.finditer(text)]
+    if table is not None:
+        starts = [table[start] for start in starts]
+    return [gap_encode(starts), gap_encode([bisect_left(term_offsets, start) for start in starts])]
+
+def gap_encode(values):
+    """Store ascending numbers as the first one followed by differences"""
+    return values[:1] + [b - a for a, b in zip(values, values[1:])]
+
+def term_trigrams(term):
+    """Character trigrams of a term, exactly like ArticleSearchIndex.termTrigrams
+    
+    The term is folded (ä → ae, ö → oe, ü → ue, ß → ss) so spellings with
+    and without umlauts share trigrams, and padded with ^ and $ so the
+    start and end of the term form trigrams of their own.
+    """
+    padded = f"^{term.translate(GERMAN_FOLDING)}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def build_search_index(articles):
+    """Precompute the inverted index loaded by ArticleSearchIndex.loadIndex
+    
+    Terms are sorted and map to posting lists aligned with them. Every
+    posting is [doc, field, tf, positions...] where doc indexes 'docs',
+    field indexes 'fields' and positions (term offsets within the field)
+    are stored as gaps to the previous one.
+    
+    'sentences' holds, per doc, two gap-encoded lists for its content: the
+    character offsets where sentences begin (in UTF-16 code units, like
+    JavaScript string indexes) and the term position each sentence starts
+    at. The client maps the content positions of the matched terms to
+    sentences, picks the best one and cuts it out by offset, so only that
+    sentence is ever scanned for highlights.
+    
+    'trigrams' maps every trigram of the vocabulary to the (gap-encoded)
+    numbers of the terms containing it, so substring and typo-tolerant
+    lookups in the browser intersect short lists instead of scanning
+    every term.
+    """
+    fields = list(SEARCH_FIELD_WEIGHTS)
+    postings = {}
+    
+    for doc, article in enumerate(articles):
+        for field_number, field in enumerate(fields):
+            if field == 'tags':
+                terms = [tag.lower() for tag in article.get('tags', [])]
+            else:
+                terms = tokenize_for_search(str(article.get(field) or ''))
+            
+            positions = {}
+            for position, term in enumerate(terms):
+                positions.setdefault(term, []).append(position)
+            
+            for term, term_positions in positions.items():
+                postings.setdefault(term, []).append([doc, field_number, len(term_positions)] + gap_encode(term_positions))
+    
+    terms = sorted(postings)
+    trigrams = {}
+    for term_number, term in enumerate(terms):
+        for trigram in term_trigrams(term):
+            trigrams.setdefault(trigram, []).append(term_number)
+    
+    return {
+        'version': SEARCH_INDEX_VERSION,
+        'fields': fields,
+        'weights': [SEARCH_FIELD_WEIGHTS[field] for field in fields],
+        'docs': [str(article['id']) for article in articles],
+        'terms': terms,
+        'postings': [postings[term] for term in terms],
+        'sentences': [content_sentences(str(article.get('content') or '')) for article in articles],
+        'trigrams': {trigram: gap_encode(numbers) for trigram, numbers in sorted(trigrams.items())}
+    }
+
+# Keep in sync with SearchCompletions in src/utils/SearchIndex.ts
+SEARCH_COMPLETIONS_VERSION = 1
+# Fields whose terms are offered while typing, like ArticleSearchIndex.getSuggestions
+COMPLETION_FIELDS = ('title', 'tags')
+
+def build_completion_table(search_index, k=8):
+    """Precompute the top-k completions of every prefix for the search box
+    
+    A term scores the field weight for every document whose title or tags
+    contain it, so field weight and document frequency decide the rank.
+    Terms are stored in rank order and referenced by number, so each
+    prefix list is ascending and stored gap-encoded. A prefix only gets an
+    entry while its parent prefix has more than k completions; below that
+    the parent's list already holds all of them and the client filters
+    those k terms. No lookup ever walks the vocabulary.
+    """
+    fields = search_index['fields']
+    weights = search_index['weights']
+    completion_fields = {number for number, field in enumerate(fields) if field in COMPLETION_FIELDS}
+    
+    scores = {}
+    for term, postings in zip(search_index['terms'], search_index['postings']):
+        score = sum(weights[posting[1]] for posting in postings if posting[1] in completion_fields)
+        if score:
+            scores[term] = score
+    ranked = sorted(scores, key=lambda term: (-scores[term], term))
+    
+    completions = {}
+    for number, term in enumerate(ranked):
+        for length in range(1, len(term) + 1):
+            completions.setdefault(term[:length], []).append(number)
+    
+    prefixes = {prefix: gap_encode(numbers[:k]) for prefix, numbers in sorted(completions.items())
+                if len(prefix) == 1 or len(completions[prefix[:-1]]) > k}
+    return {
+        'version': SEARCH_COMPLETIONS_VERSION,
+        'k': k,
+        'terms': ranked,
+        'prefixes': prefixes
+    }
+
+# Same list as DataHelpers.extractTags, which only runs for articles without tags
+TAG_STOP_WORDS = {
+    'aber', 'alle', 'allem', 'allen', 'aller', 'alles', 'also', 'andere',
+    'anderen', 'andern', 'anders', 'auch', 'auf', 'aus', 'bei', 'bin',
+    'bis', 'bist', 'da', 'damit', 'dann', 'das', 'dass', 'dazu', 'dem',
+    'den', 'der', 'des', 'dessen', 'die', 'dies', 'diese', 'diesem',
+    'diesen', 'dieser', 'dieses', 'doch', 'dort', 'durch', 'ein', 'eine',
+    'einem', 'einen', 'einer', 'eines', 'er', 'es', 'etwas', 'für',
+    'gegen', 'gewesen', 'hab', 'habe', 'haben', 'hat', 'hatte', 'hatten',
+    'hier', 'hin', 'hinter', 'ich', 'ihm', 'ihn', 'ihnen', 'ihr', 'ihre',
+    'ihrem', 'ihren', 'ihrer', 'ihres', 'im', 'in', 'indem', 'ins', 'ist',
+    'ja', 'kann', 'kein', 'keine', 'keinem', 'keinen', 'keiner', 'keines',
+    'können', 'könnte', 'machen', 'man', 'manche', 'manchen', 'mancher',
+    'manches', 'mein', 'meine', 'meinem', 'meinen', 'meiner', 'meines',
+    'mit', 'muss', 'musste', 'nach', 'nicht', 'nichts', 'noch', 'nun',
+    'nur', 'ob', 'oder', 'ohne', 'sehr', 'sein', 'seine', 'seinem',
+    'seinen', 'seiner', 'seines', 'selbst', 'sich', 'sie', 'sind', 'so',
+    'solche', 'solchem', 'solchen', 'solcher', 'solches', 'soll', 'sollte',
+    'sondern', 'sonst', 'über', 'um', 'und', 'uns', 'unse', 'unser',
+    'unsere', 'unserem', 'unseren', 'unserer', 'unseres', 'unter', 'viel',
+    'vom', 'von', 'vor', 'während', 'war', 'waren', 'warst', 'was', 'weg',
+    'weil', 'weiter', 'welche', 'welchem', 'welchen', 'welcher', 'welches',
+    'wenn', 'werde', 'werden', 'wie', 'wieder', 'will', 'wir', 'wird',
+    'wirst', 'wo', 'wollen', 'wollte', 'würde', 'würden', 'zu', 'zum',
+    'zur', 'zwar', 'zwischen'
+}
+TAG_NON_WORD = re.compile(r'[^A-Za-z0-9_\säöüß]')
+# "Erlkönig" and "Erlkoenig" are the same keyword
+GERMAN_FOLDING = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+FOLDED_TAG_STOP_WORDS = {word.translate(GERMAN_FOLDING) for word in TAG_STOP_WORDS}
+# A word in the title counts like this many occurrences in the text
+TAG_TITLE_BOOST = 2
+
+def tag_candidates(text):
+    """Yield (folded, surface) forms of the keyword candidates in a text"""
+    for word in TAG_NON_WORD.sub(' ', text.lower()).split():
+        if len(word) <= 3 or word.isdigit():
+            continue
+        folded = word.translate(GERMAN_FOLDING)
+        if folded not in FOLDED_TAG_STOP_WORDS:
+            yield folded, word
+
+def add_tags(articles, max_tags=5):
+    """Store the max_tags best keywords of every article in article['tags']
+    
+    Keywords are scored by TF-IDF over the whole corpus, so words common to
+    every article lose against the ones that set an article apart. Spellings
+    with and without umlauts or ß are counted as one keyword, which is
+    emitted in its most frequent spelling.
+    """
+    if not articles or max_tags <= 0:
+        return
+    
+    spellings = defaultdict(Counter)
+    documents = []
+    for article in articles:
+        term_counts = Counter()
+        for folded, word in tag_candidates(article.get('content', '')):
+            term_counts[folded] += 1
+            spellings[folded][word] += 1
+        for folded, word in tag_candidates(article.get('title', '')):
+            term_counts[folded] += TAG_TITLE_BOOST
+            spellings[folded][word] += 1
+        documents.append(term_counts)
+    
+    document_frequency = Counter(term for term_counts in documents for term in term_counts)
+    
+    for article, term_counts in zip(articles, documents):
+        scores = []
+        for term, count in term_counts.items():
+            # Like the runtime extraction, a single mention is not a keyword
+            if count < 2:
+                continue
+            idf = math.log((1 + len(articles)) / (1 + document_frequency[term])) + 1
+            scores.append((-(1 + math.log(count)) * idf, term))
+        article['tags'] = [spellings[term].most_common(1)[0][0] for _, term in heapq.nsmallest(max_tags, scores)]
+
+def build_tfidf_vectors(articles):
+    """L2-normalized TF-IDF vectors of title and cleaned content
+    
+    Terms come from the search tokenizer, term frequencies are dampened
+    (1 + log tf) and idf is smoothed. Returns one {term_id: weight} dict per
+    article and the vocabulary size.
+    """
+    vocabulary = {}
+    counts = []
+    for article in articles:
+        term_counts = Counter()
+        for term in tokenize_for_search(f"{article['title']} {article['content']}"):
+            term_counts[vocabulary.setdefault(term, len(vocabulary))] += 1
+        counts.append(term_counts)
+    
+    document_frequency = Counter(term_id for term_counts in counts for term_id in term_counts)
+    idf = {term_id: math.log((1 + len(articles)) / (1 + df)) + 1 for term_id, df in document_frequency.items()}
+    
+    vectors = []
+    for term_counts in counts:
+        weights = {term_id: (1 + math.log(count)) * idf[term_id] for term_id, count in term_counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+        vectors.append({term_id: weight / norm for term_id, weight in weights.items()})
+    
+    return vectors, len(vocabulary)
+
+def top_neighbours(row, k):
+    """Indices of the k highest positive scores in a dense row, ties by index"""
+    candidates = np.flatnonzero(row > 0)
+    if len(candidates) > k:
+        threshold = np.partition(row[candidates], -k)[-k]
+        candidates = candidates[row[candidates] >= threshold]
+    order = np.lexsort((candidates, -row[candidates]))
+    return [int(i) for i in candidates[order[:k]]]
+
+def related_with_scipy(vectors, vocabulary_size, k, block_size=512):
+    """Cosine top-k for all articles as sparse matrix products, block by block"""
+    rows, columns, weights = [], [], []
+    for row, vector in enumerate(vectors):
+        rows.extend([row] * len(vector))
+        columns.extend(vector.keys())
+        weights.extend(vector.values())
+    
+    matrix = sparse.csr_matrix((weights, (rows, columns)), shape=(len(vectors), vocabulary_size))
+    transposed = matrix.T.tocsc()
+    
+    related = []
+    for start in range(0, len(vectors), block_size):
+        scores = (matrix[start:start + block_size] @ transposed).toarray()
+        for offset, row in enumerate(scores):
+            row[start + offset] = 0  # An article is not related to itself
+            related.append(top_neighbours(row, k))
+    return related
+
+def related_pure_python(vectors, k):
+    """Cosine top-k for all articles via an inverted index of the vectors"""
+    postings = defaultdict(list)
+    for doc, vector in enumerate(vectors):
+        for term_id, weight in vector.items():
+            postings[term_id].append((doc, weight))
+    
+    related = []
+    for doc, vector in enumerate(vectors):
+        scores = defaultdict(float)
+        for term_id, weight in vector.items():
+            for other, other_weight in postings[term_id]:
+                scores[other] += weight * other_weight
+        scores.pop(doc, None)
+        best = heapq.nsmallest(k, ((-score, other) for other, score in scores.items() if score > 0))
+        related.append([other for _, other in best])
+    return related
+
+def add_related_articles(articles, k=5):
+    """Store the ids of the k most similar articles in article['related']
+    
+    Similarity is the cosine of the TF-IDF vectors. All neighbours are
+    computed in one batch here, so the app does no similarity work.
+    """
+    if not articles or k <= 0:
+        return
+    
+    start = time.perf_counter()
+    vectors, vocabulary_size = build_tfidf_vectors(articles)
+    if sparse is not None:
+        related, backend = related_with_scipy(vectors, vocabulary_size, k), 'scipy'
+    else:
+        related, backend = related_pure_python(vectors, k), 'pure Python'
+    
+    for article, neighbours in zip(articles, related):
+        article['related'] = [articles[other]['id'] for other in neighbours]
+    
+    print(f"🔗 Related articles for {len(articles)} articles ({vocabulary_size} terms, {backend}) "
+          f"in {time.perf_counter() - start:.2f}s")
+
+def write_if_changed(output_file, content, header_lines=0):
+    """Write a generated file unless it would be identical
+    
+    The first header_lines lines (e.g. a timestamp) are ignored in the
+    comparison. Leaving an unchanged file alone keeps its mtime, so the
+    Vite build cache stays valid. Returns True if the file was written.
+    """
+    if os.path.exists(output_file):
+        with open(output_file, 'r', encoding='utf-8') as f:
+            for _ in range(header_lines):
+                f.readline()
+            if f.read() == content.split('\n', header_lines)[-1]:
+                return False
+    
+    directory = os.path.dirname(output_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Integrate scraped zeiler.me content into the React app')
+    parser.add_argument('--input', default='scraped_data.json',
+                        help='Scraped data from scrape_zeiler.py (.json or streamed .ndjson)')
+    parser.add_argument('--follow', action='store_true',
+                        help='Keep reading an .ndjson input until the running crawl has finished')
+    parser.add_argument('--cleaning-stats', action='store_true',
+                        help='Report hit counts and time per boilerplate rule')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for cleaning articles (0 = one per CPU core)')
+    parser.add_argument('--chunk-size', type=int, default=50,
+                        help='Articles handed to a worker process at a time')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reuse cleaned content of articles unchanged since the last run')
+    parser.add_argument('--manifest-file', default='integration_manifest.json',
+                        help='Manifest used by --incremental')
+    parser.add_argument('--keep-duplicates', action='store_true',
+                        help='Keep articles whose content repeats an earlier article')
+    parser.add_argument('--duplicate-distance', type=int, default=3,
+                        help='Maximum SimHash distance in bits for two articles to count as duplicates')
+    parser.add_argument('--tags', type=int, default=5,
+                        help='Keywords extracted per article (0 to disable)')
+    parser.add_argument('--related', type=int, default=5,
+                        help='Related articles precomputed per article (0 to disable)')
+    parser.add_argument('--search-index', default=os.path.join('public', 'search-index.json'),
+                        help='Where to write the precomputed search index')
+    parser.add_argument('--completions', default=os.path.join('public', 'search-completions.json'),
+                        help='Where to write the search-as-you-type completion table')
+    parser.add_argument('--suggestions', type=int, default=8,
+                        help='Completions precomputed per prefix (0 to disable)')
+    parser.add_argument('--data-format', choices=DATA_FORMATS, default='js',
+                        help='Article modules as object literals (js) or column-wise (columnar)')
+    parser.add_argument('--precompress', action='store_true',
+                        help='Write .gz and .br variants next to every generated file in public/')
+    parser.add_argument('--format-report', action='store_true',
+                        help='Compare size and load time of both data formats')
+    parser.add_argument('--optimize-images', action='store_true',
+                        help='Add dimensions and resized WebP/AVIF variants to article images (needs Pillow)')
+    parser.add_argument('--image-widths', type=int, nargs='+', default=list(IMAGE_WIDTHS),
+                        help='Variant widths in pixels; images are never scaled up')
+    parser.add_argument('--image-formats', nargs='+', choices=list(IMAGE_FORMATS), default=list(IMAGE_FORMATS),
+                        help='Variant formats, in the order browsers should try them')
+    parser.add_argument('--image-dir', default=os.path.join('public', 'images'),
+                        help='Where to write the image variants')
+    parser.add_argument('--image-cache', default='image_cache.json',
+                        help='Cache of encoded images, keyed by content hash')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    print("🚀 Processing scraped content...")
+    
+    # Try to load scraped data first
+    records = iter(load_scraped_data(args.input, follow=args.follow))
+    first_record = next(records, None)
+    
+    if first_record is not None:
+        print(f"📄 Reading scraped articles from {args.input}")
+        workers = args.workers or os.cpu_count() or 1
+        manifest = IntegrationManifest(args.manifest_file) if args.incremental else None
+        near_duplicates = None if args.keep_duplicates else NearDuplicateIndex(args.duplicate_distance)
+        processed_articles = process_scraped_articles(itertools.chain([first_record], records),
+                                                      workers=workers, chunk_size=args.chunk_size,
+                                                      manifest=manifest, near_duplicates=near_duplicates)
+        if manifest is not None:
+            manifest.save()
+        if near_duplicates is not None and near_duplicates.duplicates:
+            print_duplicate_report(near_duplicates)
+        print(f"✅ Processed {len(processed_articles)} articles from scraped data")
+        if args.cleaning_stats:
+            get_content_cleaner().report()
+    else:
+        print("📝 No scraped data found, using test articles...")
+        processed_articles = generate_test_articles()
+        print(f"✅ Generated {len(processed_articles)} test articles")
+
+    add_tags(processed_articles, args.tags)
+    add_related_articles(processed_articles, args.related)
+    
+    if args.optimize_images:
+        if Image is None:
+            print("⚠️  Pillow is not installed (pip install pillow), skipping image optimization")
+        else:
+            formats = available_image_formats(args.image_formats)
+            for name in sorted(set(args.image_formats) - set(formats)):
+                print(f"⚠️  This Pillow build cannot encode {name.upper()}, skipping those variants")
+            encoded, cached = optimize_article_images(processed_articles, args.image_dir, sorted(args.image_widths),
+                                                      formats, workers=args.workers or os.cpu_count() or 1,
+                                                      cache_file=args.image_cache)
+            print(f"🖼️  Optimized {encoded} images into {args.image_dir} ({cached} unchanged, from {args.image_cache})")
+    
+    js_content = generate_articles_module(processed_articles, args.data_format)
+    
     # Create directory if it doesn't exist
     src_data_dir = os.path.join('src', 'data')
     if not os.path.exists(src_data_dir):
@@ -582,11 +1959,12 @@ export const articleStats = {{
     output_file = os.path.join(src_data_dir, 'articles_comprehensive.js')
     
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(js_content)
-        print(f"✅ Generated {output_file} with {len(processed_articles)} articles!")
+        if not write_if_changed(output_file, js_content, header_lines=1):
+            print(f"✅ {output_file} is up to date ({len(processed_articles)} articles), left untouched")
+        else:
+            print(f"✅ Generated {output_file} with {len(processed_articles)} articles!")
         
-        if scraped_data:
+        if first_record is not None:
             print("✅ Real scraped content integrated successfully!")
         else:
             print("✅ Test articles generated successfully!")
@@ -595,4 +1973,66 @@ export const articleStats = {{
     except Exception as e:
         print(f"❌ Error writing {output_file}: {e}")
         print("❌ Failed to generate articles!")
-        exit(1)
\ No newline at end of file
+        exit(1)
+    
+    # Shards first, so the manifest never points at a missing file
+    shards = build_content_shards(processed_articles)
+    page_shards = build_content_shards(processed_articles, render=article_page_entry, kind='page')
+    manifest_file = os.path.join(src_data_dir, 'articles_manifest.js')
+    
+    try:
+        written = write_content_shards(shards) + write_content_shards(page_shards)
+        if write_if_changed(manifest_file, generate_manifest_module(processed_articles, shards, page_shards,
+                                                                    args.data_format), header_lines=1):
+            print(f"📦 Generated {manifest_file} and {len(shards)} content shards plus article pages "
+                  f"({written} new) in {SHARDS_DIR}")
+        else:
+            print(f"📦 {manifest_file} is up to date, left untouched")
+        remove_stale_shards(shards, page_shards)
+    except Exception as e:
+        print(f"❌ Error writing content shards: {e}")
+        exit(1)
+    
+    search_index = build_search_index(processed_articles)
+    search_index_json = json.dumps(search_index, ensure_ascii=False, separators=(',', ':'))
+    
+    try:
+        if write_if_changed(args.search_index, search_index_json):
+            print(f"🔎 Generated {args.search_index} with {len(search_index['terms'])} terms, "
+                  f"{len(search_index['trigrams'])} trigrams "
+                  f"({len(search_index_json.encode('utf-8')) / 1024:.0f} KiB)")
+        else:
+            print(f"🔎 {args.search_index} is up to date, left untouched")
+    except Exception as e:
+        print(f"❌ Error writing {args.search_index}: {e}")
+        exit(1)
+    
+    if args.suggestions > 0:
+        completions = build_completion_table(search_index, k=args.suggestions)
+        completions_json = json.dumps(completions, ensure_ascii=False, separators=(',', ':'))
+        
+        try:
+            if write_if_changed(args.completions, completions_json):
+                print(f"🔤 Generated {args.completions} with {len(completions['prefixes'])} prefixes "
+                      f"for {len(completions['terms'])} terms "
+                      f"({len(completions_json.encode('utf-8')) / 1024:.0f} KiB)")
+            else:
+                print(f"🔤 {args.completions} is up to date, left untouched")
+        except Exception as e:
+            print(f"❌ Error writing {args.completions}: {e}")
+            exit(1)
+    
+    if args.precompress:
+        assets = [os.path.join(SHARDS_DIR, filename) for filename, _ in [*shards.values(), *page_shards.values()]]
+        assets.append(args.search_index)
+        if args.suggestions > 0:
+            assets.append(args.completions)
+        written = sum(precompress_asset(asset) for asset in assets)
+        suffixes = '/'.join(PRECOMPRESSED_SUFFIXES if brotli is not None else PRECOMPRESSED_SUFFIXES[:1])
+        print(f"📦 Wrote {written} precompressed {suffixes} files for {len(assets)} assets")
+    
+    if args.format_report:
+        report_data_formats(processed_articles, shards, page_shards)
+
+if __name__ == '__main__':
+    main()
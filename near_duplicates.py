@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection for Zeiler Redesign
+SimHash fingerprints with an LSH band index, shared by scrape_zeiler.py and integrate_content.py
+"""
+
+import hashlib
+import re
+import threading
+
+FINGERPRINT_BITS = 64
+FINGERPRINT_BYTES = FINGERPRINT_BITS // 8
+SHINGLE_SIZE = 3
+WORD = re.compile(r'\w+')
+# Translation tables mapping a byte to 1 if bit 0 (most significant) .. bit 7 is set
+BIT_TABLES = [bytes(1 if value & (0x80 >> bit) else 0 for value in range(256)) for bit in range(8)]
+
+
+def simhash(text):
+    """64-bit SimHash of the word 3-gram shingles of a text
+
+    Similar texts get fingerprints that differ in only a few bits. Instead
+    of adding +-1 per bit and shingle, the shingle hashes are concatenated
+    and the set bits of every byte position are counted at C speed with
+    bytes.translate and bytes.count.
+    """
+    words = WORD.findall(text.lower())
+    shingles = [' '.join(words[i:i + SHINGLE_SIZE]) for i in range(max(1, len(words) - SHINGLE_SIZE + 1))]
+    digests = b''.join(hashlib.blake2b(shingle.encode('utf-8'), digest_size=FINGERPRINT_BYTES).digest()
+                       for shingle in shingles)
+
+    fingerprint = 0
+    for position in range(FINGERPRINT_BYTES):
+        column = digests[position::FINGERPRINT_BYTES]
+        for bit, table in enumerate(BIT_TABLES):
+            if 2 * column.translate(table).count(1) > len(shingles):
+                fingerprint |= 1 << (FINGERPRINT_BITS - 1 - position * 8 - bit)
+    return fingerprint
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+
+class NearDuplicateIndex:
+    """Finds texts whose SimHash is within max_distance bits of an earlier one
+
+    Fingerprints are split into max_distance + 1 bands. Two fingerprints
+    that differ in at most max_distance bits agree completely on at least
+    one band, so only texts sharing a band value are compared and no pair
+    within the distance is missed. The first text of a cluster is its
+    canonical entry; later ones are recorded as its duplicates.
+    """
+
+    def __init__(self, max_distance=3):
+        self.max_distance = max_distance
+        band_count = max_distance + 1
+        edges = [round(i * FINGERPRINT_BITS / band_count) for i in range(band_count + 1)]
+        self.bands = [(start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])]
+        self.buckets = [{} for _ in self.bands]
+        self.fingerprints = {}
+        self.duplicates = {}
+        self.lock = threading.Lock()
+
+    def _band_values(self, fingerprint):
+        return [(fingerprint >> start) & mask for start, mask in self.bands]
+
+    def find(self, fingerprint):
+        """Key of the closest indexed text within max_distance, or None"""
+        best_key, best_distance = None, self.max_distance + 1
+        seen = set()
+        for buckets, value in zip(self.buckets, self._band_values(fingerprint)):
+            for key in buckets.get(value, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                distance = hamming_distance(fingerprint, self.fingerprints[key])
+                if distance < best_distance:
+                    best_key, best_distance = key, distance
+        return best_key
+
+    def add(self, key, fingerprint):
+        self.fingerprints[key] = fingerprint
+        for buckets, value in zip(self.buckets, self._band_values(fingerprint)):
+            buckets.setdefault(value, []).append(key)
+
+    def check(self, key, text):
+        """Return the canonical key if text duplicates an indexed one, else index it
+
+        Safe to call from several threads; the lookup and the insert happen
+        under one lock so two copies cannot both become canonical.
+        """
+        return self.check_fingerprint(key, simhash(text))
+
+    def check_fingerprint(self, key, fingerprint):
+        """Like check, for a fingerprint computed elsewhere (e.g. in a worker process)"""
+        with self.lock:
+            if key in self.fingerprints:
+                return None
+
+            canonical = self.find(fingerprint)
+            if canonical is None:
+                self.add(key, fingerprint)
+                return None
+
+            self.duplicates.setdefault(canonical, []).append(key)
+            return canonical
+
+    def duplicate_count(self):
+        return sum(len(keys) for keys in self.duplicates.values())
+
+    def clusters(self):
+        """{canonical key: [duplicate keys]} for every cluster with duplicates"""
+        return {canonical: list(keys) for canonical, keys in self.duplicates.items()}
@@ -5,25 +5,1056 @@ Automatically downloads all content from the original zeiler.me website
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import argparse
+import asyncio
+import contextvars
+import cProfile
+import gzip
+import heapq
+import itertools
 import json
+import math
+import mimetypes
 import os
+import pstats
+import random
 import re
+import sqlite3
+import threading
 import time
-from urllib.parse import urljoin, urlparse
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from urllib.parse import quote, unquote, urljoin, urlparse, urlsplit, urlunsplit
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import hashlib
+import xml.etree.ElementTree as ET
+
+from near_duplicates import NearDuplicateIndex
+
+# Stages of the single-fetch page pipeline, in execution order
+PIPELINE_STAGES = ('fetch', 'parse', 'metadata', 'links', 'content', 'dedupe', 'images',
+                   'image_download', 'images_wait')
+
+# Metrics record of the page being processed in the current thread or task
+CURRENT_PAGE = contextvars.ContextVar('current_page', default=None)
+
+# Tags the extractors read; a selective parse builds only these subtrees
+SELECTIVE_TAGS = ['title', 'a', 'img', 'main']
+MAIN_TAG = re.compile(rb'<main[\s>]', re.IGNORECASE)
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+              'Chrome/91.0.4472.124 Safari/537.36')
+# Responses worth retrying: request timeout, rate limiting, transient server errors
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+# Links to these files are never crawled
+SKIPPED_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.css', '.js')
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+# Characters left unescaped when a path is re-quoted (RFC 3986 pchar plus '/')
+PATH_SAFE = "/-._~!$&'()*+,;=:@"
+# Articles live at /<author>/<category>/<slug>; shallower pages are hubs
+ARTICLE_DEPTH = 3
+
+
+def available_parsers():
+    """Tree builders BeautifulSoup can use here, fastest first"""
+    parsers = []
+    try:
+        import lxml  # noqa: F401
+        parsers.append('lxml')
+    except ImportError:
+        pass
+    parsers.append('html.parser')
+    return parsers
+
+
+# Fields kept in memory per article when the full records are streamed to disk
+SUMMARY_FIELDS = ('id', 'url', 'title', 'author', 'category', 'word_count')
+
+
+def canonicalize_url(url):
+    """Reduce the variants of a page URL to one canonical form
+    
+    Scheme and host are lowercased and default ports dropped. The query
+    string and fragment are removed, since on Google Sites they only pick
+    a view of the same page (``?authuser=0``, ``?view=print``, tracking
+    parameters). The path is percent-decoded, lowercased (Google Sites
+    paths are case-insensitive) and re-quoted, repeated slashes are merged
+    and a trailing slash is removed.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.hostname or ''
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parts.port}"
+    
+    path = quote(unquote(parts.path).lower(), safe=PATH_SAFE)
+    path = re.sub(r'/{2,}', '/', path).rstrip('/')
+    return urlunsplit((scheme, netloc, path, '', ''))
+
+
+def parse_lastmod(text):
+    """Parse a sitemap <lastmod> (W3C datetime) into a naive local datetime
+    
+    A date without a time stands for the whole day, so it is read as the
+    end of that day: a page changed later that day is not taken as fresh.
+    Unparseable values give None.
+    """
+    text = (text or '').strip()
+    try:
+        if len(text) == 10:
+            return datetime.fromisoformat(text) + timedelta(days=1)
+        lastmod = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if lastmod.tzinfo is not None:
+        lastmod = lastmod.astimezone().replace(tzinfo=None)
+    return lastmod
+
+
+def iter_sitemap(stream):
+    """Stream-parse a sitemap, yielding (kind, loc, lastmod) per entry
+    
+    kind is 'url' for pages of a <urlset> and 'sitemap' for the children
+    of a <sitemapindex>. Elements are cleared once read, so memory stays
+    flat for sitemaps with tens of thousands of URLs.
+    """
+    fields = {}
+    for _, elem in ET.iterparse(stream):
+        tag = elem.tag.rpartition('}')[2]
+        if tag in ('loc', 'lastmod'):
+            fields[tag] = (elem.text or '').strip()
+        elif tag in ('url', 'sitemap'):
+            if fields.get('loc'):
+                yield tag, fields['loc'], parse_lastmod(fields.get('lastmod'))
+            fields = {}
+            elem.clear()
+
+
+def url_priority(url):
+    """Frontier priority of a URL, lower is fetched first
+    
+    Likely articles (/detlef/<category>/<slug>) come first, then category
+    pages, then section pages and the homepage. Hubs are still crawled for
+    their links once no article is queued, but the page budget goes to
+    articles.
+    """
+    depth = len([segment for segment in urlsplit(url).path.split('/') if segment])
+    return max(ARTICLE_DEPTH - depth, 0)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter for asyncio tasks"""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and consume it"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostBudget:
+    """Politeness budget for one host: max in-flight requests and a request rate"""
+
+    def __init__(self, max_in_flight=2, rate=2.0, burst=1):
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+        self.bucket = TokenBucket(rate, burst)
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            await self.bucket.acquire()
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+
+
+class PageBudgetExhausted(Exception):
+    """Raised for a page that would exceed --max-pages once its article is kept"""
+
+
+class PageSlots:
+    """Remaining article budget of a concurrent crawl
+
+    Pages are processed in threads while other workers keep articles, so a
+    page claims its slot before its images are queued and its cache entry
+    is written, not after the work is done. A slot stays claimed until the
+    worker has kept the article (or dropped the page).
+    """
+
+    def __init__(self, max_pages, kept):
+        self.max_pages = max_pages
+        self.kept = kept
+        self.claimed = set()
+        self.lock = threading.Lock()
+
+    def claim(self, url):
+        with self.lock:
+            if self.kept() + len(self.claimed) >= self.max_pages:
+                raise PageBudgetExhausted(url)
+            self.claimed.add(url)
+
+    def release(self, url):
+        with self.lock:
+            self.claimed.discard(url)
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of a sorted, non-empty list"""
+    rank = math.ceil(p / 100 * len(sorted_values))
+    return sorted_values[min(len(sorted_values) - 1, max(rank - 1, 0))]
+
+
+def available_encodings():
+    """Content encodings requests can decode here; br needs brotli or brotlicffi"""
+    encodings = ['gzip', 'deflate']
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+            encodings.append('br')
+            break
+        except ImportError:
+            pass
+    return encodings
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request while a host's circuit is open"""
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker
+    
+    After ``threshold`` consecutive failed attempts the circuit opens and
+    no requests go to the host for ``cooldown`` seconds. Then a single
+    probe is let through (half-open): success closes the circuit, failure
+    opens it again for twice as long, up to ``max_cooldown``.
+    """
+
+    def __init__(self, threshold=5, cooldown=10.0, max_cooldown=300.0):
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.failures = 0
+        self.open_until = None
+        self.probing = False
+        self.opened = 0
+        self.lock = threading.Lock()
+
+    def wait_time(self):
+        """Seconds until a request may be sent; 0 lets this request through"""
+        with self.lock:
+            if self.open_until is None:
+                return 0.0
+            remaining = self.open_until - time.monotonic()
+            if remaining > 0:
+                return remaining
+            if self.probing:
+                # Another request is probing the host; wait for its outcome
+                return 0.1
+            self.probing = True
+            return 0.0
+
+    def success(self):
+        with self.lock:
+            self.failures = 0
+            self.open_until = None
+            self.probing = False
+            self.cooldown = self.base_cooldown
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.probing:
+                self.probing = False
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            elif self.open_until is not None or self.failures < self.threshold:
+                return
+            self.open_until = time.monotonic() + self.cooldown
+            self.opened += 1
+
+
+class HttpClient:
+    """Pooled keep-alive HTTP client with retries, rate-limit handling and metrics
+    
+    All requests of the crawl go through one requests.Session whose
+    connection pool holds ``pool_size`` keep-alive connections per host.
+    Responses may be gzip, deflate or, with brotli installed, br encoded.
+    
+    Timeouts, connection errors and RETRY_STATUSES are retried up to
+    ``max_retries`` times with exponential backoff and full jitter. A
+    Retry-After header (on 429 and 503) replaces the backoff and pauses
+    the whole host, not only the request that got it. Failed attempts feed
+    a CircuitBreaker per host, so an origin that is down is not hammered
+    by every worker at once; requests wait while the circuit is open.
+    """
+
+    def __init__(self, pool_size=10, timeout=10.0, max_retries=4, backoff=0.5, max_backoff=30.0,
+                 max_retry_after=300.0, breaker_threshold=5, breaker_cooldown=10.0, user_agent=USER_AGENT):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
 
-class ZeilerScraper:
-    def __init__(self, base_url="https://www.zeiler.me"):
-        self.base_url = base_url
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': user_agent,
+            'Accept-Encoding': ', '.join(available_encodings()),
+            'Connection': 'keep-alive'
         })
+
+        self.breakers = {}
+        self.paused_until = {}
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.stats = {'requests': 0, 'attempts': 0, 'retries': 0, 'failed': 0, 'waited': 0.0}
+        self.retry_reasons = {}
+
+    def breaker(self, host):
+        with self.lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(self.breaker_threshold, self.breaker_cooldown)
+            return self.breakers[host]
+
+    def wait_for_host(self, host, breaker):
+        """Sleep while the host is paused by Retry-After or its circuit is open"""
+        while True:
+            with self.lock:
+                delay = self.paused_until.get(host, 0.0) - time.monotonic()
+            if delay <= 0:
+                delay = breaker.wait_time()
+            if delay <= 0:
+                return
+            with self.lock:
+                self.stats['waited'] += delay
+            time.sleep(delay)
+
+    def pause_host(self, host, seconds):
+        with self.lock:
+            self.paused_until[host] = max(self.paused_until.get(host, 0.0), time.monotonic() + seconds)
+
+    def backoff_delay(self, attempt):
+        """Full jitter: uniform between 0 and the exponential backoff cap"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def record_retry(self, reason):
+        with self.lock:
+            self.stats['retries'] += 1
+            self.retry_reasons[reason] = self.retry_reasons.get(reason, 0) + 1
+
+    def get(self, url, **kwargs):
+        """GET with retries; returns the final response or raises the last error
+        
+        Accepts the keyword arguments of requests.Session.get. A response
+        that is still retryable after the last attempt is returned as is,
+        so callers see its status through raise_for_status.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlsplit(url).netloc
+        breaker = self.breaker(host)
+        with self.lock:
+            self.stats['requests'] += 1
+
+        for attempt in range(self.max_retries + 1):
+            self.wait_for_host(host, breaker)
+            last_attempt = attempt == self.max_retries
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                breaker.failure()
+                if last_attempt:
+                    with self.lock:
+                        self.stats['failed'] += 1
+                    raise
+                self.record_retry(type(e).__name__)
+                time.sleep(self.backoff_delay(attempt))
+                continue
+            except requests.RequestException:
+                # Not retried, but a half-open probe must still report its outcome
+                breaker.failure()
+                with self.lock:
+                    self.stats['failed'] += 1
+                raise
+            finally:
+                with self.lock:
+                    self.stats['attempts'] += 1
+                    self.latencies.append(time.perf_counter() - start)
+
+            if response.status_code not in RETRY_STATUSES:
+                breaker.success()
+                return response
+
+            # Rate limiting shows the host is up; it is handled by Retry-After, not the breaker
+            if response.status_code == 429:
+                breaker.success()
+            else:
+                breaker.failure()
+            if last_attempt:
+                with self.lock:
+                    self.stats['failed'] += 1
+                return response
+
+            self.record_retry(str(response.status_code))
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            response.close()
+            if retry_after is not None:
+                self.pause_host(host, min(retry_after, self.max_retry_after))
+            else:
+                time.sleep(self.backoff_delay(attempt))
+
+    def latency_percentiles(self, percentiles=(50, 90, 99)):
+        """Attempt latencies in seconds at the given percentiles (nearest rank)"""
+        with self.lock:
+            latencies = sorted(self.latencies)
+        if not latencies:
+            return {}
+        return {p: percentile(latencies, p) for p in percentiles}
+
+    def print_summary(self):
+        """Print request, retry and latency metrics of the crawl"""
+        stats = self.stats
+        if not stats['requests']:
+            return
+        reasons = ', '.join(f"{reason}: {count}" for reason, count in sorted(self.retry_reasons.items()))
+        print(f"HTTP: {stats['requests']} requests, {stats['attempts']} attempts, "
+              f"{stats['retries']} retries{f' ({reasons})' if reasons else ''}, {stats['failed']} failed")
+        latency = ', '.join(f"p{p} {seconds * 1000:.0f}ms" for p, seconds in self.latency_percentiles().items())
+        opened = sum(breaker.opened for breaker in self.breakers.values())
+        print(f"  latency {latency}; waited {stats['waited']:.1f}s for rate limits and open circuits; "
+              f"circuit opened {opened} times")
+
+
+class CrawlMetrics:
+    """Per-stage and per-page instrumentation of a crawl
+    
+    Every timed pipeline stage adds a sample to its stage. While a page is
+    tracked (track_page), its stage times, HTTP status and size also go
+    into that page's record; the record travels in a context variable, so
+    stages running in asyncio.to_thread threads and image downloads are
+    attributed correctly.
+    
+    With a filename, page records and image downloads are streamed as JSON
+    lines ('jsonl'), or the aggregate is written in the Prometheus text
+    format ('prometheus') when the crawl is closed.
+    """
+
+    def __init__(self, filename=None, output_format='jsonl'):
+        self.filename = filename
+        self.output_format = output_format
+        self.samples = {}
+        self.totals = {'pages': 0, 'articles': 0, 'errors': 0, 'bytes': 0, 'images': 0, 'image_bytes': 0}
+        self.statuses = {}
+        # Responses with a body, i.e. everything but 304 Not Modified
+        self.downloads = 0
+        self.started = None
+        self.lock = threading.Lock()
+        self.file = None
+        if filename and output_format == 'jsonl':
+            self.file = open(filename, 'w', encoding='utf-8')
+
+    def record_stage(self, stage, seconds):
+        with self.lock:
+            self.samples.setdefault(stage, []).append(seconds)
+        page = CURRENT_PAGE.get()
+        if page is not None:
+            key = f"{stage}_ms"
+            page[key] = round(page.get(key, 0.0) + seconds * 1000, 3)
+
+    def record_response(self, response):
+        """Note status and size of the fetched page on the current page record"""
+        if response.status_code != 304:
+            with self.lock:
+                self.downloads += 1
+        page = CURRENT_PAGE.get()
+        if page is not None:
+            page['status'] = response.status_code
+            page['bytes'] = len(response.content)
+
+    @contextmanager
+    def track_page(self, url):
+        """Collect the record of one page; yields the record for the caller to complete"""
+        if self.started is None:
+            self.started = time.perf_counter()
+        page = {'url': url, 'status': None, 'bytes': 0, 'article': False}
+        token = CURRENT_PAGE.set(page)
+        start = time.perf_counter()
+        try:
+            yield page
+        except PageBudgetExhausted:
+            page['over_budget'] = True
+            raise
+        except Exception as e:
+            page['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            CURRENT_PAGE.reset(token)
+            page['total_ms'] = round((time.perf_counter() - start) * 1000, 3)
+            self.finish_page(page)
+
+    def finish_page(self, page):
+        with self.lock:
+            self.totals['pages'] += 1
+            self.totals['articles'] += page['article']
+            self.totals['errors'] += 'error' in page
+            self.totals['bytes'] += page['bytes']
+            status = str(page['status'] or 'none')
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.write({'kind': 'page', **page})
+
+    def record_image(self, url, seconds, size, error=None):
+        """Record an image download, tagged with the page that queued it
+        
+        Downloads usually finish after their page record has been written,
+        so the image record names the page instead of relying on it.
+        """
+        self.record_stage('image_download', seconds)
+        record = {'kind': 'image', 'url': url, 'bytes': size, 'download_ms': round(seconds * 1000, 3)}
+        page = CURRENT_PAGE.get()
+        if page is not None:
+            record['page'] = page['url']
+        if error:
+            record['error'] = error
+        with self.lock:
+            self.totals['images'] += 1
+            self.totals['image_bytes'] += size
+            self.write(record)
+
+    def write(self, record):
+        if self.file is not None:
+            self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def elapsed(self):
+        return time.perf_counter() - self.started if self.started is not None else 0.0
+
+    def print_summary(self):
+        """Print stage percentiles and crawl throughput"""
+        print("Pipeline stages:")
+        print(f"  {'stage':<15} {'calls':>6} {'total':>9} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+        for stage in PIPELINE_STAGES:
+            if stage not in self.samples:
+                continue
+            samples = sorted(self.samples[stage])
+            cells = ''.join(f" {percentile(samples, p) * 1000:7.2f}ms" for p in (50, 90, 99))
+            print(f"  {stage:<15} {len(samples):>6} {sum(samples):8.3f}s{cells} {samples[-1] * 1000:7.2f}ms")
+        
+        elapsed = self.elapsed()
+        if elapsed > 0:
+            totals = self.totals
+            print(f"Throughput: {totals['pages']} pages ({totals['articles']} articles, {totals['errors']} errors) "
+                  f"in {elapsed:.1f}s = {totals['pages'] / elapsed:.2f} pages/s, "
+                  f"{totals['bytes'] / 1024 / 1024 / elapsed:.2f} MiB/s")
+
+    def prometheus_text(self, http=None):
+        """The aggregate metrics in the Prometheus text exposition format"""
+        lines = [
+            '# HELP zeiler_stage_seconds Time spent per pipeline stage.',
+            '# TYPE zeiler_stage_seconds summary'
+        ]
+        for stage in PIPELINE_STAGES:
+            samples = sorted(self.samples.get(stage, ()))
+            if not samples:
+                continue
+            for p in (50, 90, 99):
+                lines.append(f'zeiler_stage_seconds{{stage="{stage}",quantile="{p / 100}"}} {percentile(samples, p):.6f}')
+            lines.append(f'zeiler_stage_seconds_sum{{stage="{stage}"}} {sum(samples):.6f}')
+            lines.append(f'zeiler_stage_seconds_count{{stage="{stage}"}} {len(samples)}')
+        
+        lines += ['# HELP zeiler_pages_total Pages processed, by HTTP status.', '# TYPE zeiler_pages_total counter']
+        lines += [f'zeiler_pages_total{{status="{status}"}} {count}' for status, count in sorted(self.statuses.items())]
+        for name, help_text in (('articles', 'Pages kept as articles.'), ('errors', 'Pages that failed.'),
+                                ('bytes', 'Page bytes fetched.'), ('images', 'Images downloaded.'),
+                                ('image_bytes', 'Image bytes downloaded.')):
+            lines += [f'# HELP zeiler_{name}_total {help_text}', f'# TYPE zeiler_{name}_total counter',
+                      f'zeiler_{name}_total {self.totals[name]}']
+        lines += ['# HELP zeiler_crawl_seconds Wall-clock duration of the crawl.', '# TYPE zeiler_crawl_seconds gauge',
+                  f'zeiler_crawl_seconds {self.elapsed():.3f}']
+        
+        if http is not None:
+            lines += ['# HELP zeiler_http_attempts_total HTTP attempts including retries.',
+                      '# TYPE zeiler_http_attempts_total counter',
+                      f"zeiler_http_attempts_total {http.stats['attempts']}",
+                      '# HELP zeiler_http_retries_total HTTP retries, by reason.',
+                      '# TYPE zeiler_http_retries_total counter']
+            lines += [f'zeiler_http_retries_total{{reason="{reason}"}} {count}'
+                      for reason, count in sorted(http.retry_reasons.items())]
+        return '\n'.join(lines) + '\n'
+
+    def close(self, http=None):
+        """Finish the JSON lines stream or write the Prometheus dump"""
+        if self.file is not None:
+            self.file.close()
+            print(f"Wrote crawl metrics to {self.filename}")
+        elif self.filename and self.output_format == 'prometheus':
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                f.write(self.prometheus_text(http))
+            print(f"Wrote crawl metrics to {self.filename}")
+
+
+def run_profiled(func, filename, limit=25):
+    """Run func under cProfile, save the stats to filename and print the top entries
+    
+    Only the calling thread is profiled, so parse_args rejects --profile
+    with --concurrent, where fetching and parsing happen in worker threads.
+    Image downloads run in their own pool and are never included.
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        profiler.dump_stats(filename)
+        print(f"\nProfile saved to {filename} (inspect with: python3 -m pstats {filename})")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(limit)
+
+
+class CrawlCache:
+    """On-disk cache of validators and results per URL for incremental re-crawls
+    
+    Every entry holds the ETag, Last-Modified and a SHA-256 of the page body
+    together with the article record and links extracted from it, so an
+    unchanged page can be reused without being parsed again.
+    """
+
+    def __init__(self, filename='crawl_cache.json'):
+        self.filename = filename
+        self.entries = {}
+        self.stats = {'not_modified': 0, 'unchanged': 0, 'changed': 0, 'sitemap_fresh': 0}
+        self.lock = threading.Lock()
+
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+                print(f"Loaded crawl cache with {len(self.entries)} URLs from {filename}")
+            except Exception as e:
+                print(f"Ignoring unreadable crawl cache {filename}: {e}")
+
+    def get(self, url):
+        return self.entries.get(url)
+
+    def count(self, outcome):
+        """Count a page outcome; pages are processed in asyncio.to_thread workers with --concurrent"""
+        with self.lock:
+            self.stats[outcome] += 1
+
+    def fresh_entry(self, url, lastmod):
+        """The cached entry of a URL if it was cached after its sitemap lastmod, else None"""
+        entry = self.entries.get(url)
+        if entry is None or lastmod is None:
+            return None
+        if lastmod > datetime.fromisoformat(entry['cached_at']):
+            return None
+        return entry
+
+    def conditional_headers(self, url):
+        """Build If-None-Match/If-Modified-Since headers for a cached URL"""
+        entry = self.entries.get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response, content_hash, article_data, links):
+        self.entries[url] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_hash': content_hash,
+            'article': article_data,
+            'links': sorted(links),
+            'cached_at': datetime.now().isoformat()
+        }
+
+    def save(self):
+        """Write the cache atomically so an interrupted run cannot corrupt it"""
+        tmp_filename = f"{self.filename}.tmp"
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_filename, self.filename)
+
+        print(f"Saved crawl cache with {len(self.entries)} URLs to {self.filename} "
+              f"({self.stats['sitemap_fresh']} skipped by sitemap lastmod, "
+              f"{self.stats['not_modified']} not modified, {self.stats['unchanged']} unchanged, "
+              f"{self.stats['changed']} new or changed)")
+
+
+class MemoryFrontier:
+    """In-memory crawl frontier that hands out every URL once
+    
+    URLs come out by priority (see url_priority), in discovery order
+    within a priority.
+    """
+
+    def __init__(self, priority=url_priority):
+        self.priority = priority
+        self.pending = []
+        self.seen = {}
+        self.counter = itertools.count()
+
+    def push(self, urls):
+        for url in urls:
+            if url not in self.seen:
+                entry = (self.priority(url), next(self.counter), url)
+                self.seen[url] = entry
+                heapq.heappush(self.pending, entry)
+
+    def pop(self):
+        return heapq.heappop(self.pending)[2] if self.pending else None
+
+    def done(self, url):
+        pass
+
+    def requeue(self, url):
+        heapq.heappush(self.pending, self.seen[url])
+
+    def add_article(self, article_data):
+        pass
+
+    def checkpoint(self):
+        pass
+
+    def __len__(self):
+        return len(self.pending)
+
+
+class CrawlState:
+    """SQLite-backed crawl frontier, visited set and results
+    
+    Drop-in replacement for MemoryFrontier that keeps the whole crawl on
+    disk. Work is committed every ``checkpoint_every`` pages, so a crawl
+    that stops for any reason resumes where it left off, and the frontier
+    is not bounded by memory. Pending URLs come out in the same order as
+    from MemoryFrontier, by priority and then discovery order.
+    """
+
+    def __init__(self, filename='crawl_state.sqlite3', checkpoint_every=10, priority=url_priority):
+        self.filename = filename
+        self.checkpoint_every = checkpoint_every
+        self.priority = priority
+        self.pages_since_checkpoint = 0
+
+        self.conn = sqlite3.connect(filename)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'pending'
+            );
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                url TEXT UNIQUE NOT NULL,
+                data TEXT NOT NULL
+            );
+        """)
+
+        # State files from before the priority frontier get the column and their queue ranked
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(urls)")]
+        if 'priority' not in columns:
+            self.conn.execute("ALTER TABLE urls ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+            pending = self.conn.execute("SELECT url FROM urls WHERE status != 'done'").fetchall()
+            self.conn.executemany("UPDATE urls SET priority = ? WHERE url = ?",
+                                  ((self.priority(url), url) for url, in pending))
+        self.conn.executescript("""
+            DROP INDEX IF EXISTS urls_status;
+            CREATE INDEX IF NOT EXISTS urls_queue ON urls (status, priority);
+        """)
+
+        # Pages that were in flight when the last run stopped go back to the frontier
+        self.conn.execute("UPDATE urls SET status = 'pending' WHERE status = 'in_progress'")
+        self.conn.commit()
+
+    def is_empty(self):
+        return self.conn.execute("SELECT 1 FROM urls LIMIT 1").fetchone() is None
+
+    def push(self, urls):
+        self.conn.executemany("INSERT OR IGNORE INTO urls (url, priority) VALUES (?, ?)",
+                              ((url, self.priority(url)) for url in urls))
+
+    def pop(self):
+        row = self.conn.execute(
+            "SELECT url FROM urls WHERE status = 'pending' ORDER BY priority, rowid LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+
+        self.conn.execute("UPDATE urls SET status = 'in_progress' WHERE url = ?", row)
+        return row[0]
+
+    def done(self, url):
+        self.conn.execute("UPDATE urls SET status = 'done' WHERE url = ?", (url,))
+        self.pages_since_checkpoint += 1
+        if self.pages_since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+    def requeue(self, url):
+        self.conn.execute("UPDATE urls SET status = 'pending' WHERE url = ?", (url,))
+
+    def add_article(self, article_data):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO articles (id, url, data) VALUES (?, ?, ?)",
+            (article_data['id'], article_data['url'], json.dumps(article_data, ensure_ascii=False))
+        )
+
+    def load_articles(self):
+        for (data,) in self.conn.execute("SELECT data FROM articles ORDER BY id"):
+            yield json.loads(data)
+
+    def checkpoint(self):
+        self.conn.commit()
+        self.pages_since_checkpoint = 0
+
+    def close(self):
+        self.checkpoint()
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM urls WHERE status = 'pending'").fetchone()[0]
+
+
+class NdjsonWriter:
+    """Streams scraped articles to a newline-delimited JSON file
+    
+    Records are written in id order as soon as they are complete, one per
+    line, and every line is flushed so readers can follow the file while the
+    crawl is still running. A final {"_end": true} line marks a finished
+    crawl.
+    """
+
+    def __init__(self, filename='scraped_data.ndjson'):
+        self.filename = filename
+        self.file = open(filename, 'w', encoding='utf-8')
+        self.lock = threading.Lock()
+        self.next_id = 1
+        self.waiting = {}
+        self.count = 0
+
+    def _write_line(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def write(self, record):
+        with self.lock:
+            self.waiting[record['id']] = record
+            while self.next_id in self.waiting:
+                self._write_line(self.waiting.pop(self.next_id))
+                self.next_id += 1
+                self.count += 1
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            for record_id in sorted(self.waiting):
+                self._write_line(self.waiting.pop(record_id))
+                self.count += 1
+            self._write_line({'_end': True, 'total_articles': self.count})
+            self.file.close()
+
+
+class ImageDownloader:
+    """Background pool that streams images into content-addressed storage
+    
+    Images are written to disk in chunks while being hashed and stored as
+    <sha256 prefix><ext>, so identical bytes served from different URLs are
+    kept once and different images can never overwrite each other. The
+    manifest maps every original URL to its stored file.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, http, assets_dir=os.path.join('src', 'assets'),
+                 manifest_file='image_manifest.json', workers=4, metrics=None):
+        self.http = http
+        self.metrics = metrics
+        self.assets_dir = assets_dir
+        self.manifest_file = manifest_file
+        self.workers = workers
+        self.executor = None
+        self.futures = {}
+        self.lock = threading.Lock()
+        self.stats = {'downloaded': 0, 'duplicates': 0, 'failed': 0}
+        self.manifest = {}
+
+        if os.path.exists(manifest_file):
+            try:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    self.manifest = json.load(f)
+            except Exception as e:
+                print(f"Ignoring unreadable image manifest {manifest_file}: {e}")
+
+    def submit(self, img_url):
+        """Schedule a download unless the URL is already stored or queued"""
+        with self.lock:
+            if img_url in self.manifest or img_url in self.futures:
+                return
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='images')
+            # In the context of the submitting thread, so the download is attributed to the tracked page
+            self.futures[img_url] = self.executor.submit(contextvars.copy_context().run, self.download, img_url)
+
+    def download(self, img_url):
+        """Stream one image to disk and store it under its content hash"""
+        os.makedirs(self.assets_dir, exist_ok=True)
+        tmp_path = os.path.join(self.assets_dir, f".download-{threading.get_ident()}.tmp")
+        digest = hashlib.sha256()
+        size = 0
+        start = time.perf_counter()
+
+        try:
+            with self.http.get(img_url, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                        digest.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+
+            ext = os.path.splitext(urlparse(img_url).path)[1].lower()
+            if not ext:
+                ext = mimetypes.guess_extension(content_type) or '.jpg'
+
+            sha256 = digest.hexdigest()
+            filename = f"{sha256[:16]}{ext}"
+            img_path = os.path.join(self.assets_dir, filename)
+
+            with self.lock:
+                if os.path.exists(img_path):
+                    os.remove(tmp_path)
+                    self.stats['duplicates'] += 1
+                else:
+                    os.replace(tmp_path, img_path)
+                    self.stats['downloaded'] += 1
+                    print(f"Downloaded image: {filename}")
+
+                self.manifest[img_url] = {'file': filename, 'sha256': sha256, 'bytes': size}
+            if self.metrics is not None:
+                self.metrics.record_image(img_url, time.perf_counter() - start, size)
+            return filename
+
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with self.lock:
+                self.stats['failed'] += 1
+            if self.metrics is not None:
+                self.metrics.record_image(img_url, time.perf_counter() - start, size, error=str(e))
+            print(f"Failed to download image {img_url}: {e}")
+            return None
+
+    def when_done(self, urls, callback):
+        """Call callback() once the downloads of all given URLs have finished"""
+        with self.lock:
+            pending = [self.futures[url] for url in set(urls) if url in self.futures]
+
+        if not pending:
+            callback()
+            return
+
+        remaining = [len(pending)]
+        counter_lock = threading.Lock()
+
+        def on_done(_):
+            with counter_lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
+                callback()
+
+        for future in pending:
+            future.add_done_callback(on_done)
+
+    def wait(self):
+        """Block until all scheduled downloads are done and save the manifest"""
+        if self.futures:
+            wait(list(self.futures.values()))
+            self.futures.clear()
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+        tmp_filename = f"{self.manifest_file}.tmp"
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_filename, self.manifest_file)
+
+    def resolve(self, images):
+        """Point image records at their stored files, dropping failed downloads"""
+        resolved = []
+        for img in images:
+            stored = self.manifest.get(img['original_url'])
+            if stored:
+                resolved.append(dict(img, src=stored['file']))
+        return resolved
+
+
+class ZeilerScraper:
+    def __init__(self, base_url="https://www.zeiler.me", crawl_cache=None, crawl_state=None, output=None,
+                 parser=None, selective=False, save_html_dir=None, near_duplicates=None, sitemap=False,
+                 http=None, metrics=None):
+        self.base_url = canonicalize_url(base_url)
+        self.crawl_cache = crawl_cache
+        self.crawl_state = crawl_state
+        self.output = output
+        self.parser = parser or available_parsers()[0]
+        self.selective = selective
+        self.save_html_dir = save_html_dir
+        self.near_duplicates = near_duplicates
+        self.sitemap = sitemap
+        self.sitemap_lastmod = {}
+        self.http = http or HttpClient()
         self.scraped_data = []
         self.visited_urls = set()
         self.images_downloaded = set()
+        # Set for the duration of a concurrent crawl
+        self.page_slots = None
+        self.metrics = metrics or CrawlMetrics()
+        self.image_downloader = ImageDownloader(self.http, metrics=self.metrics)
         
     def clean_text(self, text):
         """Clean and normalize text content"""
@@ -68,30 +1099,12 @@ class ZeilerScraper:
         
         return metadata
     
-    def download_image(self, img_url, filename):
-        """Download and save image"""
-        try:
-            response = self.session.get(img_url, timeout=10)
-            response.raise_for_status()
-            
-            # Create assets directory if it doesn't exist
-            assets_dir = os.path.join('src', 'assets')
-            os.makedirs(assets_dir, exist_ok=True)
-            
-            # Save image
-            img_path = os.path.join(assets_dir, filename)
-            with open(img_path, 'wb') as f:
-                f.write(response.content)
-            
-            print(f"Downloaded image: {filename}")
-            return True
-            
-        except Exception as e:
-            print(f"Failed to download image {img_url}: {e}")
-            return False
-    
     def extract_images(self, soup, base_url):
-        """Extract and download images from page"""
+        """Extract images from page and queue them for background download
+        
+        The returned records get their stored filename in finish_images()
+        once the downloads have completed.
+        """
         images = []
         
         for img in soup.find_all('img'):
@@ -102,29 +1115,32 @@ class ZeilerScraper:
             # Make URL absolute
             img_url = urljoin(base_url, src)
             
-            # Skip if already processed
-            if img_url in self.images_downloaded:
-                continue
-            
-            # Generate filename
-            parsed_url = urlparse(img_url)
-            filename = os.path.basename(parsed_url.path)
-            
-            # If no filename, generate one
-            if not filename or '.' not in filename:
-                filename = f"image_{hashlib.md5(img_url.encode()).hexdigest()[:8]}.jpg"
-            
-            # Download image
-            if self.download_image(img_url, filename):
-                images.append({
-                    'src': filename,
-                    'alt': img.get('alt', ''),
-                    'original_url': img_url
-                })
-                self.images_downloaded.add(img_url)
+            self.image_downloader.submit(img_url)
+            self.images_downloaded.add(img_url)
+            images.append({
+                'src': None,
+                'alt': img.get('alt', ''),
+                'original_url': img_url
+            })
         
         return images
     
+    def finish_images(self):
+        """Wait for background image downloads and resolve image records to stored files"""
+        with self.stage('images_wait'):
+            self.image_downloader.wait()
+        
+        articles = list(self.scraped_data)
+        if self.crawl_cache:
+            articles += [entry['article'] for entry in self.crawl_cache.entries.values() if entry['article']]
+        
+        for article in articles:
+            if 'images' in article:
+                article['images'] = self.image_downloader.resolve(article['images'])
+        
+        stats = self.image_downloader.stats
+        print(f"Images: {stats['downloaded']} stored, {stats['duplicates']} duplicates, {stats['failed']} failed")
+    
     def extract_content(self, soup):
         """Extract main content from page"""
         content = ""
@@ -159,78 +1175,251 @@ class ZeilerScraper:
         
         return content
     
-    def scrape_page(self, url):
-        """Scrape a single page"""
-        if url in self.visited_urls:
+    @contextmanager
+    def stage(self, name):
+        """Time a pipeline stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.metrics.record_stage(name, time.perf_counter() - start)
+    
+    def fetch_page(self, url):
+        """GET a page; every page of the crawl goes through here exactly once"""
+        headers = self.crawl_cache.conditional_headers(url) if self.crawl_cache else None
+        with self.stage('fetch'):
+            response = self.http.get(url, headers=headers)
+        self.metrics.record_response(response)
+        response.raise_for_status()
+        return response
+    
+    def reuse_fresh(self, url):
+        """Reuse a cached page the sitemap reports unchanged; (article_data, links) or None
+        
+        Needs a crawl cache (--incremental): pages whose sitemap lastmod is
+        not newer than their cache entry are taken from the cache without
+        any request.
+        """
+        if self.crawl_cache is None:
             return None
         
-        try:
-            print(f"Scraping: {url}")
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract metadata
+        entry = self.crawl_cache.fresh_entry(url, self.sitemap_lastmod.get(url))
+        if entry is None:
+            return None
+        
+        self.crawl_cache.count('sitemap_fresh')
+        return self.reuse_cached(url, entry)
+    
+    def process_response(self, url, response):
+        """Turn a fetched page into (article_data, links), reusing the crawl cache if unchanged"""
+        if self.save_html_dir and response.status_code == 200:
+            self.save_html(url, response.content)
+        
+        if self.crawl_cache is None:
+            return self.process_document(url, response.content, response.url)
+        
+        entry = self.crawl_cache.get(url)
+        if response.status_code == 304 and entry:
+            self.crawl_cache.count('not_modified')
+            return self.reuse_cached(url, entry)
+        
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if entry and entry['content_hash'] == content_hash:
+            self.crawl_cache.count('unchanged')
+            return self.reuse_cached(url, entry)
+        
+        # Pages over the budget raise here and are neither stored nor counted
+        article_data, links = self.process_document(url, response.content, response.url)
+        self.crawl_cache.store(url, response, content_hash, article_data, links)
+        self.crawl_cache.count('changed')
+        return article_data, links
+    
+    def reuse_cached(self, url, entry):
+        """Return the cached (article_data, links) of an unchanged page without parsing it"""
+        print(f"Unchanged: {url}")
+        links = {link for link in entry['links'] if link not in self.visited_urls}
+        
+        article_data = entry['article']
+        if not article_data or self.is_near_duplicate(url, article_data['content']):
+            return None, links
+        
+        article_data = dict(article_data, id=len(self.scraped_data) + 1)
+        self.images_downloaded.update(img['original_url'] for img in article_data['images'])
+        self.visited_urls.add(url)
+        return article_data, links
+    
+    def parse_document(self, html):
+        """Parse a page with the configured backend
+        
+        In selective mode only the subtrees the extractors read are built.
+        That is exact as long as the page has a <main> element, which
+        extract_content prefers; other pages are parsed in full.
+        """
+        if self.selective and MAIN_TAG.search(html):
+            soup = BeautifulSoup(html, self.parser, parse_only=SoupStrainer(SELECTIVE_TAGS))
+            if soup.find('main'):
+                return soup
+        
+        return BeautifulSoup(html, self.parser)
+    
+    def save_html(self, url, html):
+        """Keep the raw page as a fixture for offline benchmarks"""
+        path = urlparse(url).path.strip('/').replace('/', '__') or 'index'
+        if urlparse(url).query:
+            path += '_' + hashlib.md5(url.encode()).hexdigest()[:8]
+        
+        os.makedirs(self.save_html_dir, exist_ok=True)
+        with open(os.path.join(self.save_html_dir, f"{path}.html"), 'wb') as f:
+            f.write(html)
+    
+    def process_document(self, url, html, page_url=None):
+        """Run the extraction stages on one parsed document
+        
+        Returns (article_data, links). article_data is None for pages
+        without meaningful content, whose links are still followed.
+        Relative links are resolved against page_url, the address the page
+        was actually served from (after redirects), which can differ from
+        the canonical url, e.g. by a trailing slash.
+        """
+        with self.stage('parse'):
+            soup = self.parse_document(html)
+        
+        with self.stage('metadata'):
             metadata = self.extract_metadata(soup, url)
-            
-            # Extract content
+        
+        # Links must be collected before extract_content strips the navigation
+        with self.stage('links'):
+            links = self.find_article_links(soup, page_url or url)
+        
+        with self.stage('content'):
             content = self.extract_content(soup)
-            
-            # Skip if no meaningful content
-            if len(content.strip()) < 100:
-                print(f"Skipping {url} - insufficient content")
-                return None
-            
-            # Extract images
+        
+        # Skip if no meaningful content
+        if len(content.strip()) < 100:
+            print(f"Skipping {url} - insufficient content")
+            return None, links
+        
+        # Claimed before images are queued or the page is cached, so pages over the budget cost nothing more
+        if self.page_slots is not None:
+            self.page_slots.claim(url)
+        
+        # Checked before images are queued, so duplicates download nothing
+        if self.is_near_duplicate(url, content):
+            return None, links
+        
+        with self.stage('images'):
             images = self.extract_images(soup, url)
+        
+        # Calculate word count and reading time
+        word_count = len(content.split())
+        reading_time = max(1, round(word_count / 200))  # 200 words per minute
+        
+        # Create article data
+        article_data = {
+            'id': len(self.scraped_data) + 1,
+            'url': url,
+            'relative_url': url.replace(self.base_url, ''),
+            'title': metadata['title'],
+            'content': content,
+            'author': metadata['author'],
+            'category': metadata['category'],
+            'images': images,
+            'word_count': word_count,
+            'reading_time': reading_time,
+            'scraped_at': datetime.now().isoformat(),
+            'scraped_url': url
+        }
+        
+        self.visited_urls.add(url)
+        return article_data, links
+    
+    def is_near_duplicate(self, url, content):
+        """Check content against all pages kept so far; True if it repeats one of them"""
+        if self.near_duplicates is None:
+            return False
+        
+        with self.stage('dedupe'):
+            canonical = self.near_duplicates.check(url, content)
+        if canonical is None:
+            return False
+        
+        print(f"Skipping {url} - near duplicate of {canonical}")
+        return True
+    
+    def print_duplicate_summary(self):
+        """Print the clusters of near-duplicate pages that were collapsed"""
+        if not self.near_duplicates or not self.near_duplicates.duplicates:
+            return
+        
+        print(f"Near duplicates: {self.near_duplicates.duplicate_count()} pages collapsed into "
+              f"{len(self.near_duplicates.duplicates)} articles")
+        for canonical, duplicates in self.near_duplicates.clusters().items():
+            print(f"  {canonical}")
+            for url in duplicates:
+                print(f"    = {url}")
+    
+    def process_page(self, url):
+        """Fetch and parse a page once, returning (article_data, links)"""
+        if url in self.visited_urls:
+            return None, set()
+        
+        with self.metrics.track_page(url) as page:
+            try:
+                article_data, links = self.reuse_fresh(url) or self.fetch_and_process(url)
+            except Exception as e:
+                print(f"Error scraping {url}: {e}")
+                page['error'] = f"{type(e).__name__}: {e}"
+                return None, set()
             
-            # Calculate word count and reading time
-            word_count = len(content.split())
-            reading_time = max(1, round(word_count / 200))  # 200 words per minute
-            
-            # Create article data
-            article_data = {
-                'id': len(self.scraped_data) + 1,
-                'url': url,
-                'relative_url': url.replace(self.base_url, ''),
-                'title': metadata['title'],
-                'content': content,
-                'author': metadata['author'],
-                'category': metadata['category'],
-                'images': images,
-                'word_count': word_count,
-                'reading_time': reading_time,
-                'scraped_at': datetime.now().isoformat(),
-                'scraped_url': url
-            }
-            
-            self.visited_urls.add(url)
-            return article_data
-            
-        except Exception as e:
-            print(f"Error scraping {url}: {e}")
+            page['article'] = article_data is not None
+            return article_data, links
+    
+    def fetch_and_process(self, url):
+        """Fetch a page and turn it into (article_data, links)"""
+        print(f"Scraping: {url}")
+        response = self.fetch_page(url)
+        return self.process_response(url, response)
+    
+    def scrape_page(self, url):
+        """Scrape a single page"""
+        article_data, _ = self.process_page(url)
+        return article_data
+    
+    def print_stage_summary(self):
+        """Print the time spent per pipeline stage and the crawl throughput"""
+        self.metrics.print_summary()
+    
+    def canonical_link(self, url):
+        """Canonical form of a link on this site, or None for other sites
+        
+        http/https and www/bare-domain variants of the base host are mapped
+        onto the base URL, so every page has exactly one URL in the crawl.
+        """
+        parts = urlsplit(canonicalize_url(url))
+        base = urlsplit(self.base_url)
+        if parts.scheme not in DEFAULT_PORTS:
+            return None
+        if parts.netloc.removeprefix('www.') != base.netloc.removeprefix('www.'):
+            return None
+        if parts.path != base.path and not parts.path.startswith(base.path + '/'):
             return None
+        return urlunsplit((base.scheme, base.netloc, parts.path, '', ''))
     
     def find_article_links(self, soup, base_url):
-        """Find all article links on a page"""
+        """Find all article links on a page, in canonical form"""
         links = set()
         
         for link in soup.find_all('a', href=True):
-            href = link['href']
-            full_url = urljoin(base_url, href)
+            full_url = self.canonical_link(urljoin(base_url, link['href']))
             
             # Only include links from the same domain
-            if not full_url.startswith(self.base_url):
+            if full_url is None:
                 continue
             
-            # Skip certain file types and fragments
-            if any(full_url.endswith(ext) for ext in ['.pdf', '.jpg', '.png', '.gif', '.css', '.js']):
+            # Skip certain file types
+            if full_url.lower().endswith(SKIPPED_EXTENSIONS):
                 continue
             
-            if '#' in full_url:
-                full_url = full_url.split('#')[0]
-            
             # Skip if already visited
             if full_url in self.visited_urls:
                 continue
@@ -239,45 +1428,252 @@ class ZeilerScraper:
         
         return links
     
+    def sitemap_locations(self):
+        """Sitemap URLs listed in robots.txt, or the conventional /sitemap.xml"""
+        locations = []
+        try:
+            response = self.http.get(f"{self.base_url}/robots.txt")
+            if response.status_code == 200:
+                for line in response.text.splitlines():
+                    field, _, value = line.partition(':')
+                    if field.strip().lower() == 'sitemap' and value.strip():
+                        locations.append(value.strip())
+        except requests.RequestException as e:
+            print(f"Could not read robots.txt: {e}")
+        
+        return locations or [f"{self.base_url}/sitemap.xml"]
+    
+    def read_sitemaps(self):
+        """Collect {canonical url: lastmod} from the site's sitemaps
+        
+        Sitemap indexes are followed; every sitemap is streamed and parsed
+        incrementally, gzip-compressed ones (.gz) included. URLs of other
+        sites are dropped.
+        """
+        queue = deque(self.sitemap_locations())
+        seen = set()
+        
+        while queue:
+            location = queue.popleft()
+            if location in seen:
+                continue
+            seen.add(location)
+            
+            try:
+                with self.http.get(location, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    stream = response.raw
+                    if urlparse(location).path.endswith('.gz'):
+                        stream = gzip.GzipFile(fileobj=stream)
+                    
+                    for kind, loc, lastmod in iter_sitemap(stream):
+                        if kind == 'sitemap':
+                            queue.append(loc)
+                            continue
+                        url = self.canonical_link(loc)
+                        if url is not None:
+                            self.sitemap_lastmod[url] = lastmod
+            except (requests.RequestException, ET.ParseError, OSError) as e:
+                print(f"Could not read sitemap {location}: {e}")
+        
+        print(f"Sitemap: {len(self.sitemap_lastmod)} URLs from {len(seen)} sitemaps")
+        return list(self.sitemap_lastmod)
+    
+    def seed_urls(self):
+        """Start URLs of a new crawl: the homepage, plus the sitemap with --sitemap"""
+        if not self.sitemap:
+            return [self.base_url]
+        return [self.base_url] + self.read_sitemaps()
+    
+    def open_frontier(self):
+        """Return the crawl frontier, resuming a persisted crawl if there is one"""
+        if self.crawl_state is None:
+            frontier = MemoryFrontier()
+            frontier.push(self.seed_urls())
+            return frontier
+        
+        if self.crawl_state.is_empty():
+            self.crawl_state.push(self.seed_urls())
+            return self.crawl_state
+        
+        if self.sitemap:
+            # URLs the state already knows are ignored; new ones join the queue
+            self.crawl_state.push(self.read_sitemaps())
+        
+        for article_data in self.crawl_state.load_articles():
+            # Downloads that were still queued when the last run stopped
+            for img in article_data['images']:
+                self.image_downloader.submit(img['original_url'])
+            self.collect_article(article_data)
+            self.visited_urls.add(article_data['url'])
+            if self.near_duplicates is not None:
+                self.near_duplicates.check(article_data['url'], article_data['content'])
+        
+        print(f"Resuming crawl from {self.crawl_state.filename}: "
+              f"{len(self.scraped_data)} articles, {len(self.crawl_state)} URLs queued")
+        return self.crawl_state
+    
+    def collect_article(self, article_data):
+        """Keep a scraped article, or stream it out and keep only its summary fields"""
+        if self.output is None:
+            self.scraped_data.append(article_data)
+            return
+        
+        def write():
+            images = self.image_downloader.resolve(article_data['images'])
+            self.output.write(dict(article_data, images=images))
+        
+        # Written once the article's images are stored, so the record carries final filenames
+        self.image_downloader.when_done([img['original_url'] for img in article_data['images']], write)
+        self.scraped_data.append({key: article_data[key] for key in SUMMARY_FIELDS})
+    
+    def add_article(self, frontier, article_data):
+        """Append a scraped article and persist it with the crawl state"""
+        article_data['id'] = len(self.scraped_data) + 1
+        frontier.add_article(article_data)
+        self.collect_article(article_data)
+    
     def scrape_website(self, max_pages=100):
         """Scrape the entire website"""
         print(f"Starting to scrape {self.base_url}")
         
         # Start with the homepage
-        urls_to_visit = {self.base_url}
-        pages_scraped = 0
+        frontier = self.open_frontier()
         
-        while urls_to_visit and pages_scraped < max_pages:
-            url = urls_to_visit.pop()
+        while len(self.scraped_data) < max_pages:
+            url = frontier.pop()
+            if url is None:
+                break
             
-            # Scrape the page
-            article_data = self.scrape_page(url)
+            # Scrape the page and find more links to scrape from the same fetch
+            downloads = self.metrics.downloads
+            article_data, new_links = self.process_page(url)
             if article_data:
-                self.scraped_data.append(article_data)
-                pages_scraped += 1
-                print(f"Scraped {pages_scraped}/{max_pages}: {article_data['title'][:50]}...")
+                self.add_article(frontier, article_data)
+                print(f"Scraped {len(self.scraped_data)}/{max_pages}: {article_data['title'][:50]}...")
             
-            # Find more links to scrape
-            try:
-                response = self.session.get(url, timeout=10)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                new_links = self.find_article_links(soup, url)
-                urls_to_visit.update(new_links)
-            except Exception as e:
-                print(f"Error finding links on {url}: {e}")
+            frontier.push(new_links)
+            frontier.done(url)
             
-            # Be respectful - add delay
-            time.sleep(1)
+            # Be respectful - add delay after every download; pages reused from
+            # the crawl cache (sitemap lastmod, 304) cost the server nothing
+            if self.metrics.downloads > downloads:
+                time.sleep(1)
         
+        frontier.checkpoint()
+        self.finish_images()
         print(f"Scraping completed. Found {len(self.scraped_data)} articles.")
+        self.print_stage_summary()
+        self.http.print_summary()
+        self.print_duplicate_summary()
         return self.scraped_data
     
-    def save_data(self, filename='scraped_data.json'):
-        """Save scraped data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.scraped_data, f, ensure_ascii=False, indent=2)
+    async def _crawl_page_async(self, url, budget):
+        """Fetch a page within the host budget and process it off the event loop"""
+        with self.metrics.track_page(url) as page:
+            fresh = self.reuse_fresh(url)
+            if fresh is not None:
+                article_data, links = fresh
+            else:
+                async with budget:
+                    print(f"Scraping: {url}")
+                    response = await asyncio.to_thread(self.fetch_page, url)
+                article_data, links = await asyncio.to_thread(self.process_response, url, response)
+            
+            page['article'] = article_data is not None
+            return article_data, links
+    
+    async def scrape_website_async(self, max_pages=100, workers=8, max_in_flight=2, rate=2.0):
+        """Scrape the entire website with a bounded pool of asyncio workers
+        
+        Instead of a fixed delay between pages, every host gets a politeness
+        budget of at most ``max_in_flight`` concurrent requests and ``rate``
+        requests per second (token bucket).
+        """
+        print(f"Starting concurrent scrape of {self.base_url} ({workers} workers, "
+              f"{max_in_flight} in flight, {rate} req/s per host)")
+        
+        frontier = self.open_frontier()
+        budgets = {}
+        in_progress = 0
+        changed = asyncio.Condition()
+        
+        async def next_url():
+            """Wait for the next URL; None once the crawl is finished"""
+            nonlocal in_progress
+            async with changed:
+                while len(self.scraped_data) < max_pages:
+                    url = frontier.pop()
+                    if url is not None:
+                        in_progress += 1
+                        return url
+                    # Other workers may still discover links
+                    if in_progress == 0:
+                        break
+                    await changed.wait()
+                changed.notify_all()
+                return None
+        
+        async def worker():
+            nonlocal in_progress
+            while (url := await next_url()) is not None:
+                links = set()
+                over_budget = False
+                try:
+                    host = urlparse(url).netloc
+                    if host not in budgets:
+                        budgets[host] = HostBudget(max_in_flight, rate)
+                    
+                    if url not in self.visited_urls:
+                        article_data, links = await self._crawl_page_async(url, budgets[host])
+                        if article_data and len(self.scraped_data) >= max_pages:
+                            # Another worker used up the page budget; keep the URL for a resumed crawl
+                            over_budget = True
+                            self.visited_urls.discard(url)
+                        elif article_data:
+                            self.add_article(frontier, article_data)
+                            print(f"Scraped {len(self.scraped_data)}/{max_pages}: {article_data['title'][:50]}...")
+                except PageBudgetExhausted:
+                    # Fetched but not processed further; keep the URL for a resumed crawl
+                    over_budget = True
+                except Exception as e:
+                    print(f"Error scraping {url}: {e}")
+                finally:
+                    self.page_slots.release(url)
+                    async with changed:
+                        frontier.push(links)
+                        if over_budget:
+                            frontier.requeue(url)
+                        else:
+                            frontier.done(url)
+                        in_progress -= 1
+                        changed.notify_all()
         
-        print(f"Saved {len(self.scraped_data)} articles to {filename}")
+        self.page_slots = PageSlots(max_pages, lambda: len(self.scraped_data))
+        try:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            self.page_slots = None
+        
+        frontier.checkpoint()
+        await asyncio.to_thread(self.finish_images)
+        print(f"Scraping completed. Found {len(self.scraped_data)} articles.")
+        self.print_stage_summary()
+        self.http.print_summary()
+        self.print_duplicate_summary()
+        return self.scraped_data
+    
+    def save_data(self, filename='scraped_data.json'):
+        """Save scraped data to JSON file, or finish the NDJSON stream"""
+        if self.output is not None:
+            self.output.close()
+            print(f"Streamed {self.output.count} articles to {self.output.filename}")
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.scraped_data, f, ensure_ascii=False, indent=2)
+            
+            print(f"Saved {len(self.scraped_data)} articles to {filename}")
         
         # Also save a summary
         summary = {
@@ -285,6 +1681,7 @@ class ZeilerScraper:
             'categories': list(set(article['category'] for article in self.scraped_data if article['category'])),
             'authors': list(set(article['author'] for article in self.scraped_data if article['author'])),
             'total_words': sum(article['word_count'] for article in self.scraped_data),
+            'near_duplicates': self.near_duplicates.clusters() if self.near_duplicates else {},
             'scraped_at': datetime.now().isoformat()
         }
         
@@ -293,22 +1690,115 @@ class ZeilerScraper:
         
         print(f"Saved summary to scrape_summary.json")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description='Scrape all content from zeiler.me')
+    parser.add_argument('--base-url', default='https://www.zeiler.me',
+                        help='Site to crawl (e.g. a local stand-in of zeiler.me)')
+    parser.add_argument('--max-pages', type=int, default=50,
+                        help='Maximum number of articles to scrape')
+    parser.add_argument('--output-format', choices=['json', 'ndjson'], default='json',
+                        help='Write one JSON document at the end, or stream one record per line while crawling')
+    parser.add_argument('--output', default=None,
+                        help='Output file (default: scraped_data.json or scraped_data.ndjson)')
+    parser.add_argument('--concurrent', action='store_true',
+                        help='Use the asyncio crawl engine instead of the sequential crawl')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Number of concurrent crawl workers (with --concurrent)')
+    parser.add_argument('--max-in-flight', type=int, default=2,
+                        help='Maximum in-flight requests per host (with --concurrent)')
+    parser.add_argument('--rate', type=float, default=2.0,
+                        help='Maximum requests per second per host (with --concurrent)')
+    parser.add_argument('--parser', choices=available_parsers(), default=None,
+                        help='HTML parser backend (default: fastest installed)')
+    parser.add_argument('--selective-parse', action='store_true',
+                        help='Only build the parts of each page the extractors read')
+    parser.add_argument('--save-html', default=None, metavar='DIR',
+                        help='Save every fetched page to DIR, e.g. as benchmark fixtures')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Re-crawl with conditional requests and reuse unchanged pages from the crawl cache')
+    parser.add_argument('--cache-file', default='crawl_cache.json',
+                        help='Crawl cache used by --incremental')
+    parser.add_argument('--sitemap', action='store_true',
+                        help='Seed the crawl from sitemap.xml (and robots.txt Sitemap entries); '
+                             'with --incremental, pages whose lastmod predates their cache entry are not fetched')
+    parser.add_argument('--state-db', default=None,
+                        help='SQLite file holding frontier, visited URLs and results; '
+                             'an interrupted crawl resumes from it')
+    parser.add_argument('--checkpoint-every', type=int, default=10,
+                        help='Commit the crawl state every N pages (with --state-db)')
+    parser.add_argument('--pool-size', type=int, default=10,
+                        help='Keep-alive connections per host in the HTTP connection pool')
+    parser.add_argument('--timeout', type=float, default=10.0,
+                        help='Per-request timeout in seconds')
+    parser.add_argument('--max-retries', type=int, default=4,
+                        help='Retries for timeouts, connection errors, 429 and 5xx responses')
+    parser.add_argument('--backoff', type=float, default=0.5,
+                        help='Base delay in seconds of the exponential retry backoff (with jitter)')
+    parser.add_argument('--breaker-threshold', type=int, default=5,
+                        help='Consecutive failures after which requests to a host are paused')
+    parser.add_argument('--breaker-cooldown', type=float, default=10.0,
+                        help='Seconds a host is paused once its circuit breaker opens')
+    parser.add_argument('--metrics', default=None, metavar='FILE',
+                        help='Write per-page crawl metrics to FILE')
+    parser.add_argument('--metrics-format', choices=['jsonl', 'prometheus'], default='jsonl',
+                        help='One JSON record per page and image, or a Prometheus text dump at the end')
+    parser.add_argument('--profile', default=None, metavar='FILE',
+                        help='Run the crawl under cProfile and save the stats to FILE')
+    parser.add_argument('--keep-duplicates', action='store_true',
+                        help='Keep pages whose content repeats an earlier page')
+    parser.add_argument('--duplicate-distance', type=int, default=3,
+                        help='Maximum SimHash distance in bits for two pages to count as duplicates')
+    args = parser.parse_args()
+    if args.profile and args.concurrent:
+        parser.error('--profile only covers the calling thread, but --concurrent fetches and parses '
+                     'in worker threads; profile the sequential crawl instead')
+    return args
+
 def main():
-    scraper = ZeilerScraper()
+    args = parse_args()
+    crawl_cache = CrawlCache(args.cache_file) if args.incremental else None
+    crawl_state = CrawlState(args.state_db, args.checkpoint_every) if args.state_db else None
+    output_file = args.output or f"scraped_data.{args.output_format}"
+    output = NdjsonWriter(output_file) if args.output_format == 'ndjson' else None
+    near_duplicates = None if args.keep_duplicates else NearDuplicateIndex(args.duplicate_distance)
+    http = HttpClient(pool_size=args.pool_size, timeout=args.timeout, max_retries=args.max_retries,
+                      backoff=args.backoff, breaker_threshold=args.breaker_threshold,
+                      breaker_cooldown=args.breaker_cooldown)
+    metrics = CrawlMetrics(args.metrics, args.metrics_format)
+    scraper = ZeilerScraper(base_url=args.base_url, crawl_cache=crawl_cache,
+                            crawl_state=crawl_state, output=output, parser=args.parser,
+                            selective=args.selective_parse, save_html_dir=args.save_html,
+                            near_duplicates=near_duplicates, sitemap=args.sitemap, http=http,
+                            metrics=metrics)
     
     # Scrape the website
-    scraped_data = scraper.scrape_website(max_pages=50)  # Limit to 50 pages for now
+    def crawl():
+        if args.concurrent:
+            return asyncio.run(scraper.scrape_website_async(
+                max_pages=args.max_pages,
+                workers=args.workers,
+                max_in_flight=args.max_in_flight,
+                rate=args.rate
+            ))
+        return scraper.scrape_website(max_pages=args.max_pages)
+    
+    scraped_data = run_profiled(crawl, args.profile) if args.profile else crawl()
     
     # Save the data
-    scraper.save_data()
+    scraper.save_data(output_file)
+    metrics.close(http)
+    if crawl_cache:
+        crawl_cache.save()
+    if crawl_state:
+        crawl_state.close()
     
     print("\n" + "="*50)
     print("SCRAPING COMPLETED")
     print("="*50)
     print(f"Total articles scraped: {len(scraped_data)}")
-    print(f"Total images downloaded: {len(scraper.images_downloaded)}")
+    print(f"Total images downloaded: {scraper.image_downloader.stats['downloaded']}")
     print("\nNext steps:")
-    print("1. Run 'python3 integrate_content.py' to process the scraped data")
+    print(f"1. Run 'python3 integrate_content.py --input {output_file}' to process the scraped data")
     print("2. The processed data will be saved to 'src/data/articles_comprehensive.js'")
 
 if __name__ == '__main__':
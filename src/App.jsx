@@ -1,4 +1,4 @@
-import { useState } from 'react'
+import { useRef, useState } from 'react'
 import React from 'react'
 import { HashRouter as Router, Routes, Route, useLocation } from 'react-router-dom'
 import Header from './components/Header.jsx'
@@ -10,31 +10,70 @@ import ArticlePageMarkdown from './components/ArticlePageMarkdown.jsx'
 import CategoryPage from './components/CategoryPage.jsx'
 import { Button } from '@/components/ui/button.jsx'
 import { Search, BookOpen, Code, History, Users } from 'lucide-react'
-import { articles } from './data/articles_comprehensive.js'
+import { articles, loadArticleContent } from './data/articles_manifest.js'
+import { ArticleSearchIndex } from './utils/SearchIndex'
 import './App.css'
 
+// Angezeigte Treffer je Suche
+const SEARCH_LIMIT = 24
+
+let searchIndexRequest = null
+
+// Vorberechneten Suchindex (public/search-index.json) einmal laden; die
+// Volltexte fehlen im Manifest und werden für die Textausschnitte der
+// Treffer aus den Shards nachgeladen
+function loadSearchIndex() {
+  if (!searchIndexRequest) {
+    const documents = articles.map(article => ({ ...article, id: String(article.id), content: '' }))
+    searchIndexRequest = ArticleSearchIndex.fromUrl(documents).catch(error => {
+      searchIndexRequest = null
+      throw error
+    })
+  }
+  return searchIndexRequest
+}
+
 function HomePage() {
   // Search functionality moved to HomePage only
   const [searchTerm, setSearchTerm] = useState('')
   const [searchResults, setSearchResults] = useState([])
+  const [searchTotal, setSearchTotal] = useState(0)
+  const latestSearch = useRef('')
 
-  const handleSearch = (term) => {
+  const handleSearch = async (term) => {
     setSearchTerm(term)
+    latestSearch.current = term
     if (term.trim()) {
-      const results = articles.filter(article => {
-        const searchableText = [
-          article.title,
-          article.excerpt,
-          article.content,
-          article.author,
-          article.category
-        ].join(' ').toLowerCase();
-        
-        return searchableText.includes(term.toLowerCase());
-      });
+      let searchIndex
+      try {
+        searchIndex = await loadSearchIndex()
+      } catch (error) {
+        console.error('Fehler beim Laden des Suchindex:', error)
+        return
+      }
+      if (latestSearch.current !== term) return
+
+      const { results, total } = searchIndex.search({ query: term, limit: SEARCH_LIMIT })
       setSearchResults(results)
+      setSearchTotal(total)
+
+      // Bis der Inhalt geladen ist, dient der Auszug als Textausschnitt
+      const pending = results.filter(({ article }) => !article.content)
+      if (pending.length === 0) return
+      try {
+        await Promise.all(pending.map(async ({ article }) => {
+          article.content = await loadArticleContent(article)
+        }))
+      } catch (error) {
+        console.error('Fehler beim Laden der Artikelinhalte:', error)
+        return
+      }
+      if (latestSearch.current !== term) return
+      searchIndex.addSnippets(results)
+      setSearchResults([...results])
     } else {
       setSearchResults([])
+      setSearchTotal(0)
     }
   }
 
@@ -96,18 +135,19 @@ function HomePage() {
           <section className="py-16">
             <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
               <h2 className="text-3xl font-bold text-gray-900 mb-8">
-                Suchergebnisse ({searchResults.length})
+                Suchergebnisse ({searchTotal})
               </h2>
               <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6">
-                {searchResults.map((article) => (
+                {searchResults.map(({ article, snippet }) => (
                   <ArticleCard 
                     key={article.id} 
                     title={article.title}
                     excerpt={article.excerpt}
+                    snippet={snippet}
                     author={article.author}
                     date="2024"
                     href={article.display_url} // Hier die display_url verwenden
-                    image={article.images && article.images.length > 0 ? `/src/assets/${article.images[0]}` : null}
+                    image={article.image}
                   />
                 ))}
               </div>
@@ -166,7 +206,7 @@ function HomePage() {
                     author={article.author}
                     date="2024"
                     href={article.display_url} // Hier die display_url verwenden
-                    image={article.images && article.images.length > 0 ? `/src/assets/${article.images[0]}` : null}
+                    image={article.image}
                   />
                 ))}
               </div>
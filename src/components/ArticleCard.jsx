@@ -2,7 +2,20 @@ import { Calendar, User, ArrowRight } from 'lucide-react'
 import { Link } from 'react-router-dom'
 import { Button } from '@/components/ui/button.jsx'
 
-const ArticleCard = ({ title, excerpt, author, date, href, image }) => {
+// Textausschnitt eines Suchtreffers mit markierten Begriffen
+const renderSnippet = ({ text, highlights }) => {
+  const parts = []
+  let last = 0
+  highlights.forEach(([start, end]) => {
+    parts.push(text.slice(last, start))
+    parts.push(<mark key={start} className="bg-yellow-100 text-gray-900">{text.slice(start, end)}</mark>)
+    last = end
+  })
+  parts.push(text.slice(last))
+  return parts
+}
+
+const ArticleCard = ({ title, excerpt, snippet, author, date, href, image }) => {
   // Convert hash-based URLs to React Router paths
   const routerPath = href ? href.replace('/#', '') : '#'
   
@@ -23,7 +36,11 @@ const ArticleCard = ({ title, excerpt, author, date, href, image }) => {
           {title}
         </h3>
         
-        {excerpt && (
+        {snippet ? (
+          <p className="text-gray-600 mb-4 line-clamp-3">
+            {renderSnippet(snippet)}
+          </p>
+        ) : excerpt && (
           <p className="text-gray-600 mb-4 line-clamp-3">
             {excerpt}
           </p>
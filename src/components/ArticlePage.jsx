@@ -3,10 +3,14 @@ import { useParams } from 'react-router-dom'
 import Header from './Header.jsx'
 import Footer from './Footer.jsx'
 import Breadcrumbs from './Breadcrumbs.jsx'
-import { getArticleByUrl } from '../data/articles_comprehensive.js'
+import ArticleCard from './ArticleCard.jsx'
+import { getArticleById, getArticleByUrl, loadArticlePage } from '../data/articles_manifest.js'
 import { Calendar, User, ArrowLeft, Clock, Tag } from 'lucide-react'
 import { Button } from '@/components/ui/button.jsx'
 
+// Anzeigebreite der Artikelbilder (Spalte max-w-4xl abzüglich Innenabstand)
+const IMAGE_SIZES = '(min-width: 56rem) 52rem, 100vw'
+
 function ArticlePage() {
   const { '*': urlPath } = useParams()
   const [article, setArticle] = useState(null)
@@ -16,58 +20,31 @@ function ArticlePage() {
     // Entferne den führenden Slash, falls vorhanden, um die URL zu normalisieren
     const normalizedUrlPath = urlPath.startsWith('/') ? urlPath.substring(1) : urlPath;
     const foundArticle = getArticleByUrl(normalizedUrlPath);
-    setArticle(foundArticle)
-    setLoading(false)
-  }, [urlPath])
-
-  const renderParagraphs = (content) => {
-    if (!content) return null
-
-    // Teile Content in Blöcke und verarbeite eingebettete Zitate
-    const blocks = []
-    const paragraphs = content.split(/\n{2,}/).filter(para => para.trim())
-
-    paragraphs.forEach(paragraph => {
-      let text = paragraph.trim()
-      const quoteRegex = /[„"][^"""]+[""]/
-      let match
-
-      while ((match = quoteRegex.exec(text)) !== null) {
-        const before = text.slice(0, match.index).replace(/:\s*$/, '').trim()
-        if (before) blocks.push({ type: 'paragraph', text: before })
-
-        const quoteText = match[0].slice(1, -1).trim()
-        if (quoteText) blocks.push({ type: 'quote', text: quoteText })
-
-        text = text.slice(match.index + match[0].length).trim()
-      }
-
-      if (text) blocks.push({ type: 'paragraph', text })
-    })
+    if (!foundArticle) {
+      setArticle(null)
+      setLoading(false)
+      return
+    }
 
-    return blocks.map((block, index) => {
-      if (block.type === 'quote') {
-        return (
-          <blockquote
-            key={index}
-            className="border-l-4 border-blue-500 pl-6 py-4 my-6 bg-blue-50 italic text-gray-800"
-          >
-            <p className="text-lg leading-relaxed">{block.text}</p>
-          </blockquote>
-        )
-      }
+    // Der beim Build gerenderte Artikeltext, Bilder, Tags und ähnliche Artikel liegen
+    // im Shard der Kategorie und werden erst jetzt geladen
+    let cancelled = false
+    setLoading(true)
+    loadArticlePage(foundArticle)
+      .catch(error => {
+        console.error('Fehler beim Laden des Artikelinhalts:', error)
+        return { html: '' }
+      })
+      .then(page => {
+        if (cancelled) return
+        setArticle({ ...foundArticle, ...page })
+        setLoading(false)
+      })
 
-      return (
-        <p
-          key={index}
-          className="mb-6 text-gray-700 leading-relaxed text-lg"
-          style={{ lineHeight: '1.8' }}
-        >
-          {block.text}
-        </p>
-      )
-    })
-  }
+    return () => {
+      cancelled = true
+    }
+  }, [urlPath])
 
   const resolveImageSrc = (imagePath) => {
     if (!imagePath) return ''
@@ -101,6 +78,16 @@ function ArticlePage() {
     return `/src/assets/${src}`
   }
 
+  // Varianten aus --optimize-images, ein <source> pro Format
+  const imageSources = (image) => {
+    if (!image || !Array.isArray(image.srcset)) return []
+    const byType = new Map()
+    image.srcset.forEach(({ src, width, type }) => {
+      byType.set(type, [...(byType.get(type) || []), `${src} ${width}w`])
+    })
+    return [...byType].map(([type, candidates]) => ({ type, srcSet: candidates.join(', ') }))
+  }
+
   const renderImages = (images) => {
     if (!images || images.length === 0) return null
 
@@ -108,9 +95,14 @@ function ArticlePage() {
       <div className="my-8">
         {images.map((image, index) => (
           <figure key={index} className="mb-8">
-            <div className="flex justify-center">
+            <picture className="flex justify-center">
+              {imageSources(image).map(({ type, srcSet }) => (
+                <source key={type} type={type} srcSet={srcSet} sizes={IMAGE_SIZES} />
+              ))}
               <img
                 src={resolveImageSrc(image)}
+                width={image.width}
+                height={image.height}
                 alt={typeof image === 'object' && image.alt ? image.alt : typeof image === 'string' ? `Bild ${index + 1} zu ${article.title}` : image.alt || `Bild ${index + 1} zu ${article.title}`}
                 className="max-w-full h-auto rounded-lg shadow-lg border"
                 style={{ maxHeight: '500px', objectFit: 'contain' }}
@@ -118,12 +110,13 @@ function ArticlePage() {
                 onError={(e) => {
                   const imageSrc = resolveImageSrc(image)
                   console.error('Fehler beim Laden des Bildes:', imageSrc, 'Original:', image)
-                  // Show placeholder instead of hiding
+                  // Show placeholder instead of hiding; <source> would take precedence over src
+                  e.target.parentNode.querySelectorAll('source').forEach(source => source.removeAttribute('srcset'))
                   e.target.src = 'data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iNDAwIiBoZWlnaHQ9IjMwMCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48cmVjdCB3aWR0aD0iMTAwJSIgaGVpZ2h0PSIxMDAlIiBmaWxsPSIjZjNmNGY2Ii8+PHRleHQgeD0iNTAlIiB5PSI1MCUiIGZvbnQtZmFtaWx5PSJBcmlhbCwgc2Fucy1zZXJpZiIgZm9udC1zaXplPSIxNCIgZmlsbD0iIzZiNzI4MCIgdGV4dC1hbmNob3I9Im1pZGRsZSIgZHk9Ii4zZW0iPkJpbGQgbmljaHQgdmVyZsO8Z2JhcjwvdGV4dD48L3N2Zz4='
                   e.target.alt = 'Bild nicht verfügbar'
                 }}
               />
-            </div>
+            </picture>
             {(typeof image === 'object' && image.alt) && (
               <figcaption className="text-sm text-gray-600 text-center mt-3 italic">
                 {image.alt}
@@ -199,6 +192,8 @@ function ArticlePage() {
     return breadcrumbs;
   }
 
+  const relatedArticles = (article.related || []).map(getArticleById).filter(Boolean)
+
   return (
     <div className="min-h-screen bg-gray-50">
       <Header />
@@ -260,10 +255,11 @@ function ArticlePage() {
             </div>
           )}
 
-          {/* Artikelinhalt mit verbessertem Paragraph-Rendering */}
-          <div className="prose prose-lg max-w-none">
-            {renderParagraphs(article.content)}
-          </div>
+          {/* Artikelinhalt, von integrate_content.py vorgerendert (Absätze und Zitate, Text escaped) */}
+          <div
+            className="prose prose-lg max-w-none"
+            dangerouslySetInnerHTML={{ __html: article.html }}
+          />
 
           {/* Artikel-Metadaten am Ende */}
           {(article.word_count || article.scraped_url) && (
@@ -302,6 +298,26 @@ function ArticlePage() {
             </footer>
           )}
         </article>
+
+        {/* Ähnliche Artikel, beim Build vorberechnet */}
+        {relatedArticles.length > 0 && (
+          <section className="mt-12">
+            <h2 className="text-2xl font-bold text-gray-900 mb-6">Ähnliche Artikel</h2>
+            <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+              {relatedArticles.map((related) => (
+                <ArticleCard
+                  key={related.id}
+                  title={related.title}
+                  excerpt={related.excerpt}
+                  author={related.author}
+                  date="2024"
+                  href={related.display_url}
+                  image={related.image ? resolveImageSrc(related.image) : null}
+                />
+              ))}
+            </div>
+          </section>
+        )}
       </main>
 
       <Footer />
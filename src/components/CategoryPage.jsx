@@ -4,7 +4,7 @@ import Header from './Header.jsx'
 import Footer from './Footer.jsx'
 import Breadcrumbs from './Breadcrumbs.jsx'
 import ArticleCard from './ArticleCard.jsx'
-import { articles } from '../data/articles_comprehensive.js'
+import { articles } from '../data/articles_manifest.js'
 import { ArrowLeft, User, Code, History, BookOpen, Users } from 'lucide-react'
 import { Button } from '@/components/ui/button.jsx'
 
@@ -180,7 +180,7 @@ const CategoryPage = () => {
                 author={article.author}
                 date="2024"
                 href={article.display_url}
-                image={article.images && article.images.length > 0 ? `/src/assets/${article.images[0]}` : null}
+                image={article.image}
               />
             ))}
             </div>
@@ -1,12 +1,16 @@
 import React from 'react'
-import { useState } from 'react'
+import { useRef, useState } from 'react'
 import { Link, useLocation } from 'react-router-dom'
 import { Menu, X, Search, Home, User, BookOpen, Code, History } from 'lucide-react'
 import { Button } from '@/components/ui/button.jsx'
+import { SearchCompletions } from '../utils/SearchIndex'
 
 const Header = ({ onSearch, searchTerm }) => {
   const [isMenuOpen, setIsMenuOpen] = useState(false)
   const [localSearchTerm, setLocalSearchTerm] = useState(searchTerm || '')
+  const [suggestions, setSuggestions] = useState([])
+  const completions = useRef(null)
+  const latestInput = useRef('')
   const location = useLocation()
   
   // Update local search term when prop changes
@@ -21,9 +25,33 @@ const Header = ({ onSearch, searchTerm }) => {
     }
   }, [location])
   
+  // Vorschlagstabelle erst laden, wenn das Suchfeld benutzt wird
+  const loadCompletions = () => {
+    if (!completions.current) {
+      completions.current = SearchCompletions.fromUrl().catch(() => null)
+    }
+    return completions.current
+  }
+
+  // Vervollständigt das zuletzt getippte Wort
+  const updateSuggestions = async (value) => {
+    latestInput.current = value
+    const table = await loadCompletions()
+    // Inzwischen weitergetippt, die neuere Eingabe setzt die Vorschläge
+    if (latestInput.current !== value) return
+    const lastWord = value.split(/\s+/).pop()
+    if (!table || !lastWord) {
+      setSuggestions([])
+      return
+    }
+    const before = value.slice(0, value.length - lastWord.length)
+    setSuggestions(table.complete(lastWord).map(term => before + term))
+  }
+
   const handleSearchChange = (e) => {
     const value = e.target.value
     setLocalSearchTerm(value)
+    updateSuggestions(value)
     // Only trigger search on homepage
     if (onSearch && (location.pathname === '/' || location.hash === '#/' || location.hash === '')) {
       onSearch(value)
@@ -82,6 +110,8 @@ const Header = ({ onSearch, searchTerm }) => {
                     placeholder="Suchen..."
                     value={localSearchTerm}
                     onChange={handleSearchChange}
+                    onFocus={loadCompletions}
+                    list="search-suggestions"
                     className="w-64 pl-9 pr-4 py-2 text-sm border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
                   />
                 </div>
@@ -133,6 +163,8 @@ const Header = ({ onSearch, searchTerm }) => {
                       placeholder="Artikel durchsuchen..."
                       value={localSearchTerm}
                       onChange={handleSearchChange}
+                      onFocus={loadCompletions}
+                      list="search-suggestions"
                       className="w-full pl-9 pr-4 py-2 text-sm border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
                     />
                   </div>
@@ -141,6 +173,12 @@ const Header = ({ onSearch, searchTerm }) => {
             </div>
           </div>
         )}
+
+        <datalist id="search-suggestions">
+          {suggestions.map(suggestion => (
+            <option key={suggestion} value={suggestion} />
+          ))}
+        </datalist>
       </div>
     </header>
   )
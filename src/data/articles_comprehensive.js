@@ -1,4 +1,4 @@
-// Generated at: 2025-08-13 23:30:58
+// Generated at: 2026-10-17 05:16:28
 
 export const articles = [
   {
@@ -9,11 +9,13 @@ export const articles = [
     "url": "/detlef/geschichte/tocqueville-grausamkeit",
     "display_url": "/#/detlef/geschichte/tocqueville-grausamkeit",
     "images": [{"src": "/src/assets/tocqueville_portrait_531.jpg", "alt": "Portrait von Alexis de Tocqueville"}],
+    "tags": ["tocqueville", "alexis", "grausamkeit", "unglücklichen", "zeit"],
     "author": "Detlef Zeiler",
     "category": "geschichte",
     "scraped_url": "https://www.zeiler.me/detlef/geschichte/tocqueville-grausamkeit",
     "word_count": 296,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [3, 7, 2, 4, 6]
   },
   {
     "id": 2,
@@ -23,11 +25,13 @@ export const articles = [
     "url": "/detlef/geschichte/heidelberg-mittelalter",
     "display_url": "/#/detlef/geschichte/heidelberg-mittelalter",
     "images": [],
+    "tags": ["stadt", "heidelberg", "erste", "mittelalterliche", "begann"],
     "author": "Detlef Zeiler",
     "category": "geschichte",
     "scraped_url": "https://www.zeiler.me/detlef/geschichte/heidelberg-mittelalter",
     "word_count": 245,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [3, 6, 1, 4, 5]
   },
   {
     "id": 3,
@@ -37,11 +41,13 @@ export const articles = [
     "url": "/detlef/geschichte/reformation-kurpfalz",
     "display_url": "/#/detlef/geschichte/reformation-kurpfalz",
     "images": [],
+    "tags": ["kurpfalz", "reformation", "friedrich", "heidelberger", "wurde"],
     "author": "Detlef Zeiler",
     "category": "geschichte",
     "scraped_url": "https://www.zeiler.me/detlef/geschichte/reformation-kurpfalz",
     "word_count": 278,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [2, 1, 6, 5, 4]
   },
   {
     "id": 4,
@@ -51,11 +57,13 @@ export const articles = [
     "url": "/detlef/medien/medienerziehung-digital",
     "display_url": "/#/detlef/medien/medienerziehung-digital",
     "images": [],
+    "tags": ["medienerziehung", "digitalen", "chancen", "daher", "daten"],
     "author": "Detlef Zeiler",
     "category": "medien",
     "scraped_url": "https://www.zeiler.me/detlef/medien/medienerziehung-digital",
     "word_count": 312,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [7, 5, 9, 6, 8]
   },
   {
     "id": 5,
@@ -65,11 +73,13 @@ export const articles = [
     "url": "/detlef/medien/fake-news-erkennen",
     "display_url": "/#/detlef/medien/fake-news-erkennen",
     "images": [],
+    "tags": ["fake", "news", "erkennen", "bewerten", "manchmal"],
     "author": "Detlef Zeiler",
     "category": "medien",
     "scraped_url": "https://www.zeiler.me/detlef/medien/fake-news-erkennen",
     "word_count": 298,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [4, 7, 6, 9, 1]
   },
   {
     "id": 6,
@@ -79,11 +89,13 @@ export const articles = [
     "url": "/detlef/deutsch/goethe-erlkoenig",
     "display_url": "/#/detlef/deutsch/goethe-erlkoenig",
     "images": [],
+    "tags": ["erlkönig", "kind", "ballade", "vater", "goethe"],
     "author": "Detlef Zeiler",
     "category": "deutsch",
     "scraped_url": "https://www.zeiler.me/detlef/deutsch/goethe-erlkoenig",
     "word_count": 356,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [2, 4, 7, 8, 1]
   },
   {
     "id": 7,
@@ -93,11 +105,13 @@ export const articles = [
     "url": "/detlef/deutsch/digitalisierung-schule",
     "display_url": "/#/detlef/deutsch/digitalisierung-schule",
     "images": [],
+    "tags": ["digitalisierung", "schüler", "schule", "digitale", "medien"],
     "author": "Detlef Zeiler",
     "category": "deutsch",
     "scraped_url": "https://www.zeiler.me/detlef/deutsch/digitalisierung-schule",
     "word_count": 387,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [4, 5, 10, 1, 6]
   },
   {
     "id": 8,
@@ -107,11 +121,13 @@ export const articles = [
     "url": "/julian/techzap/react-hooks",
     "display_url": "/#/julian/techzap/react-hooks",
     "images": [],
+    "tags": ["react", "hooks", "hook", "state", "count"],
     "author": "Julian Zeiler",
     "category": "techzap",
     "scraped_url": "https://www.zeiler.me/julian/techzap/react-hooks",
     "word_count": 298,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [10, 4, 6, 7, 1]
   },
   {
     "id": 9,
@@ -121,11 +137,13 @@ export const articles = [
     "url": "/julian/techzap/linux-server-admin",
     "display_url": "/#/julian/techzap/linux-server-admin",
     "images": [],
+    "tags": ["linux", "administration", "befehl", "befehle", "server"],
     "author": "Julian Zeiler",
     "category": "techzap",
     "scraped_url": "https://www.zeiler.me/julian/techzap/linux-server-admin",
     "word_count": 312,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [4, 10, 5, 8, 1]
   },
   {
     "id": 10,
@@ -135,35 +153,16 @@ export const articles = [
     "url": "/julian/techzap/css-grid-layout",
     "display_url": "/#/julian/techzap/css-grid-layout",
     "images": [],
+    "tags": ["grid", "layouts", "template", "auto", "layout"],
     "author": "Julian Zeiler",
     "category": "techzap",
     "scraped_url": "https://www.zeiler.me/julian/techzap/css-grid-layout",
     "word_count": 334,
-    "reading_time": 2
+    "reading_time": 2,
+    "related": [8, 7, 9, 4, 6]
   }
 ];
 
-// Suchfunktion
-export function searchArticles(query) {
-  if (!query || query.trim().length < 2) {
-    return articles;
-  }
-  
-  const searchTerm = query.toLowerCase().trim();
-  
-  return articles.filter(article => {
-    const searchableText = [
-      article.title,
-      article.excerpt,
-      article.content,
-      article.author,
-      article.category
-    ].join(' ').toLowerCase();
-    
-    return searchableText.includes(searchTerm);
-  });
-}
-
 // Artikel nach URL finden
 export function getArticleByUrl(url) {
   if (!url) return null;
@@ -0,0 +1,74 @@
+// Generated at: 2026-10-17 05:20:59
+
+export const articles = [{"id":1,"title":"Alexis de Tocqueville über die plötzliche Grausamkeit in einer unglücklichen Zeit","excerpt":"Tocqueville beschreibt in seinen Erinnerungen, wie schnell sich friedfertige Menschen in Krisenzeiten zu Gewalt hinreißen lassen.","url":"/detlef/geschichte/tocqueville-grausamkeit","display_url":"/#/detlef/geschichte/tocqueville-grausamkeit","category":"geschichte","author":"Detlef Zeiler","reading_time":2,"image":"/src/assets/tocqueville_portrait_531.jpg"},{"id":2,"title":"Heidelberg im Mittelalter - Die Entstehung einer Stadt","excerpt":"Die Geschichte Heidelbergs von den ersten Siedlungen bis zur Gründung der Universität im 14. Jahrhundert.","url":"/detlef/geschichte/heidelberg-mittelalter","display_url":"/#/detlef/geschichte/heidelberg-mittelalter","category":"geschichte","author":"Detlef Zeiler","reading_time":2,"image":null},{"id":3,"title":"Die Reformation in der Kurpfalz","excerpt":"Wie die Reformation das religiöse und politische Leben in der Kurpfalz veränderte.","url":"/detlef/geschichte/reformation-kurpfalz","display_url":"/#/detlef/geschichte/reformation-kurpfalz","category":"geschichte","author":"Detlef Zeiler","reading_time":2,"image":null},{"id":4,"title":"Medienerziehung in der digitalen Welt","excerpt":"Herausforderungen und Chancen der Medienerziehung im Zeitalter von Internet und sozialen Medien.","url":"/detlef/medien/medienerziehung-digital","display_url":"/#/detlef/medien/medienerziehung-digital","category":"medien","author":"Detlef Zeiler","reading_time":2,"image":null},{"id":5,"title":"Fake News erkennen und bewerten","excerpt":"Strategien und Methoden zur Identifikation von Falschinformationen in digitalen Medien.","url":"/detlef/medien/fake-news-erkennen","display_url":"/#/detlef/medien/fake-news-erkennen","category":"medien","author":"Detlef Zeiler","reading_time":2,"image":null},{"id":6,"title":"Goethe: Der Erlkönig - Interpretation","excerpt":"Eine detaillierte Analyse von Goethes berühmter Ballade und ihrer literarischen Bedeutung.","url":"/detlef/deutsch/goethe-erlkoenig","display_url":"/#/detlef/deutsch/goethe-erlkoenig","category":"deutsch","author":"Detlef Zeiler","reading_time":2,"image":null},{"id":7,"title":"Erörterung: Digitalisierung in der Schule","excerpt":"Pro und Contra der zunehmenden Digitalisierung im Bildungswesen.","url":"/detlef/deutsch/digitalisierung-schule","display_url":"/#/detlef/deutsch/digitalisierung-schule","category":"deutsch","author":"Detlef Zeiler","reading_time":2,"image":null},{"id":8,"title":"React Hooks: Ein praktischer Leitfaden","excerpt":"Eine praktische Anleitung zu React Hooks und deren Verwendung in modernen React-Anwendungen.","url":"/julian/techzap/react-hooks","display_url":"/#/julian/techzap/react-hooks","category":"techzap","author":"Julian Zeiler","reading_time":2,"image":null},{"id":9,"title":"Linux Server Administration Grundlagen","excerpt":"Wichtige Befehle und Konzepte für die Verwaltung von Linux-Servern.","url":"/julian/techzap/linux-server-admin","display_url":"/#/julian/techzap/linux-server-admin","category":"techzap","author":"Julian Zeiler","reading_time":2,"image":null},{"id":10,"title":"CSS Grid Layout: Moderne Webentwicklung","excerpt":"Wie CSS Grid das Layout-Design revolutioniert und praktische Anwendungsbeispiele.","url":"/julian/techzap/css-grid-layout","display_url":"/#/julian/techzap/css-grid-layout","category":"techzap","author":"Julian Zeiler","reading_time":2,"image":null}];
+
+// Klartext der Artikel je Kategorie, für die Textausschnitte der Suche
+const contentShards = {"deutsch":"/articles/deutsch.8fdb2b7024e9.json","geschichte":"/articles/geschichte.8424ecaa0ba6.json","medien":"/articles/medien.ffcf22a65359.json","techzap":"/articles/techzap.9e2f88da2787.json"};
+
+// Artikelseiten (vorgerendertes HTML, Bilder, Tags, ähnliche Artikel) je Kategorie
+const pageShards = {"deutsch":"/articles/deutsch.page.9b1f8fe4acb6.json","geschichte":"/articles/geschichte.page.3299b4a556c1.json","medien":"/articles/medien.page.8fbe3ed0be59.json","techzap":"/articles/techzap.page.db40e720d7cb.json"};
+
+const shardRequests = new Map();
+
+// Eintrag eines Artikels aus einem Shard laden
+function loadShardEntry(shardUrl, id, fallback) {
+  if (!shardUrl) {
+    return Promise.resolve(fallback);
+  }
+  
+  if (!shardRequests.has(shardUrl)) {
+    const request = fetch(shardUrl)
+      .then(response => {
+        if (!response.ok) {
+          throw new Error(`Failed to load ${shardUrl}: ${response.status}`);
+        }
+        return response.json();
+      })
+      .catch(error => {
+        shardRequests.delete(shardUrl);
+        throw error;
+      });
+    shardRequests.set(shardUrl, request);
+  }
+  
+  return shardRequests.get(shardUrl).then(shard => shard[id] || fallback);
+}
+
+// Inhalt eines Artikels aus dem Shard seiner Kategorie laden
+export function loadArticleContent(article) {
+  return loadShardEntry(contentShards[article.category], article.id, '');
+}
+
+// Restliche Felder eines Artikels und sein beim Build gerendertes HTML
+// (bereits bereinigt und escaped) laden
+export function loadArticlePage(article) {
+  return loadShardEntry(pageShards[article.category], article.id, { html: '' });
+}
+
+// Artikel nach ID finden
+export function getArticleById(id) {
+  return articles.find(article => article.id === id) || null;
+}
+
+// Artikel nach URL finden
+export function getArticleByUrl(url) {
+  if (!url) return null;
+  
+  // Normalisiere URL
+  const normalizedUrl = url.replace(/^\/+|\/+$/g, '').toLowerCase();
+  
+  return articles.find(article => {
+    const articleUrl = article.url.replace(/^\/+|\/+$/g, '').toLowerCase();
+    const displayUrl = article.display_url.replace(/^\/+|#+\/+|\/+$/g, '').toLowerCase();
+    
+    return articleUrl === normalizedUrl || 
+           displayUrl === normalizedUrl ||
+           articleUrl.endsWith(normalizedUrl) ||
+           displayUrl.endsWith(normalizedUrl);
+  }) || null;
+}
+
+// Artikel nach Kategorie
+export function getArticlesByCategory(category) {
+  return articles.filter(article => article.category === category);
+}
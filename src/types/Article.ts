@@ -22,12 +22,19 @@ export interface Category {
   path: string[];
 }
 
+export interface ImageVariant {
+  src: string; // /images/<hash>-<breite>.<format>
+  width: number;
+  type: string; // MIME-Typ, z.B. image/avif
+}
+
 export interface ArticleImage {
   src: string;
   alt: string;
   caption?: string;
   width?: number;
   height?: number;
+  srcset?: ImageVariant[]; // Verkleinerte Varianten (integrate_content.py --optimize-images)
 }
 
 export interface ArticleMetadata {
@@ -59,11 +66,17 @@ export interface Article {
   url: string; // Vollständige URL zum Artikel
 }
 
+export interface SearchSnippet {
+  text: string; // Ausschnitt um den am besten passenden Satz
+  highlights: Array<[number, number]>; // Treffer als [Anfang, Ende) in text
+}
+
 export interface SearchResult {
   article: Article;
   score: number;
   matchedFields: string[];
   highlights: string[];
+  snippet?: SearchSnippet;
 }
 
 export interface SearchQuery {
@@ -5,6 +5,7 @@
 
 import type { 
   Article, 
+  ExtendedArticle,
   ArticleMetadata, 
   ArticleSEO,
   ReadingTimeCalculator,
@@ -66,7 +67,8 @@ export class DataHelpers {
   };
 
   /**
-   * Extrahiert Tags aus einem Text basierend auf Häufigkeit und Relevanz
+   * Extrahiert Tags aus einem Text basierend auf Häufigkeit und Relevanz.
+   * Rückfall für Artikel ohne beim Build erzeugte Tags
    */
   static extractTags(content: string, maxTags = 10): string[] {
     const words = content
@@ -184,8 +186,10 @@ export class DataHelpers {
   static generateMetadata(content: string, existingTags: string[] = []): ArticleMetadata {
     const wordCount = DataHelpers.countWords(content);
     const readingTime = DataHelpers.calculateReadingTime(content);
-    const extractedTags = DataHelpers.extractTags(content, 5);
-    const allTags = [...new Set([...existingTags, ...extractedTags])];
+    // Tags aus integrate_content.py sind korpusweit gewichtet; nur ohne sie wird lokal extrahiert
+    const allTags = existingTags.length > 0
+      ? [...new Set(existingTags)]
+      : DataHelpers.extractTags(content, 5);
 
     return {
       createdAt: new Date(),
@@ -230,7 +234,7 @@ export class DataHelpers {
   /**
    * Konvertiert Legacy-Artikel-Daten zum neuen Format
    */
-  static convertLegacyArticle(legacyData: any): Partial<Article> {
+  static convertLegacyArticle(legacyData: any): Partial<ExtendedArticle> {
     const cleanTitle = DataHelpers.cleanTitle(legacyData.title || '');
     const cleanContent = DataHelpers.cleanContent(legacyData.content || legacyData.text_content || '');
     const slug = URLManager.generateSlug(cleanTitle);
@@ -246,7 +250,9 @@ export class DataHelpers {
         src,
         alt: cleanTitle
       })),
-      metadata: DataHelpers.generateMetadata(cleanContent, legacyData.tags || [])
+      metadata: DataHelpers.generateMetadata(cleanContent, legacyData.tags || []),
+      // integrate_content.py liefert die Nachbarn als numerische IDs in `related`
+      relatedArticles: (legacyData.related || []).map((id: number | string) => String(id))
     };
   }
 
@@ -284,9 +290,20 @@ export class DataHelpers {
   }
 
   /**
-   * Findet ähnliche Artikel basierend auf Tags und Kategorie
+   * Findet ähnliche Artikel basierend auf Tags und Kategorie.
+   * Vorberechnete Nachbarn (`related` aus integrate_content.py, von convertLegacyArticle
+   * als relatedArticles übernommen) haben Vorrang.
    */
   static findSimilarArticles(targetArticle: Article, allArticles: Article[], limit = 5): Article[] {
+    const relatedIds = (targetArticle as Partial<ExtendedArticle>).relatedArticles;
+    if (relatedIds && relatedIds.length > 0) {
+      const articlesById = new Map(allArticles.map(article => [article.id, article]));
+      return relatedIds
+        .map(id => articlesById.get(id))
+        .filter((article): article is Article => article !== undefined)
+        .slice(0, limit);
+    }
+
     const similarities = allArticles
       .filter(article => article.id !== targetArticle.id)
       .map(article => {
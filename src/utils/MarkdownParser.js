@@ -125,7 +125,7 @@ export const cleanArticleContent = (content) => {
   // Bereinige Whitespace aber erhalte Paragraph-Struktur
   cleanedContent = cleanedContent
     .replace(/\n\s*\n\s*\n/g, '\n\n') // Mehrfache Leerzeilen zu doppelten
-    .replace(/^\s+|\s+$/gm, '') // Whitespace am Zeilenanfang/-ende
+    .replace(/^[^\S\n]+|[^\S\n]+$/gm, '') // Whitespace am Zeilenanfang/-ende, Zeilenumbrüche bleiben
     .trim();
 
   return cleanedContent;
@@ -3,12 +3,13 @@
  * Bietet schnelle und relevante Suchergebnisse
  */
 
+import { SearchField } from '../types/Article';
 import type { 
   Article, 
   SearchResult, 
   SearchQuery, 
-  SearchResponse, 
-  SearchField 
+  SearchResponse,
+  SearchSnippet
 } from '../types/Article';
 
 interface IndexEntry {
@@ -24,6 +25,57 @@ interface SearchTerm {
   field?: SearchField;
 }
 
+interface TermVariant {
+  term: string;
+  factor: number;
+}
+
+
+export const SEARCH_INDEX_VERSION = 3;
+
+/**
+ * Vorberechneter Index aus integrate_content.py (public/search-index.json).
+ * Jede Posting-Liste enthält Einträge [Dokument, Feld, Häufigkeit, ...Positionen],
+ * die Positionen sind als Abstände zur vorherigen Position kodiert.
+ * `sentences` enthält je Dokument die Satzanfänge im Inhalt, einmal als
+ * Zeichen-Offset (UTF-16 wie JavaScript-Strings) und einmal als Position
+ * des ersten Begriffs, beides als Abstände kodiert.
+ * `trigrams` ordnet jedem Trigramm die Nummern der Begriffe in `terms` zu,
+ * ebenfalls als Abstände kodiert.
+ */
+export interface SerializedSearchIndex {
+  version: number;
+  fields: string[];
+  weights: number[];
+  docs: string[];
+  terms: string[];
+  postings: number[][][];
+  sentences: number[][][];
+  trigrams: Record<string, number[]>;
+}
+
+export const SEARCH_COMPLETIONS_VERSION = 1;
+
+/**
+ * Vorberechnete Vervollständigungen aus integrate_content.py
+ * (public/search-completions.json). `terms` ist nach Rang sortiert
+ * (Feldgewicht × Dokumenthäufigkeit in Titeln und Tags), `prefixes` enthält
+ * je Präfix die Nummern der besten k Begriffe als Abstände kodiert.
+ */
+export interface SerializedCompletionTable {
+  version: number;
+  k: number;
+  terms: string[];
+  prefixes: Record<string, number[]>;
+}
+
+export interface Posting {
+  articleId: string;
+  field: SearchField;
+  termFrequency: number;
+  positions: number[];
+}
+
 export class ArticleSearchIndex {
   private titleIndex = new Map<string, Set<string>>();
   private contentIndex = new Map<string, Set<string>>();
@@ -35,6 +87,27 @@ export class ArticleSearchIndex {
   private articles = new Map<string, Article>();
   private isBuilt = false;
 
+  // Sortierte Begriffe je Feld für die Präfix-Suche per binärer Suche
+  private sortedTerms = new Map<SearchField, string[]>();
+
+  // Posting-Listen mit Häufigkeiten und Positionen (nur bei geladenem Index)
+  private postings = new Map<string, number[][]>();
+  private postingDocs: string[] = [];
+  private postingFields: SearchField[] = [];
+  private postingDocNumbers = new Map<string, number>();
+  private sentences: number[][][] = [];
+
+  // Gefundene Begriffe je Ergebnis, für die Textausschnitte
+  private matchedTerms = new WeakMap<SearchResult, Set<string>>();
+
+  // Trigramm-Index des Vokabulars für Teilwort- und Tippfehler-Suche
+  private vocabulary: string[] = [];
+  private foldedVocabulary: string[] = [];
+  private trigramIndex = new Map<string, number[]>();
+
+  // Vorberechnete Vervollständigungen für getSuggestions (optional)
+  private completions: SearchCompletions | null = null;
+
   // Gewichtungen für verschiedene Felder
   private readonly fieldWeights = {
     [SearchField.TITLE]: 5,
@@ -54,6 +127,11 @@ export class ArticleSearchIndex {
     'auch', 'nur', 'noch', 'wie', 'was', 'wenn', 'dann', 'so', 'als'
   ]);
 
+  // Umlaute und ß wie GERMAN_FOLDING in integrate_content.py
+  private readonly umlautFolding: Record<string, string> = {
+    'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'
+  };
+
   /**
    * Baut den Suchindex aus einer Liste von Artikeln auf
    */
@@ -83,11 +161,90 @@ export class ArticleSearchIndex {
       });
     });
 
+    this.sortTerms();
+    this.buildTrigramIndex();
     this.isBuilt = true;
     const endTime = performance.now();
     console.log(`Search index built in ${(endTime - startTime).toFixed(2)}ms`);
   }
 
+  /**
+   * Übernimmt einen beim Build vorberechneten Index, statt die Texte
+   * im Browser erneut zu tokenisieren
+   */
+  loadIndex(data: SerializedSearchIndex, articles: Article[]): void {
+    const startTime = performance.now();
+
+    if (data.version !== SEARCH_INDEX_VERSION) {
+      throw new Error(`Unsupported search index version ${data.version}`);
+    }
+
+    this.clearIndex();
+
+    articles.forEach(article => {
+      this.articles.set(article.id, article);
+    });
+
+    this.postingDocs = data.docs;
+    this.postingFields = data.fields as SearchField[];
+    this.sentences = data.sentences;
+    data.docs.forEach((articleId, doc) => this.postingDocNumbers.set(articleId, doc));
+
+    this.postingFields.forEach((field, i) => {
+      if (this.fieldWeights[field] !== data.weights[i]) {
+        console.warn(`Search index weight for ${field} differs from client weight`);
+      }
+    });
+
+    data.terms.forEach((term, i) => {
+      const termPostings = data.postings[i];
+      this.postings.set(term, termPostings);
+      termPostings.forEach(([doc, field]) => {
+        this.addToIndex(term, this.postingDocs[doc], this.getFieldIndex(this.postingFields[field]));
+      });
+    });
+
+    this.vocabulary = data.terms;
+    this.foldedVocabulary = data.terms.map(term => this.foldTerm(term));
+    Object.entries(data.trigrams).forEach(([trigram, gaps]) => {
+      this.trigramIndex.set(trigram, this.decodeGaps(gaps));
+    });
+
+    this.sortTerms();
+    this.isBuilt = true;
+    const endTime = performance.now();
+    console.log(`Search index loaded in ${(endTime - startTime).toFixed(2)}ms`);
+  }
+
+  /**
+   * Lädt den vorberechneten Index vom Server
+   */
+  static async fromUrl(articles: Article[], url = '/search-index.json'): Promise<ArticleSearchIndex> {
+    const response = await fetch(url);
+    if (!response.ok) {
+      throw new Error(`Failed to load search index from ${url}: ${response.status}`);
+    }
+
+    const index = new ArticleSearchIndex();
+    index.loadIndex(await response.json(), articles);
+    return index;
+  }
+
+  /**
+   * Gibt Häufigkeiten und Positionen eines Begriffs zurück (nur bei geladenem Index)
+   */
+  getPostings(term: string): Posting[] {
+    const termPostings = this.postings.get(term.toLowerCase());
+    if (!termPostings) return [];
+
+    return termPostings.map(([doc, field, termFrequency, ...gaps]) => ({
+      articleId: this.postingDocs[doc],
+      field: this.postingFields[field],
+      termFrequency,
+      positions: this.decodeGaps(gaps)
+    }));
+  }
+
   /**
    * Führt eine Suche durch und gibt gewichtete Ergebnisse zurück
    */
@@ -112,12 +269,13 @@ export class ArticleSearchIndex {
 
     // Suche in verschiedenen Feldern
     searchTerms.forEach(searchTerm => {
-      this.searchInField(searchTerm, this.titleIndex, SearchField.TITLE, results);
-      this.searchInField(searchTerm, this.excerptIndex, SearchField.EXCERPT, results);
-      this.searchInField(searchTerm, this.contentIndex, SearchField.CONTENT, results);
-      this.searchInField(searchTerm, this.tagIndex, SearchField.TAGS, results);
-      this.searchInField(searchTerm, this.authorIndex, SearchField.AUTHOR, results);
-      this.searchInField(searchTerm, this.categoryIndex, SearchField.CATEGORY, results);
+      const variants = this.findTermVariants(searchTerm.term);
+      this.searchInField(searchTerm, variants, this.titleIndex, SearchField.TITLE, results);
+      this.searchInField(searchTerm, variants, this.excerptIndex, SearchField.EXCERPT, results);
+      this.searchInField(searchTerm, variants, this.contentIndex, SearchField.CONTENT, results);
+      this.searchInField(searchTerm, variants, this.tagIndex, SearchField.TAGS, results);
+      this.searchInField(searchTerm, variants, this.authorIndex, SearchField.AUTHOR, results);
+      this.searchInField(searchTerm, variants, this.categoryIndex, SearchField.CATEGORY, results);
     });
 
     // Filtere nach Kategorie, Autor, etc.
@@ -151,6 +309,9 @@ export class ArticleSearchIndex {
     const limit = query.limit || 20;
     const paginatedResults = filteredResults.slice(offset, offset + limit);
 
+    // Textausschnitte nur für die angezeigte Seite
+    this.addSnippets(paginatedResults);
+
     const endTime = performance.now();
 
     return {
@@ -161,6 +322,20 @@ export class ArticleSearchIndex {
     };
   }
 
+  /**
+   * Setzt die Textausschnitte von Suchergebnissen (neu), etwa nachdem der
+   * Inhalt der Artikel nachgeladen wurde
+   */
+  addSnippets(results: SearchResult[]): void {
+    results.forEach(result => {
+      const snippet = this.buildSnippet(result.article, this.matchedTerms.get(result));
+      if (snippet) {
+        result.snippet = snippet;
+        result.highlights = [snippet.text];
+      }
+    });
+  }
+
   /**
    * Sucht nach ähnlichen Artikeln basierend auf Tags und Kategorie
    */
@@ -203,24 +378,30 @@ export class ArticleSearchIndex {
    * Gibt Suchvorschläge basierend auf einer partiellen Eingabe zurück
    */
   getSuggestions(partialQuery: string, limit = 5): string[] {
-    const suggestions = new Set<string>();
     const lowerQuery = partialQuery.toLowerCase();
+    if (this.completions) {
+      return this.completions.complete(lowerQuery, limit);
+    }
 
-    // Suche in Titeln
-    this.titleIndex.forEach((articleIds, term) => {
-      if (term.startsWith(lowerQuery) && suggestions.size < limit) {
-        suggestions.add(term);
-      }
-    });
+    const suggestions = new Set<string>();
 
-    // Suche in Tags
-    this.tagIndex.forEach((articleIds, term) => {
-      if (term.startsWith(lowerQuery) && suggestions.size < limit) {
-        suggestions.add(term);
+    // Präfixbereich der sortierten Begriffe in Titeln und Tags
+    [SearchField.TITLE, SearchField.TAGS].forEach(field => {
+      const terms = this.sortedTerms.get(field) || [];
+      for (let i = this.lowerBound(terms, lowerQuery); i < terms.length && suggestions.size < limit; i++) {
+        if (!terms[i].startsWith(lowerQuery)) break;
+        suggestions.add(terms[i]);
       }
     });
 
-    return Array.from(suggestions).slice(0, limit);
+    return Array.from(suggestions);
+  }
+
+  /**
+   * Verwendet eine vorberechnete Vervollständigungstabelle für getSuggestions
+   */
+  setCompletions(completions: SearchCompletions): void {
+    this.completions = completions;
   }
 
   /**
@@ -273,6 +454,7 @@ export class ArticleSearchIndex {
    */
   private searchInField(
     searchTerm: SearchTerm, 
+    variants: TermVariant[],
     index: Map<string, Set<string>>, 
     field: SearchField, 
     results: Map<string, SearchResult>
@@ -282,29 +464,206 @@ export class ArticleSearchIndex {
     // Exakte Übereinstimmung
     if (index.has(searchTerm.term)) {
       index.get(searchTerm.term)!.forEach(articleId => {
-        this.addSearchResult(articleId, weight, field, results);
+        this.addSearchResult(articleId, weight, field, results, searchTerm.term);
       });
     }
 
-    // Fuzzy-Suche (beginnt mit)
-    index.forEach((articleIds, indexTerm) => {
-      if (indexTerm.startsWith(searchTerm.term) && indexTerm !== searchTerm.term) {
-        articleIds.forEach(articleId => {
-          this.addSearchResult(articleId, weight * 0.7, field, results);
-        });
+    // Fuzzy-Suche (beginnt mit): Präfixbereich der sortierten Begriffe
+    const terms = this.sortedTerms.get(field) || [];
+    for (let i = this.lowerBound(terms, searchTerm.term); i < terms.length; i++) {
+      const indexTerm = terms[i];
+      if (!indexTerm.startsWith(searchTerm.term)) break;
+      if (indexTerm === searchTerm.term) continue;
+
+      index.get(indexTerm)!.forEach(articleId => {
+        this.addSearchResult(articleId, weight * 0.7, field, results, indexTerm);
+      });
+    }
+
+    // Fuzzy-Suche (Umlaut-Schreibweise, enthält, Tippfehler) aus dem Trigramm-Index
+    variants.forEach(({ term, factor }) => {
+      index.get(term)?.forEach(articleId => {
+        this.addSearchResult(articleId, weight * factor, field, results, term);
+      });
+    });
+  }
+
+  /**
+   * Findet Begriffe des Vokabulars, die sich vom Suchbegriff nur in der
+   * Umlaut-Schreibweise unterscheiden, ihn enthalten oder höchstens
+   * maxEditDistance Tippfehler entfernt sind. Kandidaten kommen aus den
+   * Trigramm-Listen statt aus einem Durchlauf über alle Begriffe;
+   * exakte und Präfix-Treffer behandelt searchInField selbst.
+   */
+  private findTermVariants(term: string): TermVariant[] {
+    const folded = this.foldTerm(term);
+    const trigrams = this.termTrigrams(term);
+    const innerTrigrams = new Set(
+      Array.from(trigrams).filter(trigram => !trigram.includes('^') && !trigram.includes('$'))
+    );
+    const maxDistance = this.maxEditDistance(folded.length);
+    // Mit ^ und $ hat ein Begriff so viele Trigramme wie Zeichen; die Listen
+    // kennen jedes Trigramm eines Begriffs nur einmal
+    const repeatedTrigrams = folded.length - trigrams.size;
+
+    // Gemeinsame Trigramme je Begriffsnummer, insgesamt und ohne Rand-Trigramme
+    const shared = new Map<number, number>();
+    const sharedInner = new Map<number, number>();
+    trigrams.forEach(trigram => {
+      const inner = innerTrigrams.has(trigram);
+      (this.trigramIndex.get(trigram) || []).forEach(number => {
+        shared.set(number, (shared.get(number) || 0) + 1);
+        if (inner) {
+          sharedInner.set(number, (sharedInner.get(number) || 0) + 1);
+        }
+      });
+    });
+
+    const variants: TermVariant[] = [];
+    shared.forEach((count, number) => {
+      const candidate = this.vocabulary[number];
+      if (candidate.startsWith(term)) return;
+
+      const foldedCandidate = this.foldedVocabulary[number];
+      if (foldedCandidate === folded) {
+        variants.push({ term: candidate, factor: 0.9 });
+      } else if (sharedInner.get(number) === innerTrigrams.size && foldedCandidate.includes(folded)) {
+        variants.push({ term: candidate, factor: 0.5 });
+      } else if (
+        maxDistance > 0 &&
+        this.mayBeTypo(count + repeatedTrigrams, folded.length, foldedCandidate.length, maxDistance) &&
+        Math.abs(folded.length - foldedCandidate.length) <= maxDistance &&
+        this.editDistance(folded, foldedCandidate, maxDistance) <= maxDistance
+      ) {
+        variants.push({ term: candidate, factor: 0.3 });
       }
     });
 
-    // Fuzzy-Suche (enthält)
-    index.forEach((articleIds, indexTerm) => {
-      if (indexTerm.includes(searchTerm.term) && !indexTerm.startsWith(searchTerm.term)) {
-        articleIds.forEach(articleId => {
-          this.addSearchResult(articleId, weight * 0.5, field, results);
-        });
+    return variants;
+  }
+
+  /**
+   * q-Gramm-Filter vor der Editierdistanz: jeder Tippfehler zerstört höchstens
+   * drei Trigramme, zwei Begriffe mit höchstens maxDistance Fehlern teilen also
+   * mindestens max(|a|, |b|) - 3 · maxDistance Trigramme (mit Vielfachheit).
+   * shared ist eine obere Schranke dafür: die gemeinsamen verschiedenen
+   * Trigramme plus die Wiederholungen im Suchbegriff. Ist die Schranke nicht
+   * positiv, entscheidet allein die Editierdistanz.
+   */
+  private mayBeTypo(shared: number, length: number, candidateLength: number, maxDistance: number): boolean {
+    const bound = Math.max(length, candidateLength) - 3 * maxDistance;
+    return bound <= 0 || shared >= bound;
+  }
+
+  /**
+   * Erlaubte Tippfehler je Begriffslänge: keine bis 3, einer bis 7, sonst zwei Zeichen
+   */
+  private maxEditDistance(length: number): number {
+    if (length >= 8) return 2;
+    if (length >= 4) return 1;
+    return 0;
+  }
+
+  /**
+   * Levenshtein-Distanz mit Abbruch, sobald sie maxDistance sicher übersteigt
+   */
+  private editDistance(a: string, b: string, maxDistance: number): number {
+    let previous = Array.from({ length: b.length + 1 }, (_, j) => j);
+    for (let i = 1; i <= a.length; i++) {
+      const current = [i];
+      let rowMinimum = i;
+      for (let j = 1; j <= b.length; j++) {
+        const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+        current[j] = Math.min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost);
+        rowMinimum = Math.min(rowMinimum, current[j]);
       }
+      if (rowMinimum > maxDistance) return maxDistance + 1;
+      previous = current;
+    }
+    return previous[b.length];
+  }
+
+  /**
+   * Ersetzt Umlaute und ß (ä → ae, ß → ss)
+   */
+  private foldTerm(term: string): string {
+    return term.replace(/[äöüß]/g, char => this.umlautFolding[char]);
+  }
+
+  /**
+   * Trigramme eines Begriffs, wie term_trigrams in integrate_content.py:
+   * vereinheitlichte Umlaute, Anfang und Ende mit ^ und $ markiert
+   */
+  private termTrigrams(term: string): Set<string> {
+    const padded = `^${this.foldTerm(term)}$`;
+    const trigrams = new Set<string>();
+    for (let i = 0; i + 3 <= padded.length; i++) {
+      trigrams.add(padded.slice(i, i + 3));
+    }
+    return trigrams;
+  }
+
+  /**
+   * Baut den Trigramm-Index aus den Begriffen aller Felder auf
+   */
+  private buildTrigramIndex(): void {
+    const vocabulary = new Set<string>();
+    Object.values(SearchField).forEach(field => {
+      this.getFieldIndex(field).forEach((_, term) => vocabulary.add(term));
+    });
+
+    this.vocabulary = Array.from(vocabulary).sort();
+    this.foldedVocabulary = this.vocabulary.map(term => this.foldTerm(term));
+    this.vocabulary.forEach((term, number) => {
+      this.termTrigrams(term).forEach(trigram => {
+        if (!this.trigramIndex.has(trigram)) {
+          this.trigramIndex.set(trigram, []);
+        }
+        this.trigramIndex.get(trigram)!.push(number);
+      });
     });
   }
 
+  /**
+   * Erste Position in einer sortierten Liste, die nicht kleiner als der Begriff ist
+   */
+  private lowerBound(terms: string[], term: string): number {
+    let low = 0;
+    let high = terms.length;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (terms[middle] < term) {
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
+    }
+    return low;
+  }
+
+  /**
+   * Sortiert die Begriffe jedes Feldes für die Präfix-Suche
+   */
+  private sortTerms(): void {
+    Object.values(SearchField).forEach(field => {
+      this.sortedTerms.set(field, Array.from(this.getFieldIndex(field).keys()).sort());
+    });
+  }
+
+  /**
+   * Gibt den Index eines Feldes zurück
+   */
+  private getFieldIndex(field: SearchField): Map<string, Set<string>> {
+    switch (field) {
+      case SearchField.TITLE: return this.titleIndex;
+      case SearchField.EXCERPT: return this.excerptIndex;
+      case SearchField.CONTENT: return this.contentIndex;
+      case SearchField.TAGS: return this.tagIndex;
+      case SearchField.AUTHOR: return this.authorIndex;
+      case SearchField.CATEGORY: return this.categoryIndex;
+    }
+  }
+
   /**
    * Fügt ein Suchergebnis hinzu oder aktualisiert die Bewertung
    */
@@ -312,7 +671,8 @@ export class ArticleSearchIndex {
     articleId: string, 
     score: number, 
     field: SearchField, 
-    results: Map<string, SearchResult>
+    results: Map<string, SearchResult>,
+    term: string
   ): void {
     const article = this.articles.get(articleId);
     if (!article) return;
@@ -323,14 +683,163 @@ export class ArticleSearchIndex {
       if (!existing.matchedFields.includes(field)) {
         existing.matchedFields.push(field);
       }
+      this.matchedTerms.get(existing)!.add(term);
     } else {
-      results.set(articleId, {
+      const result: SearchResult = {
         article,
         score,
         matchedFields: [field],
-        highlights: [] // TODO: Implementiere Highlighting
+        highlights: []
+      };
+      results.set(articleId, result);
+      this.matchedTerms.set(result, new Set([term]));
+    }
+  }
+
+  /**
+   * Schneidet den Satz mit den meisten gefundenen Begriffen aus dem Inhalt.
+   * Der Satz wird über die Positionen der Posting-Listen und die
+   * Satzgrenzen des geladenen Index bestimmt; nur er selbst wird nach den
+   * zu markierenden Stellen durchsucht. Ohne Treffer im Inhalt dient der
+   * Auszug als Ausschnitt, ohne vorberechneten Index gibt es keinen.
+   */
+  private buildSnippet(article: Article, terms: Set<string> | undefined, maxLength = 200): SearchSnippet | null {
+    const doc = this.postingDocNumbers.get(article.id);
+    if (doc === undefined || !terms) return null;
+
+    const [offsetGaps, positionGaps] = this.sentences[doc] || [[0], [0]];
+    const sentenceOffsets = this.decodeGaps(offsetGaps);
+    const sentencePositions = this.decodeGaps(positionGaps);
+
+    // Verschiedene (dann alle) Treffer je Satz
+    const sentenceTerms = new Map<number, Set<string>>();
+    const sentenceCounts = new Map<number, number>();
+    if (article.content) {
+      terms.forEach(term => {
+        this.getDocumentPositions(term, doc, SearchField.CONTENT).forEach(position => {
+          const sentence = this.upperBound(sentencePositions, position) - 1;
+          if (!sentenceTerms.has(sentence)) {
+            sentenceTerms.set(sentence, new Set());
+          }
+          sentenceTerms.get(sentence)!.add(term);
+          sentenceCounts.set(sentence, (sentenceCounts.get(sentence) || 0) + 1);
+        });
       });
     }
+
+    let bestSentence = -1;
+    let bestScore = 0;
+    sentenceTerms.forEach((matched, sentence) => {
+      const score = matched.size * 1000 + sentenceCounts.get(sentence)!;
+      if (score > bestScore || (score === bestScore && sentence < bestSentence)) {
+        bestSentence = sentence;
+        bestScore = score;
+      }
+    });
+
+    if (bestSentence < 0) {
+      return article.excerpt ? this.cutSnippet(article.excerpt, 0, article.excerpt.length, terms, maxLength) : null;
+    }
+
+    const start = sentenceOffsets[bestSentence];
+    const end = bestSentence + 1 < sentenceOffsets.length ? sentenceOffsets[bestSentence + 1] : article.content.length;
+    return this.cutSnippet(article.content, start, end, terms, maxLength);
+  }
+
+  /**
+   * Positionen eines Begriffs in einem Feld eines Dokuments
+   */
+  private getDocumentPositions(term: string, doc: number, field: SearchField): number[] {
+    const termPostings = this.postings.get(term) || [];
+    const fieldNumber = this.postingFields.indexOf(field);
+
+    // Posting-Listen sind nach Dokument sortiert
+    let low = 0;
+    let high = termPostings.length;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (termPostings[middle][0] < doc) {
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
+    }
+
+    for (let i = low; i < termPostings.length && termPostings[i][0] === doc; i++) {
+      const [, postingField, , ...gaps] = termPostings[i];
+      if (postingField === fieldNumber) {
+        return this.decodeGaps(gaps);
+      }
+    }
+    return [];
+  }
+
+  /**
+   * Markiert die Begriffe in text[start, end) und kürzt zu lange Sätze an
+   * Wortgrenzen auf maxLength Zeichen um den ersten Treffer
+   */
+  private cutSnippet(text: string, start: number, end: number, terms: Set<string>, maxLength: number): SearchSnippet {
+    const sentence = text.slice(start, end).trimEnd();
+    const hits: Array<[number, number]> = [];
+    const tokens = /\S+/g;
+    const normalized = sentence.toLowerCase().replace(/[^\w\säöüß-]/g, ' ');
+    let match: RegExpExecArray | null;
+    while ((match = tokens.exec(normalized)) !== null) {
+      if (terms.has(match[0])) {
+        hits.push([match.index, match.index + match[0].length]);
+      }
+    }
+
+    let cutStart = 0;
+    let cutEnd = sentence.length;
+    if (sentence.length > maxLength && hits.length > 0) {
+      const windowStart = Math.max(0, hits[0][0] - Math.floor(maxLength / 4));
+      const windowEnd = Math.min(sentence.length, windowStart + maxLength);
+      if (windowStart > 0) {
+        const space = sentence.indexOf(' ', windowStart);
+        cutStart = space >= 0 && space < hits[0][0] ? space + 1 : windowStart;
+      }
+      if (windowEnd < sentence.length) {
+        const space = sentence.lastIndexOf(' ', windowEnd);
+        cutEnd = space > hits[0][1] ? space : windowEnd;
+      }
+    } else if (sentence.length > maxLength) {
+      cutEnd = maxLength;
+    }
+
+    const prefix = cutStart > 0 ? '…' : '';
+    const suffix = cutEnd < sentence.length ? '…' : '';
+    return {
+      text: prefix + sentence.slice(cutStart, cutEnd) + suffix,
+      highlights: hits
+        .filter(([hitStart, hitEnd]) => hitStart >= cutStart && hitEnd <= cutEnd)
+        .map(([hitStart, hitEnd]) => [hitStart - cutStart + prefix.length, hitEnd - cutStart + prefix.length] as [number, number])
+    };
+  }
+
+  /**
+   * Wandelt als Abstände kodierte Zahlen zurück
+   */
+  private decodeGaps(gaps: number[]): number[] {
+    let value = 0;
+    return gaps.map(gap => (value += gap));
+  }
+
+  /**
+   * Erste Stelle in einer sortierten Liste mit einem Wert größer als value
+   */
+  private upperBound(values: number[], value: number): number {
+    let low = 0;
+    let high = values.length;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (values[middle] <= value) {
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
+    }
+    return low;
   }
 
   /**
@@ -344,6 +853,15 @@ export class ArticleSearchIndex {
     this.authorIndex.clear();
     this.categoryIndex.clear();
     this.articles.clear();
+    this.sortedTerms.clear();
+    this.postings.clear();
+    this.postingDocs = [];
+    this.postingFields = [];
+    this.postingDocNumbers.clear();
+    this.sentences = [];
+    this.vocabulary = [];
+    this.foldedVocabulary = [];
+    this.trigramIndex.clear();
     this.isBuilt = false;
   }
 
@@ -371,5 +889,60 @@ export class ArticleSearchIndex {
   }
 }
 
+/**
+ * Suchvorschläge während der Eingabe aus der beim Build vorberechneten
+ * Tabelle: pro Tastendruck ein Map-Zugriff und höchstens k Vergleiche
+ */
+export class SearchCompletions {
+  private terms: string[] = [];
+  private prefixes = new Map<string, number[]>();
+  private k = 0;
+
+  constructor(data: SerializedCompletionTable) {
+    if (data.version !== SEARCH_COMPLETIONS_VERSION) {
+      throw new Error(`Unsupported completion table version ${data.version}`);
+    }
+
+    this.terms = data.terms;
+    this.k = data.k;
+    Object.entries(data.prefixes).forEach(([prefix, gaps]) => {
+      let number = 0;
+      this.prefixes.set(prefix, gaps.map(gap => (number += gap)));
+    });
+  }
+
+  /**
+   * Lädt die Tabelle vom Server
+   */
+  static async fromUrl(url = '/search-completions.json'): Promise<SearchCompletions> {
+    const response = await fetch(url);
+    if (!response.ok) {
+      throw new Error(`Failed to load completion table from ${url}: ${response.status}`);
+    }
+
+    return new SearchCompletions(await response.json());
+  }
+
+  /**
+   * Die bestbewerteten Begriffe, die mit prefix beginnen
+   *
+   * Längere Präfixe fehlen in der Tabelle, sobald ein kürzeres Präfix
+   * höchstens k Vervollständigungen hat; dessen Liste wird dann gefiltert.
+   */
+  complete(prefix: string, limit = this.k): string[] {
+    const query = prefix.toLowerCase();
+    for (let length = query.length; length > 0; length--) {
+      const numbers = this.prefixes.get(query.slice(0, length));
+      if (numbers) {
+        return numbers
+          .map(number => this.terms[number])
+          .filter(term => term.startsWith(query))
+          .slice(0, limit);
+      }
+    }
+    return [];
+  }
+}
+
 export default ArticleSearchIndex;
 